@@ -0,0 +1,91 @@
+"""
+마스킹 작업 내역 기록 벤치마크
+
+그날 이미 기록된 행 수별로, 파일 하나를 저장할 때(마스킹 20개) 작업 내역을 기록하는 시간을 비교합니다.
+    - 기존 방식: 일자별 엑셀 파일을 load_workbook으로 불러와 행을 추가하고 전체를 다시 저장
+    - 현재 방식: 일자별 CSV 끝에 행만 추가 (ExcelExportManager.append_masks)
+현재 방식에서 CSV로 엑셀 파일을 만드는 시간(ExcelExportManager.export_workbook, 쓰기 전용 모드)도 확인합니다.
+
+사용법:
+    python benchmarks/bench_audit_export.py [--rows 1000,10000,50000] [--masks M]
+"""
+
+import os
+import sys
+import csv
+import time
+import argparse
+import tempfile
+from datetime import datetime
+
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), "..", "src"))
+
+import fitz  # PyMuPDF
+from openpyxl import Workbook, load_workbook
+
+from pdfmask.core.models import MaskEntry
+from pdfmask.managers.excel_export_manager import ExcelExportManager, AUDIT_HEADER
+
+
+def make_row(i: int) -> list:
+    """작업 내역 한 행"""
+    return ["2025-12-16 10:00:00", f"문서_{i // 20:05d}.pdf", i % 30 + 1, "(40.00, 85.00, 320.00, 100.00)", "주민등록번호"]
+
+
+def legacy_append(excel_path: str, pdf_path: str, masks: list[MaskEntry]) -> None:
+    """기존 방식: 엑셀 파일 전체를 불러와 행을 추가한 뒤 다시 저장"""
+    wb = load_workbook(excel_path)
+    ws = wb.active
+    pdf_name = os.path.basename(pdf_path)
+    for mask in masks:
+        rect = mask.rect
+        coords = f"({rect.x0:.2f}, {rect.y0:.2f}, {rect.x1:.2f}, {rect.y1:.2f})"
+        ws.append([datetime.now().strftime("%Y-%m-%d %H:%M:%S"), pdf_name, mask.page_index + 1, coords, mask.note])
+    wb.save(excel_path)
+
+
+def timed(fn, *args) -> float:
+    """실행 시간 (ms)"""
+    begin = time.perf_counter()
+    fn(*args)
+    return (time.perf_counter() - begin) * 1000
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description="마스킹 작업 내역 기록 벤치마크")
+    parser.add_argument("--rows", default="1000,10000,50000", help="그날 이미 기록된 행 수 (쉼표로 구분)")
+    parser.add_argument("--masks", type=int, default=20, help="저장하는 파일의 마스킹 수")
+    args = parser.parse_args()
+
+    masks = [
+        MaskEntry(page_index=i % 5, rect=fitz.Rect(40, 85 + i * 20, 320, 100 + i * 20), note="주민등록번호")
+        for i in range(args.masks)
+    ]
+    print(f"파일 하나 저장 시 마스킹 {args.masks}개")
+    print(f"  {'기존 행 수':>10} | {'기존 (xlsx 다시 쓰기)':>20} | {'현재 (CSV 추가)':>16} | {'엑셀 만들기':>12}")
+
+    for count in [int(value) for value in args.rows.split(",")]:
+        with tempfile.TemporaryDirectory() as work_dir:
+            manager = ExcelExportManager(work_dir)
+
+            # 그날 이미 기록된 행 준비 (두 방식 같은 내용)
+            wb = Workbook(write_only=True)
+            ws = wb.create_sheet("마스킹 내역")
+            ws.append(AUDIT_HEADER)
+            for i in range(count):
+                ws.append(make_row(i))
+            legacy_path = os.path.join(work_dir, "legacy.xlsx")
+            wb.save(legacy_path)
+
+            manager.append_masks("준비.pdf", [])
+            with open(manager.get_audit_path(), 'a', encoding='utf-8', newline='') as f:
+                csv.writer(f).writerows(make_row(i) for i in range(count))
+
+            legacy_ms = timed(legacy_append, legacy_path, "문서.pdf", masks)
+            current_ms = min(timed(manager.append_masks, "문서.pdf", masks) for _ in range(5))
+            export_ms = timed(manager.export_workbook)
+            print(f"  {count:>10} | {legacy_ms:>17.1f} ms | {current_ms:>13.2f} ms | {export_ms:>9.0f} ms")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,91 @@
+"""
+자동 저장 저널 벤치마크
+
+마스킹을 연속으로 그리는 상황에서 기록 한 개당 화면 스레드가 기다리는 시간을 비교합니다.
+    - 동기 기록: 마스킹마다 저널 파일에 한 줄 쓰고 fsync
+    - 현재 방식: AutosaveJournal.record_add (기록을 모아 전용 스레드에서 쓰고 1초마다 fsync)
+종료 후 저널을 재생하여 기록이 모두 남았는지 확인합니다.
+
+사용법:
+    python benchmarks/bench_autosave_journal.py [--masks N]
+"""
+
+import os
+import sys
+import json
+import time
+import argparse
+import tempfile
+
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), "..", "src"))
+
+import fitz  # PyMuPDF
+from PyQt6.QtCore import QCoreApplication, QEventLoop, QTimer
+
+from pdfmask.core.models import MaskEntry
+from pdfmask.managers.autosave_journal import AutosaveJournal, replay_journal
+
+
+def make_masks(count: int) -> list[MaskEntry]:
+    """페이지 여러 곳에 흩어진 마스킹"""
+    return [
+        MaskEntry(page_index=i % 200, rect=fitz.Rect(40, 85 + i % 30 * 20, 320, 100 + i % 30 * 20))
+        for i in range(count)
+    ]
+
+
+def wait_events(ms: int) -> None:
+    """타이머가 동작하도록 이벤트 처리 (사용자가 다음 마스킹을 그리는 시간)"""
+    loop = QEventLoop()
+    QTimer.singleShot(ms, loop.quit)
+    loop.exec()
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description="자동 저장 저널 벤치마크")
+    parser.add_argument("--masks", type=int, default=300, help="그리는 마스킹 수")
+    args = parser.parse_args()
+
+    app = QCoreApplication(sys.argv)
+    masks = make_masks(args.masks)
+    print(f"마스킹 {args.masks}개")
+
+    with tempfile.TemporaryDirectory() as work_dir:
+        pdf_path = os.path.join(work_dir, "문서.pdf")
+        with open(pdf_path, 'wb') as f:
+            f.write(os.urandom(4096))
+
+        # 동기 기록
+        sync_path = os.path.join(work_dir, "sync.jsonl")
+        times = []
+        with open(sync_path, 'a', encoding='utf-8') as f:
+            for mask in masks:
+                begin = time.perf_counter()
+                f.write(json.dumps({"op": "add", "page": mask.page_index, "rect": list(mask.rect)}) + "\n")
+                f.flush()
+                os.fsync(f.fileno())
+                times.append((time.perf_counter() - begin) * 1000)
+        times.sort()
+        print(f"  동기 기록 (fsync): 평균 {sum(times) / len(times):7.3f} ms | 최대 {times[-1]:7.3f} ms")
+
+        # 현재 방식 (10개마다 이벤트 처리)
+        journal = AutosaveJournal(os.path.join(work_dir, "autosave"))
+        journal.open(pdf_path, [])
+        times = []
+        for i, mask in enumerate(masks):
+            begin = time.perf_counter()
+            journal.record_add(mask)
+            times.append((time.perf_counter() - begin) * 1000)
+            if i % 10 == 9:
+                wait_events(20)
+        journal.shutdown()
+        times.sort()
+        print(f"  현재 (저널):       평균 {sum(times) / len(times):7.3f} ms | 최대 {times[-1]:7.3f} ms")
+
+        recovered = replay_journal(journal.get_journal_path(pdf_path))
+        print(f"  재생한 마스킹: {len(recovered)}개, 모두 남음: {len(recovered) == len(masks)}")
+    app.quit()
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,138 @@
+"""
+페이지 묶음 단위 마스킹 메모리 벤치마크
+
+큰 문서에 모든 페이지 마스킹을 적용하여 저장할 때, 문서 전체를 한 번에 처리하는
+방식과 페이지 묶음 단위로 처리하는 방식의 처리 시간, 최대 메모리(RSS), 결과 크기를 비교합니다.
+각 방식은 별도 프로세스에서 실행하여 최대 메모리를 따로 측정합니다 (Linux, macOS).
+PDF를 지정하지 않으면 페이지마다 다른 150dpi JPEG 스캔 이미지가 있는 문서와
+텍스트만 있는 문서(결과 크기 차이가 잘 드러남)를 만들어 사용합니다.
+
+사용법:
+    python benchmarks/bench_chunked_redaction.py [PDF 파일] [--pages N] [--text-pages N]
+        [--chunks 8,16,64] [--profile fast|compact|web]
+"""
+
+import os
+import sys
+import json
+import time
+import random
+import argparse
+import resource
+import subprocess
+import tempfile
+
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), "..", "src"))
+
+import fitz  # PyMuPDF
+
+from pdfmask.managers.pdf_manager import DEFAULT_SAVE_PROFILE, SAVE_PROFILES, redact_file
+
+
+def make_scanned_archive(path: str, pages: int) -> None:
+    """페이지마다 다른 A4 150dpi JPEG 스캔 이미지 + 보이지 않는 텍스트 레이어 문서"""
+    rng = random.Random(0)
+    base = fitz.Pixmap(fitz.csRGB, fitz.IRect(0, 0, 1240, 1754), False)
+    base.clear_with(245)
+    for _ in range(200):
+        x, y = rng.randrange(1200), rng.randrange(1700)
+        base.set_rect(fitz.IRect(x, y, x + 40, y + 15), (rng.randrange(128),) * 3)
+
+    doc = fitz.open()
+    for i in range(pages):
+        # 페이지마다 이미지가 달라야 같은 이미지로 합쳐지지 않음
+        scan = fitz.Pixmap(base, 0)
+        scan.set_rect(fitz.IRect(10 + i % 1000, 10, 30 + i % 1000, 30), (0,) * scan.n)
+        page = doc.new_page()
+        page.insert_image(page.rect, stream=scan.tobytes("jpeg"))
+        page.insert_text((50, 100), f"Page {i + 1} Hong Gildong 010-1234-5678 " * 3, fontsize=10, render_mode=3)
+    doc.save(path, deflate=True)
+    doc.close()
+
+
+def make_text_archive(path: str, pages: int) -> None:
+    """페이지마다 본문 텍스트만 있는 문서"""
+    doc = fitz.open()
+    for i in range(pages):
+        page = doc.new_page()
+        page.insert_text((50, 100), f"Page {i + 1} Hong Gildong 010-1234-5678\n" * 50, fontsize=10)
+    doc.save(path, garbage=1, deflate=True)
+    doc.close()
+
+
+def run_child(path: str, output_path: str, chunk_pages: int, profile: str) -> None:
+    """작업자 프로세스: 마스킹 저장 후 결과를 JSON 한 줄로 출력"""
+    with fitz.open(path) as doc:
+        records = [(i, (40, 85, 320, 110)) for i in range(len(doc))]
+
+    begin = time.perf_counter()
+    ok, message = redact_file(path, records, output_path, profile=profile, chunk_pages=chunk_pages)
+    elapsed = time.perf_counter() - begin
+
+    peak = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+    peak_mb = peak / (1024 * 1024) if sys.platform == "darwin" else peak / 1024
+    print(json.dumps({
+        "ok": ok,
+        "message": message,
+        "elapsed": elapsed,
+        "peak_mb": peak_mb,
+        "size": os.path.getsize(output_path) if ok else 0,
+    }))
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("pdf", nargs="?", help="측정할 PDF (기본값: 예제 스캔 문서 생성)")
+    parser.add_argument("--pages", type=int, default=300, help="예제 스캔 문서 페이지 수")
+    parser.add_argument("--text-pages", type=int, default=1000, help="예제 텍스트 문서 페이지 수")
+    parser.add_argument("--chunks", default="8,16,64", help="비교할 묶음 크기 (쉼표로 구분)")
+    parser.add_argument(
+        "--profile", choices=list(SAVE_PROFILES), default=DEFAULT_SAVE_PROFILE, help="결과 파일 저장 프로필"
+    )
+    parser.add_argument("--child", nargs=4, metavar=("PDF", "OUTPUT", "CHUNK", "PROFILE"), help=argparse.SUPPRESS)
+    args = parser.parse_args()
+
+    if args.child:
+        run_child(args.child[0], args.child[1], int(args.child[2]), args.child[3])
+        return
+
+    with tempfile.TemporaryDirectory() as work_dir:
+        if args.pdf:
+            paths = [args.pdf]
+        else:
+            paths = [os.path.join(work_dir, "scanned.pdf"), os.path.join(work_dir, "text.pdf")]
+            print(f"예제 문서 생성 중 (스캔 {args.pages}페이지, 텍스트 {args.text_pages}페이지)...")
+            make_scanned_archive(paths[0], args.pages)
+            make_text_archive(paths[1], args.text_pages)
+
+        # 문서 전체를 한 번에 처리하려면 페이지 수보다 큰 묶음 크기를 지정
+        modes = [("전체 한 번에", sys.maxsize)]
+        modes += [(f"{size}페이지씩", size) for size in map(int, args.chunks.split(","))]
+        output_path = os.path.join(work_dir, "redacted.pdf")
+        for path in paths:
+            with fitz.open(path) as doc:
+                print(
+                    f"{os.path.basename(path)}: {len(doc)}페이지, {os.path.getsize(path) / 1e6:.1f} MB "
+                    f"(저장 프로필 {args.profile})"
+                )
+
+            for name, chunk_pages in modes:
+                completed = subprocess.run(
+                    [
+                        sys.executable, os.path.abspath(__file__), "--child",
+                        path, output_path, str(chunk_pages), args.profile
+                    ],
+                    capture_output=True, text=True, check=True
+                )
+                result = json.loads(completed.stdout.strip().splitlines()[-1])
+                if not result["ok"]:
+                    print(f"  {name:>10}: 실패 - {result['message']}")
+                    continue
+                print(
+                    f"  {name:>10}: {result['elapsed']:7.1f} 초 | 최대 메모리 {result['peak_mb']:7.0f} MB | "
+                    f"결과 {result['size'] / 1e6:7.2f} MB"
+                )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,87 @@
+"""
+Pixmap → Qt 이미지 변환 벤치마크
+
+기존 방식(pix.samples 복사 → QImage → QPixmap.fromImage)과
+image_bridge.PixmapImage(samples_mv를 복사 없이 사용)를 비교합니다.
+
+사용법:
+    python benchmarks/bench_image_bridge.py [PDF 경로] [반복 횟수]
+"""
+
+import os
+import sys
+import time
+from typing import Callable
+
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), "..", "src"))
+os.environ.setdefault("QT_QPA_PLATFORM", "offscreen")
+
+import fitz  # PyMuPDF
+from PyQt6.QtGui import QGuiApplication, QImage, QPainter, QPixmap
+
+from pdfmask.managers.image_bridge import PixmapImage
+
+
+def make_sample_document() -> fitz.Document:
+    """벤치마크용 한 페이지 문서 생성"""
+    doc = fitz.open()
+    page = doc.new_page()
+    for i in range(40):
+        page.insert_text((50, 60 + i * 18), f"Line {i} - 홍길동 010-1234-5678", fontname="helv")
+    return doc
+
+
+def measure(func: Callable[[], object], repeat: int) -> float:
+    """평균 실행 시간 (ms)"""
+    start = time.perf_counter()
+    for _ in range(repeat):
+        func()
+    return (time.perf_counter() - start) / repeat * 1000
+
+
+def main() -> None:
+    app = QGuiApplication(sys.argv)
+
+    doc = fitz.open(sys.argv[1]) if len(sys.argv) > 1 else make_sample_document()
+    repeat = int(sys.argv[2]) if len(sys.argv) > 2 else 50
+    zoom = 1.5
+
+    pix = doc[0].get_pixmap(matrix=fitz.Matrix(zoom, zoom))
+    print(f"페이지 크기: {pix.width} x {pix.height} (zoom {zoom}), 반복 {repeat}회")
+
+    def legacy_convert() -> QPixmap:
+        img = QImage(pix.samples, pix.width, pix.height, pix.stride, QImage.Format.Format_RGB888)
+        return QPixmap.fromImage(img)
+
+    def bridge_convert() -> QImage:
+        return PixmapImage(pix)
+
+    legacy_pixmap = legacy_convert()
+    bridge_image = bridge_convert()
+    target = QImage(pix.width, pix.height, QImage.Format.Format_ARGB32_Premultiplied)
+
+    def legacy_paint() -> None:
+        painter = QPainter(target)
+        painter.drawPixmap(0, 0, legacy_pixmap)
+        painter.end()
+
+    def bridge_paint() -> None:
+        painter = QPainter(target)
+        painter.drawImage(0, 0, bridge_image)
+        painter.end()
+
+    render_ms = measure(lambda: doc[0].get_pixmap(matrix=fitz.Matrix(zoom, zoom)), repeat)
+    legacy_bytes = legacy_pixmap.width() * legacy_pixmap.height() * legacy_pixmap.depth() // 8
+
+    print(f"{'':24}{'변환(ms)':>10}{'그리기(ms)':>12}{'보관 메모리(KB)':>16}{'전체 복사':>10}")
+    print(f"{'기존 (QPixmap)':24}{measure(legacy_convert, repeat):>10.3f}"
+          f"{measure(legacy_paint, repeat):>12.3f}{legacy_bytes // 1024:>16}{2:>10}")
+    print(f"{'브리지 (PixmapImage)':24}{measure(bridge_convert, repeat):>10.3f}"
+          f"{measure(bridge_paint, repeat):>12.3f}{bridge_image.sizeInBytes() // 1024:>16}{0:>10}")
+    print(f"참고: MuPDF 렌더링 자체 {render_ms:.3f} ms")
+
+    del app
+
+
+if __name__ == "__main__":
+    main()
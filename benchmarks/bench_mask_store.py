@@ -0,0 +1,153 @@
+"""
+마스킹 데이터 저장소 벤치마크
+
+하루 동안 파일 수백 개를 저장하는 상황을 재현하여, 기존 방식(저장할 때마다 일자별 JSON 파일
+전체를 읽고 파일 목록을 훑은 뒤 indent=2로 다시 쓰기)과 현재 방식(SQLite에 파일 하나의 행만 기록)의
+처음/마지막 저장 시간과 파일 열기(load_masks) 시간을 비교합니다.
+기존 방식으로 만든 JSON 파일을 현재 방식으로 이전하는 시간과 결과,
+큰 파일의 문서 지문 계산 시간도 확인합니다.
+
+사용법:
+    python benchmarks/bench_mask_store.py [--files N] [--masks M]
+"""
+
+import os
+import sys
+import json
+import time
+import argparse
+import tempfile
+from datetime import datetime
+
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), "..", "src"))
+
+import fitz  # PyMuPDF
+
+from pdfmask.core.models import MaskEntry
+from pdfmask.managers.mask_data_manager import MaskDataManager, compute_fingerprint
+
+
+def make_masks(count: int) -> list[MaskEntry]:
+    """페이지 여러 곳에 흩어진 마스킹"""
+    return [
+        MaskEntry(page_index=i % 5, rect=fitz.Rect(40, 85 + i * 20, 320, 100 + i * 20), note=f"메모 {i}")
+        for i in range(count)
+    ]
+
+
+def legacy_save(mask_file: str, pdf_filename: str, masks: list[MaskEntry]) -> None:
+    """기존 방식: 일자별 JSON 전체를 읽고, 파일 목록을 훑어 교체/추가한 뒤 전체를 다시 쓰기"""
+    if os.path.exists(mask_file):
+        with open(mask_file, 'r', encoding='utf-8') as f:
+            data = json.load(f)
+    else:
+        data = {'date': datetime.now().strftime("%Y-%m-%d"), 'files': []}
+
+    file_data = {
+        'pdf_file': pdf_filename,
+        'saved_at': datetime.now().isoformat(),
+        'mask_count': len(masks),
+        'masks': [
+            {
+                'page_index': mask.page_index,
+                'rect': {'x0': mask.rect.x0, 'y0': mask.rect.y0, 'x1': mask.rect.x1, 'y1': mask.rect.y1},
+                'note': mask.note,
+            }
+            for mask in masks
+        ],
+    }
+    for i, file_entry in enumerate(data['files']):
+        if file_entry['pdf_file'] == pdf_filename:
+            data['files'][i] = file_data
+            break
+    else:
+        data['files'].append(file_data)
+
+    with open(mask_file, 'w', encoding='utf-8') as f:
+        json.dump(data, f, indent=2, ensure_ascii=False)
+
+
+def legacy_load(mask_file: str, pdf_filename: str) -> list:
+    """기존 방식: 일자별 JSON 전체를 읽고 파일 목록에서 찾기"""
+    with open(mask_file, 'r', encoding='utf-8') as f:
+        data = json.load(f)
+    for file_entry in data.get('files', []):
+        if file_entry['pdf_file'] == pdf_filename:
+            return file_entry['masks']
+    return []
+
+
+def timed(fn, *args) -> float:
+    """실행 시간 (ms)"""
+    begin = time.perf_counter()
+    fn(*args)
+    return (time.perf_counter() - begin) * 1000
+
+
+def report(name: str, save_times: list[float], load_times: list[float]) -> None:
+    """처음/마지막 50개 평균 출력"""
+    head = sum(save_times[:50]) / len(save_times[:50])
+    tail = sum(save_times[-50:]) / len(save_times[-50:])
+    load = sum(load_times) / len(load_times)
+    print(
+        f"  {name}: 저장 처음 50개 {head:6.2f} ms | 마지막 50개 {tail:6.2f} ms | "
+        f"합계 {sum(save_times) / 1000:6.2f} 초 | 로드 {load:6.2f} ms"
+    )
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description="마스킹 데이터 저장소 벤치마크")
+    parser.add_argument("--files", type=int, default=500, help="하루에 저장하는 파일 수")
+    parser.add_argument("--masks", type=int, default=20, help="파일당 마스킹 수")
+    args = parser.parse_args()
+
+    masks = make_masks(args.masks)
+    print(f"파일 {args.files}개, 파일당 마스킹 {args.masks}개")
+
+    with tempfile.TemporaryDirectory() as work_dir:
+        # 문서 지문을 계산할 수 있도록 내용이 서로 다른 파일 생성
+        files_dir = os.path.join(work_dir, "files")
+        os.makedirs(files_dir)
+        names = []
+        for i in range(args.files):
+            path = os.path.join(files_dir, f"문서_{i:04d}.pdf")
+            with open(path, 'wb') as f:
+                f.write(os.urandom(4096))
+            names.append(path)
+
+        # 기존 방식
+        legacy_dir = os.path.join(work_dir, "legacy")
+        os.makedirs(legacy_dir)
+        mask_file = os.path.join(legacy_dir, f"mask_data_{datetime.now().strftime('%Y%m%d')}.json")
+        save_times = [timed(legacy_save, mask_file, os.path.basename(name), masks) for name in names]
+        load_times = [timed(legacy_load, mask_file, os.path.basename(name)) for name in names[-50:]]
+        report("기존 (JSON)", save_times, load_times)
+
+        # 현재 방식
+        manager = MaskDataManager(os.path.join(work_dir, "current"))
+        save_times = [timed(manager.save_masks, name, masks) for name in names]
+        load_times = [timed(manager.load_masks, name) for name in names[-50:]]
+        report("현재 (SQLite)", save_times, load_times)
+
+        # 기존 JSON 파일 이전
+        begin = time.perf_counter()
+        migrated = MaskDataManager(legacy_dir)
+        migrate_ms = (time.perf_counter() - begin) * 1000
+        _, loaded, _ = migrated.load_all_masks()
+        same = all(
+            [(m.page_index, tuple(m.rect), m.note) for m in loaded[os.path.basename(name)]]
+            == [(m.page_index, tuple(m.rect), m.note) for m in masks]
+            for name in names
+        )
+        print(f"  JSON 이전: {migrate_ms:.0f} ms, 파일 {len(loaded)}개, 내용 동일: {same}")
+
+        # 큰 파일의 문서 지문 (앞/뒤 1MB만 읽음)
+        big_path = os.path.join(work_dir, "big.pdf")
+        with open(big_path, 'wb') as f:
+            for _ in range(200):
+                f.write(os.urandom(1024 * 1024))
+        print(f"  문서 지문 (200 MB 파일): {timed(compute_fingerprint, big_path):.2f} ms")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,140 @@
+"""
+PdfPageView 드래그 중 다시 그리기 벤치마크
+
+기존 방식(마우스 이동마다 위젯 전체를 다시 그리고 마스킹을 하나씩 그림)과
+현재 PdfPageView(이전/새 드래그 사각형 영역만 다시 그리고, 마스킹은
+미리 그려 둔 오버레이 사용)의 프레임 시간을 비교합니다.
+
+사용법:
+    python benchmarks/bench_page_view_paint.py [마스킹 수] [드래그 단계 수]
+"""
+
+import os
+import sys
+import time
+import random
+
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), "..", "src"))
+os.environ.setdefault("QT_QPA_PLATFORM", "offscreen")
+
+import fitz  # PyMuPDF
+from PyQt6.QtWidgets import QApplication
+from PyQt6.QtCore import Qt, QPoint, QPointF, QRect, QSize
+from PyQt6.QtGui import QBrush, QColor, QImage, QMouseEvent, QPainter, QPen, QRegion
+
+from pdfmask.core.models import MaskEntry
+from pdfmask.core.mask_store import MaskStore
+from pdfmask.ui.pdf_view import PdfPageView
+
+
+class RecordingPageView(PdfPageView):
+    """update()로 요청된 다시 그리기 영역을 기록하는 PdfPageView"""
+
+    def update(self, *args) -> None:
+        self.dirty = QRect(args[0]) if args else self.rect()
+
+
+class LegacyPageView(RecordingPageView):
+    """기존 방식: 전체 다시 그리기 + 마스킹을 매번 하나씩 그림"""
+
+    def mouseMoveEvent(self, event) -> None:
+        if self._ctrl_pressed_during_drag and self._start_pos is not None:
+            self._current_rect = QRect(self._start_pos, event.pos()).normalized()
+            self.update()
+
+    def paintEvent(self, event) -> None:
+        painter = QPainter(self)
+        painter.drawImage(0, 0, self._image)
+
+        painter.setBrush(QBrush(QColor(255, 0, 0, 60)))
+        painter.setPen(QPen(QColor(255, 0, 0), 2))
+        for rect in self._saved_masks:
+            painter.drawRect(rect)
+
+        if self._current_rect is not None:
+            painter.setBrush(QBrush(QColor(0, 120, 255, 80)))
+            painter.setPen(QPen(QColor(0, 120, 255), 2))
+            painter.drawRect(self._current_rect)
+        painter.end()
+
+
+def mouse_event(event_type: QMouseEvent.Type, pos: QPoint) -> QMouseEvent:
+    """Ctrl + 좌클릭 마우스 이벤트 생성"""
+    return QMouseEvent(
+        event_type,
+        QPointF(pos),
+        QPointF(pos),
+        Qt.MouseButton.LeftButton,
+        Qt.MouseButton.LeftButton,
+        Qt.KeyboardModifier.ControlModifier,
+    )
+
+
+def run_drag(view: RecordingPageView, target: QImage, steps: int) -> float:
+    """
+    드래그를 흉내 내며 요청된 영역만 다시 그리기
+
+    Returns:
+        float: 평균 프레임 시간 (ms)
+    """
+    start = QPoint(300, 300)
+    view.mousePressEvent(mouse_event(QMouseEvent.Type.MouseButtonPress, start))
+
+    elapsed = 0.0
+    for i in range(1, steps + 1):
+        pos = start + QPoint(i * 3, i * 2)
+        view.mouseMoveEvent(mouse_event(QMouseEvent.Type.MouseMove, pos))
+
+        begin = time.perf_counter()
+        view.render(target, QPoint(), QRegion(view.dirty))
+        elapsed += time.perf_counter() - begin
+
+    # 마스킹을 만들지 않고 드래그 상태만 정리
+    view._start_pos = None
+    view._current_rect = None
+    view._ctrl_pressed_during_drag = False
+    return elapsed / steps * 1000
+
+
+def main() -> None:
+    app = QApplication(sys.argv)
+
+    mask_count = int(sys.argv[1]) if len(sys.argv) > 1 else 500
+    steps = int(sys.argv[2]) if len(sys.argv) > 2 else 200
+
+    # 200% 배율 A4 페이지 크기
+    page_width, page_height = 595.0, 842.0
+    size = QSize(int(page_width * 3), int(page_height * 3))
+    image = QImage(size, QImage.Format.Format_RGB888)
+    image.fill(QColor(255, 255, 255))
+
+    rng = random.Random(0)
+    masks = MaskStore()
+    for _ in range(mask_count):
+        x, y = rng.uniform(0, page_width - 60), rng.uniform(0, page_height - 20)
+        masks.append(MaskEntry(page_index=0, rect=fitz.Rect(x, y, x + 60, y + 14), note=""))
+
+    print(f"페이지 크기: {size.width()} x {size.height()}, 마스킹 {mask_count}개, 드래그 {steps}단계")
+
+    results = {}
+    for name, view_class in (("기존 (전체 + 마스킹 개별)", LegacyPageView), ("현재 (변경 영역 + 오버레이)", RecordingPageView)):
+        view = view_class()
+        view.set_page(0, image, page_width, page_height, masks)
+        target = QImage(size, QImage.Format.Format_ARGB32_Premultiplied)
+
+        # 첫 그리기 (오버레이 생성 포함)
+        begin = time.perf_counter()
+        view.render(target)
+        first = (time.perf_counter() - begin) * 1000
+
+        results[name] = run_drag(view, target, steps)
+        print(f"{name:<24} 첫 그리기 {first:8.2f} ms | 드래그 프레임 평균 {results[name]:7.3f} ms")
+
+    legacy, current = results.values()
+    print(f"드래그 프레임 {legacy / current:.1f}배 빠름")
+
+    app.quit()
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,102 @@
+"""
+작업 진행상황 기록 벤치마크
+
+파일 수가 많은 폴더에서 파일을 하나씩 완료하는 상황을 재현하여, 기존 방식(완료할 때마다
+전체 파일 목록과 완료 목록을 progress.json에 다시 쓰기)과 현재 방식(완료한 파일 한 줄만 추가하고
+PROGRESS_COMPACT_RECORDS개마다 정리)의 완료 기록 시간을 비교합니다.
+폴더를 다시 열 때의 진행상황 로드 시간과 파일 목록의 완료 표시 검사 시간(list / set)도 확인합니다.
+
+사용법:
+    python benchmarks/bench_progress.py [--files N] [--completed M]
+"""
+
+import os
+import sys
+import json
+import time
+import argparse
+import tempfile
+from datetime import datetime
+
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), "..", "src"))
+
+from pdfmask.managers.progress_manager import ProgressManager
+
+
+def legacy_save(progress_file: str, folder_path: str, pdf_files: list, completed_files: list, index: int) -> None:
+    """기존 방식: 완료할 때마다 전체 목록을 indent=2로 다시 쓰기"""
+    data = {
+        'folder_path': folder_path,
+        'last_updated': datetime.now().isoformat(),
+        'total_files': len(pdf_files),
+        'completed_count': len(completed_files),
+        'current_index': index,
+        'pdf_files': [os.path.basename(f) for f in pdf_files],
+        'completed_files': completed_files,
+    }
+    with open(progress_file, 'w', encoding='utf-8') as f:
+        json.dump(data, f, indent=2, ensure_ascii=False)
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description="작업 진행상황 기록 벤치마크")
+    parser.add_argument("--files", type=int, default=50000, help="폴더의 PDF 파일 수")
+    parser.add_argument("--completed", type=int, default=500, help="기록할 완료 파일 수 (폴더 끝부분)")
+    args = parser.parse_args()
+
+    with tempfile.TemporaryDirectory() as work_dir:
+        folder_path = os.path.join(work_dir, "스캔")
+        pdf_files = [os.path.join(folder_path, f"문서_{i:06d}.pdf") for i in range(args.files)]
+        names = [os.path.basename(path) for path in pdf_files]
+        # 앞부분은 이미 완료된 상태에서 마지막 M개를 완료
+        done_before = names[:args.files - args.completed]
+        targets = names[args.files - args.completed:]
+        print(f"파일 {args.files}개, 이미 완료 {len(done_before)}개, 이번에 완료 {len(targets)}개")
+
+        # 기존 방식
+        progress_file = os.path.join(work_dir, "progress.json")
+        completed = list(done_before)
+        begin = time.perf_counter()
+        for i, name in enumerate(targets):
+            completed.append(name)
+            legacy_save(progress_file, folder_path, pdf_files, completed, len(done_before) + i)
+        legacy_ms = (time.perf_counter() - begin) * 1000 / len(targets)
+        size = os.path.getsize(progress_file) / 1024 / 1024
+        begin = time.perf_counter()
+        with open(progress_file, 'r', encoding='utf-8') as f:
+            data = json.load(f)
+        load_ms = (time.perf_counter() - begin) * 1000
+        # list 검사는 파일 수의 제곱에 비례하므로 고르게 1000개만 검사하여 전체 시간 추정
+        sample = names[::max(1, len(names) // 1000)]
+        begin = time.perf_counter()
+        sum(1 for name in sample if name in data['completed_files'])
+        check_ms = (time.perf_counter() - begin) * 1000 * len(names) / len(sample)
+        print(
+            f"  기존 (JSON):  완료 1개 {legacy_ms:8.3f} ms (파일 {size:.1f} MB) | "
+            f"로드 {load_ms:7.1f} ms | 완료 표시 검사 {check_ms:9.1f} ms (추정)"
+        )
+
+        # 현재 방식
+        manager = ProgressManager(os.path.join(work_dir, "progress"))
+        for i, name in enumerate(done_before):
+            manager.mark_completed(folder_path, name, i, args.files)
+        manager.compact_progress(folder_path)
+        begin = time.perf_counter()
+        for i, name in enumerate(targets):
+            manager.mark_completed(folder_path, name, len(done_before) + i, args.files)
+        current_ms = (time.perf_counter() - begin) * 1000 / len(targets)
+        size = os.path.getsize(manager.get_progress_path(folder_path)) / 1024 / 1024
+        begin = time.perf_counter()
+        _, data, _ = manager.load_progress(folder_path)
+        load_ms = (time.perf_counter() - begin) * 1000
+        begin = time.perf_counter()
+        marked = sum(1 for name in names if name in data['completed_files'])
+        check_ms = (time.perf_counter() - begin) * 1000
+        print(
+            f"  현재 (JSONL): 완료 1개 {current_ms:8.3f} ms (파일 {size:.1f} MB) | "
+            f"로드 {load_ms:7.1f} ms | 완료 표시 검사 {check_ms:9.1f} ms ({marked}개)"
+        )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,188 @@
+"""
+Redaction 적용 및 저장 벤치마크
+
+기존 방식(모든 페이지에 기본 옵션으로 apply_redactions, 압축 없이 저장)과
+현재 방식(마스킹이 이미지와 겹치는 페이지만 픽셀 처리, 픽셀을 지운 이미지만 압축)의
+Redaction 시간, 저장 시간, 결과 크기를 비교하고 두 결과의 렌더링이 같은지,
+마스킹 영역의 글자가 결과 파일의 스트림(참조가 끊긴 원본 내용 스트림 포함)에 남지 않았는지 확인합니다.
+PDF를 지정하지 않으면 스캔 문서(전체 페이지 JPEG + 텍스트 레이어)와
+로고 이미지가 있는 텍스트 문서를 만들어 사용합니다.
+
+사용법:
+    python benchmarks/bench_redaction.py [PDF 파일 ...]
+"""
+
+import os
+import sys
+import time
+import random
+import tempfile
+
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), "..", "src"))
+
+import fitz  # PyMuPDF
+
+from pdfmask.core.models import MaskEntry
+from pdfmask.managers.pdf_manager import (
+    DEFAULT_SAVE_PROFILE,
+    SAVE_PROFILES,
+    apply_masks_to_document,
+    get_save_options,
+)
+
+
+def make_scanned_pdf(path: str, pages: int = 5) -> None:
+    """A4 300dpi JPEG 스캔 이미지 + 보이지 않는 텍스트 레이어 문서"""
+    rng = random.Random(0)
+    pixmap = fitz.Pixmap(fitz.csRGB, fitz.IRect(0, 0, 2480, 3508), False)
+    pixmap.clear_with(245)
+    for _ in range(400):
+        x, y = rng.randrange(2400), rng.randrange(3450)
+        pixmap.set_rect(fitz.IRect(x, y, x + 80, y + 30), (rng.randrange(128),) * 3)
+    scan = pixmap.tobytes("jpeg")
+
+    doc = fitz.open()
+    for _ in range(pages):
+        page = doc.new_page()
+        page.insert_image(page.rect, stream=scan)
+        page.insert_text((50, 100), "Hong Gildong 010-1234-5678 " * 4, fontsize=10, render_mode=3)
+    doc.save(path, deflate=True)
+    doc.close()
+
+
+def make_text_pdf(path: str, pages: int = 20) -> None:
+    """본문 텍스트 + 아래쪽 로고 이미지 문서"""
+    logo = fitz.Pixmap(fitz.csRGB, fitz.IRect(0, 0, 400, 200), False)
+    logo.clear_with(90)
+    logo_bytes = logo.tobytes("png")
+
+    doc = fitz.open()
+    for i in range(pages):
+        page = doc.new_page()
+        # 마스킹되는 첫 줄에만 페이지마다 다른 번호를 넣어 결과 파일에 남았는지 찾을 수 있게 함
+        page.insert_text((50, 100), f"Page {i + 1} Hong Gildong 010-{i + 1:04d}-5678", fontsize=10)
+        page.insert_text((50, 114), f"Page {i + 1} Hong Gildong 010-1234-5678\n" * 39, fontsize=10)
+        page.insert_image(fitz.Rect(400, 740, 560, 820), stream=logo_bytes)
+    doc.save(path, deflate=True)
+    doc.close()
+
+
+def page_masks(doc: fitz.Document) -> list[MaskEntry]:
+    """각 페이지 본문 위쪽 마스킹"""
+    return [MaskEntry(page_index=i, rect=fitz.Rect(40, 85, 320, 110)) for i in range(len(doc))]
+
+
+def legacy_redact(doc: fitz.Document, masks: list[MaskEntry]) -> None:
+    """기존 방식: 마스킹이 있는 모든 페이지에 기본 옵션으로 Redaction"""
+    for mask in masks:
+        page = doc.load_page(mask.page_index)
+        page.add_redact_annot(mask.rect, fill=(1, 1, 1))
+        page.apply_redactions()
+
+
+def run(path: str, output_path: str, legacy: bool) -> tuple[float, float, int]:
+    """Redaction 시간(ms), 저장 시간(ms), 결과 크기(byte)"""
+    doc = fitz.open(path)
+    masks = page_masks(doc)
+
+    begin = time.perf_counter()
+    if legacy:
+        legacy_redact(doc, masks)
+        options = SAVE_PROFILES[DEFAULT_SAVE_PROFILE]
+    else:
+        applied_pages, image_pages = apply_masks_to_document(doc, masks)
+        options = get_save_options(DEFAULT_SAVE_PROFILE, applied_pages > 0, image_pages > 0)
+    redact_time = time.perf_counter() - begin
+
+    begin = time.perf_counter()
+    doc.save(output_path, **options)
+    save_time = time.perf_counter() - begin
+    doc.close()
+    return redact_time * 1000, save_time * 1000, os.path.getsize(output_path)
+
+
+def redacted_words(path: str, masks: list[MaskEntry]) -> set[str]:
+    """원본에서 마스킹 영역 안에만 있는 단어 (마스킹 밖에도 있는 단어는 제외)"""
+    inside: set[str] = set()
+    outside: set[str] = set()
+    with fitz.open(path) as doc:
+        for page in doc:
+            rects = [mask.rect for mask in masks if mask.page_index == page.number]
+            for word in page.get_text("words"):
+                word_rect = fitz.Rect(word[:4])
+                if any(rect.contains(word_rect) for rect in rects):
+                    inside.add(word[4])
+                else:
+                    outside.add(word[4])
+    return {word for word in inside - outside if len(word) >= 4}
+
+
+def leaked_streams(path: str, words: set[str]) -> list[int]:
+    """
+    지운 단어가 남아 있는 스트림의 xref 목록
+
+    페이지가 가리키지 않는 스트림까지 모든 xref를 훑으며,
+    글자 그대로 또는 16진 문자열(<...>)로 기록된 경우를 찾습니다.
+    """
+    patterns = set()
+    for word in words:
+        try:
+            encoded = word.encode("latin-1")
+        except UnicodeEncodeError:
+            continue
+        patterns.update((encoded, encoded.hex().encode(), encoded.hex().upper().encode()))
+
+    found = []
+    with fitz.open(path) as doc:
+        for xref in range(1, doc.xref_length()):
+            if not doc.xref_is_stream(xref):
+                continue
+            stream = doc.xref_stream(xref) or b""
+            if any(pattern in stream for pattern in patterns):
+                found.append(xref)
+    return found
+
+
+def same_rendering(path_a: str, path_b: str) -> bool:
+    """두 PDF의 모든 페이지 렌더링 결과가 같은지 확인"""
+    with fitz.open(path_a) as doc_a, fitz.open(path_b) as doc_b:
+        return all(
+            page_a.get_pixmap(dpi=72).samples == page_b.get_pixmap(dpi=72).samples
+            for page_a, page_b in zip(doc_a, doc_b)
+        )
+
+
+def main() -> None:
+    with tempfile.TemporaryDirectory() as work_dir:
+        if len(sys.argv) > 1:
+            paths = sys.argv[1:]
+        else:
+            paths = [os.path.join(work_dir, "scanned.pdf"), os.path.join(work_dir, "text_logo.pdf")]
+            make_scanned_pdf(paths[0])
+            make_text_pdf(paths[1])
+
+        for path in paths:
+            legacy_path = os.path.join(work_dir, "legacy.pdf")
+            current_path = os.path.join(work_dir, "current.pdf")
+            legacy = run(path, legacy_path, legacy=True)
+            current = run(path, current_path, legacy=False)
+
+            print(os.path.basename(path))
+            for name, (redact_ms, save_ms, size) in (("기존", legacy), ("현재", current)):
+                print(
+                    f"  {name}: Redaction {redact_ms:8.1f} ms | 저장 {save_ms:8.1f} ms | "
+                    f"합계 {redact_ms + save_ms:8.1f} ms | 결과 {size / 1024:10.0f} KB"
+                )
+            print(f"  렌더링 결과 동일: {same_rendering(legacy_path, current_path)}")
+
+            # 지운 글자가 참조가 끊긴 원본 내용 스트림 등에 남지 않았는지 확인
+            with fitz.open(path) as doc:
+                words = redacted_words(path, page_masks(doc))
+            for name, output_path in (("기존", legacy_path), ("현재", current_path)):
+                leaked = leaked_streams(output_path, words)
+                status = f"남음 (스트림 {len(leaked)}개)" if leaked else "없음"
+                print(f"  {name}: 지운 글자({len(words)}개 단어) {status}")
+
+
+if __name__ == "__main__":
+    main()
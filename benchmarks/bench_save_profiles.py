@@ -0,0 +1,116 @@
+"""
+결과 파일 저장 프로필 벤치마크
+
+PDF 파일마다 각 페이지 위쪽에 마스킹을 적용한 뒤 저장 프로필별로 저장하여,
+프로필별 저장 시간과 결과 파일 크기를 비교합니다.
+PDF를 지정하지 않으면 텍스트, 벡터, 이미지 페이지가 섞인 예제 문서를 만들어 사용합니다.
+
+사용법:
+    python benchmarks/bench_save_profiles.py [PDF 파일 또는 폴더 ...] [--repeat N]
+"""
+
+import os
+import sys
+import time
+import argparse
+import tempfile
+
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), "..", "src"))
+
+import fitz  # PyMuPDF
+
+from pdfmask.core.models import MaskEntry
+from pdfmask.managers.pdf_manager import SAVE_PROFILES, apply_masks_to_document, get_save_options
+
+
+def make_sample_corpus(folder: str, count: int = 3, pages: int = 30) -> list[str]:
+    """텍스트, 벡터 도형, 이미지가 섞인 예제 PDF 생성"""
+    # 페이지에 넣을 이미지 (무늬가 있는 256 x 256 RGB)
+    pixmap = fitz.Pixmap(fitz.csRGB, fitz.IRect(0, 0, 256, 256), False)
+    for y in range(0, 256, 8):
+        for x in range(0, 256, 8):
+            pixmap.set_rect(fitz.IRect(x, y, x + 8, y + 8), ((x * 7) % 256, (y * 5) % 256, (x + y) % 256))
+    image_bytes = pixmap.tobytes("png")
+
+    paths = []
+    for doc_index in range(count):
+        doc = fitz.open()
+        for page_index in range(pages):
+            page = doc.new_page()
+            text = f"문서 {doc_index + 1} / 페이지 {page_index + 1} 개인정보 홍길동 010-1234-5678\n" * 30
+            page.insert_text((40, 60), text, fontsize=9)
+            for i in range(40):
+                page.draw_rect(fitz.Rect(40 + i * 12, 500, 48 + i * 12, 560), color=(0, 0, 1), fill=(0.8, 0.9, 1))
+            page.insert_image(fitz.Rect(300, 600, 556, 800), stream=image_bytes)
+        path = os.path.join(folder, f"sample_{doc_index + 1}.pdf")
+        doc.save(path)
+        doc.close()
+        paths.append(path)
+    return paths
+
+
+def collect_pdfs(targets: list[str]) -> list[str]:
+    """인자로 받은 파일과 폴더에서 PDF 목록 수집"""
+    paths = []
+    for target in targets:
+        if os.path.isdir(target):
+            paths.extend(
+                os.path.join(target, name) for name in sorted(os.listdir(target))
+                if name.lower().endswith(".pdf")
+            )
+        else:
+            paths.append(target)
+    return paths
+
+
+def redacted_document(path: str) -> tuple[fitz.Document, int, int]:
+    """각 페이지 위쪽에 마스킹을 적용한 문서와 (마스킹 적용 페이지 수, 이미지 픽셀을 지운 페이지 수)"""
+    doc = fitz.open(path)
+    masks = [
+        MaskEntry(page_index=i, rect=fitz.Rect(30, 30, page.rect.width - 30, 120))
+        for i, page in enumerate(doc)
+    ]
+    applied_pages, image_pages = apply_masks_to_document(doc, masks)
+    return doc, applied_pages, image_pages
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description="저장 프로필별 저장 시간 / 파일 크기 비교")
+    parser.add_argument("targets", nargs="*", help="PDF 파일 또는 폴더 (없으면 예제 문서 생성)")
+    parser.add_argument("--repeat", type=int, default=3, help="프로필별 반복 횟수 (최소 시간 사용)")
+    args = parser.parse_args()
+
+    with tempfile.TemporaryDirectory() as work_dir:
+        paths = collect_pdfs(args.targets) if args.targets else make_sample_corpus(work_dir)
+        source_bytes = sum(os.path.getsize(path) for path in paths)
+        print(f"PDF {len(paths)}개, 원본 {source_bytes / 1024:.0f} KB")
+
+        results = {}
+        for profile in SAVE_PROFILES:
+            total_time = 0.0
+            total_bytes = 0
+            for path in paths:
+                output_path = os.path.join(work_dir, f"out_{profile}.pdf")
+                best = float("inf")
+                for _ in range(args.repeat):
+                    doc, applied_pages, image_pages = redacted_document(path)
+                    options = get_save_options(profile, applied_pages > 0, image_pages > 0)
+                    begin = time.perf_counter()
+                    doc.save(output_path, **options)
+                    best = min(best, time.perf_counter() - begin)
+                    doc.close()
+                total_time += best
+                total_bytes += os.path.getsize(output_path)
+            results[profile] = (total_time, total_bytes)
+
+        fast_time, fast_bytes = results.get("fast", next(iter(results.values())))
+        print(f"{'프로필':<10}{'저장 시간':>12}{'결과 크기':>14}{'시간 비율':>10}{'크기 비율':>10}")
+        for profile, (total_time, total_bytes) in results.items():
+            print(
+                f"{profile:<10}{total_time * 1000:>10.1f} ms{total_bytes / 1024:>11.0f} KB"
+                f"{total_time / fast_time:>9.2f}x{total_bytes / fast_bytes:>9.2f}x"
+            )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,88 @@
+"""
+마스킹 결과 검증 벤치마크
+
+PDF 파일마다 각 페이지에 마스킹 두 개(본문 위쪽, 페이지 아래쪽)를 적용하여 저장한 뒤,
+Redaction + 저장 시간과 결과 검증 시간을 비교합니다. 마스킹하지 않은 원본도
+같은 영역으로 검증하여 남은 글자를 찾아내는지, 사용하지 않는 객체를 제거하지 않고 저장한
+파일(참조가 끊긴 원본 내용 스트림이 남음)을 찾아내는지 확인합니다.
+PDF를 지정하지 않으면 스캔 문서, 로고 이미지가 있는 텍스트 문서,
+텍스트/벡터/이미지가 섞인 예제 문서를 만들어 사용합니다.
+
+사용법:
+    python benchmarks/bench_verification.py [PDF 파일 ...]
+"""
+
+import os
+import sys
+import time
+import tempfile
+
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), "..", "src"))
+
+import fitz  # PyMuPDF
+
+from pdfmask.core.models import MaskEntry
+from pdfmask.managers.pdf_manager import (
+    DEFAULT_SAVE_PROFILE,
+    REDACTION_FILL,
+    apply_masks_to_document,
+    get_save_options,
+)
+from pdfmask.managers.verification import verify_file
+
+from bench_redaction import make_scanned_pdf, make_text_pdf
+from bench_save_profiles import make_sample_corpus
+
+
+def page_masks(doc: fitz.Document) -> list[MaskEntry]:
+    """각 페이지 본문 위쪽과 아래쪽 마스킹"""
+    masks = []
+    for i in range(len(doc)):
+        masks.append(MaskEntry(page_index=i, rect=fitz.Rect(40, 85, 320, 110)))
+        masks.append(MaskEntry(page_index=i, rect=fitz.Rect(300, 600, 400, 700)))
+    return masks
+
+
+def main() -> None:
+    with tempfile.TemporaryDirectory() as work_dir:
+        if len(sys.argv) > 1:
+            paths = sys.argv[1:]
+        else:
+            paths = [os.path.join(work_dir, "scanned.pdf"), os.path.join(work_dir, "text_logo.pdf")]
+            make_scanned_pdf(paths[0])
+            make_text_pdf(paths[1])
+            paths += make_sample_corpus(work_dir, count=1)
+
+        output_path = os.path.join(work_dir, "redacted.pdf")
+        for path in paths:
+            doc = fitz.open(path)
+            masks = page_masks(doc)
+
+            begin = time.perf_counter()
+            applied_pages, image_pages = apply_masks_to_document(doc, masks)
+            doc.save(output_path, **get_save_options(DEFAULT_SAVE_PROFILE, applied_pages > 0, image_pages > 0))
+            save_time = time.perf_counter() - begin
+            doc.close()
+
+            result = verify_file(output_path, masks, fill=REDACTION_FILL)
+            original = verify_file(path, masks, fill=REDACTION_FILL)
+
+            # 사용하지 않는 객체를 제거하지 않고 저장 (원본 내용 스트림이 참조만 끊긴 채 남음)
+            doc = fitz.open(path)
+            apply_masks_to_document(doc, masks)
+            doc.save(output_path, garbage=0)
+            doc.close()
+            orphaned = verify_file(output_path, masks, fill=REDACTION_FILL)
+
+            print(os.path.basename(path))
+            print(
+                f"  Redaction + 저장 {save_time * 1000:8.1f} ms | "
+                f"검증 {result.elapsed * 1000:8.1f} ms ({result.elapsed / save_time:5.0%})"
+            )
+            print(f"  결과 파일: {result.summary()}")
+            print(f"  원본 파일: 실패 영역 {len(original.issues)}/{original.checked}개")
+            print(f"  객체 미정리 파일: {orphaned.summary()[:80]}")
+
+
+if __name__ == "__main__":
+    main()
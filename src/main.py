@@ -4,6 +4,7 @@ PyQt6 기반 PDF 마스킹 애플리케이션
 """
 
 import sys
+import multiprocessing
 from PyQt6.QtWidgets import QApplication, QDialog, QMessageBox
 
 from pdfmask.managers import LicenseManager, LogManager
@@ -15,7 +16,13 @@ def main() -> None:
     메인 함수
     
     라이선스 검증 후 메인 윈도우를 표시합니다.
+    `pdfmask batch ...`로 실행하면 화면 없이 일괄 마스킹을 수행합니다.
     """
+    # 일괄 마스킹 (명령줄)
+    if len(sys.argv) > 1 and sys.argv[1] == "batch":
+        from pdfmask.batch import main as batch_main
+        sys.exit(batch_main(sys.argv[2:]))
+    
     app = QApplication(sys.argv)
     app.setApplicationName("PDF Mask")
     
@@ -53,5 +60,7 @@ def main() -> None:
 
 
 if __name__ == "__main__":
+    # PyInstaller 패키징 시 작업자 프로세스 지원
+    multiprocessing.freeze_support()
     main()
 
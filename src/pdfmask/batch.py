@@ -0,0 +1,254 @@
+"""
+일괄 마스킹 명령줄 도구
+
+화면 없이 저장된 마스킹 데이터(masks_data)를 폴더의 PDF 파일에 적용합니다.
+파일마다 별도 프로세스에서 처리하므로 모든 CPU 코어를 사용합니다.
+
+사용법:
+    pdfmask batch <PDF 폴더> [--date YYYYMMDD] [--output 폴더] [--workers N] [--password 암호]
+                  [--profile fast|compact|web] [--chunk-pages N]
+"""
+
+import os
+import sys
+import time
+import argparse
+from concurrent.futures import ProcessPoolExecutor, as_completed
+from datetime import datetime
+from typing import List, Optional
+
+try:
+    import resource  # 작업자 최대 메모리 측정 (Windows에는 없음)
+except ImportError:
+    resource = None
+
+from .managers.license_manager import LicenseManager
+from .managers.log_manager import LogManager
+from .managers.mask_data_manager import MaskDataManager
+from .managers.pdf_manager import (
+    redact_file,
+    to_mask_records,
+    SAVE_PROFILES,
+    SAVE_PROFILE_DESCRIPTIONS,
+    DEFAULT_SAVE_PROFILE,
+    CHUNKED_PAGE_THRESHOLD,
+    DEFAULT_CHUNK_PAGES,
+)
+
+
+def get_default_output_dir() -> str:
+    """
+    기본 결과 폴더 반환 (GUI 저장과 같은 pdf_result/YYYYMMDD)
+
+    Returns:
+        str: 결과 폴더 경로
+    """
+    if getattr(sys, 'frozen', False):
+        # PyInstaller로 패키징된 exe 실행 시
+        base_dir = os.path.dirname(sys.executable)
+    else:
+        # 개발 환경 (src/pdfmask/ -> src/ -> project_root/)
+        pdfmask_dir = os.path.dirname(os.path.abspath(__file__))
+        base_dir = os.path.dirname(os.path.dirname(pdfmask_dir))
+    return os.path.join(base_dir, "pdf_result", datetime.now().strftime("%Y%m%d"))
+
+
+def reserve_output_path(output_dir: str, pdf_filename: str, reserved: set[str]) -> str:
+    """
+    이미 있는 파일이나 앞서 배정한 경로와 겹치지 않는 결과 파일 경로 생성
+
+    Args:
+        output_dir: 결과 폴더
+        pdf_filename: 원본 파일명
+        reserved: 이번 작업에서 이미 배정한 경로 (배정한 경로가 추가됨)
+
+    Returns:
+        str: 결과 파일 경로
+    """
+    result_path = os.path.join(output_dir, pdf_filename)
+    name, ext = os.path.splitext(pdf_filename)
+    counter = 1
+    while result_path in reserved or os.path.exists(result_path):
+        result_path = os.path.join(output_dir, f"{name}_{counter}{ext}")
+        counter += 1
+    reserved.add(result_path)
+    return result_path
+
+
+def get_worker_peak_memory_mb() -> Optional[float]:
+    """
+    종료된 작업자 프로세스 중 가장 많이 사용한 메모리(최대 RSS) 반환
+
+    Returns:
+        Optional[float]: 최대 RSS (MB, 측정할 수 없으면 None)
+    """
+    if resource is None:
+        return None
+    peak = resource.getrusage(resource.RUSAGE_CHILDREN).ru_maxrss
+    # Linux는 KB, macOS는 byte 단위
+    return peak / (1024 * 1024) if sys.platform == "darwin" else peak / 1024
+
+
+def run_batch(
+    folder: str,
+    date_str: Optional[str] = None,
+    output_dir: Optional[str] = None,
+    workers: Optional[int] = None,
+    password: str = "",
+    profile: str = DEFAULT_SAVE_PROFILE,
+    chunk_pages: int = 0
+) -> Optional[int]:
+    """
+    폴더의 PDF 파일에 저장된 마스킹 데이터를 일괄 적용
+
+    Args:
+        folder: PDF 폴더
+        date_str: 마스킹 데이터 날짜 (YYYYMMDD, None이면 오늘)
+        output_dir: 결과 폴더 (None이면 pdf_result/YYYYMMDD)
+        workers: 작업자 프로세스 수 (None이면 CPU 코어 수)
+        password: 암호화된 PDF에 사용할 암호
+        profile: 결과 파일 저장 프로필 이름 (SAVE_PROFILES)
+        chunk_pages: 한 번에 처리할 페이지 수 (0이면 큰 파일만 나누어 처리)
+
+    Returns:
+        Optional[int]: 실패한 파일 수 (마스킹 데이터를 불러오지 못해 실행하지 못했으면 None)
+    """
+    log_manager = LogManager()
+
+    pdf_files = sorted(
+        filename for filename in os.listdir(folder)
+        if filename.lower().endswith('.pdf')
+    )
+
+    # 파일 내용(문서 지문)으로 마스킹 데이터 찾기 (이름만 같은 다른 파일에는 적용하지 않음)
+    success, masks_by_path, msg = MaskDataManager().load_masks_for_files(
+        [os.path.join(folder, filename) for filename in pdf_files], date_str
+    )
+    if not success:
+        print(msg)
+        log_manager.log_error("batch redaction", msg)
+        return None
+    masks_by_file = {os.path.basename(path): masks for path, masks in masks_by_path.items()}
+
+    targets = [filename for filename in pdf_files if masks_by_file.get(filename)]
+    skipped = len(pdf_files) - len(targets)
+
+    print(f"PDF {len(pdf_files)}개 중 마스킹 데이터가 있는 파일 {len(targets)}개 (건너뜀 {skipped}개)")
+    if not targets:
+        return 0
+
+    if output_dir is None:
+        output_dir = get_default_output_dir()
+    os.makedirs(output_dir, exist_ok=True)
+
+    workers = workers or os.cpu_count() or 1
+    log_manager.info(
+        f"Batch Redaction Started: {folder} ({len(targets)} files, {workers} workers, "
+        f"profile {profile}) -> {output_dir}"
+    )
+
+    start_time = time.perf_counter()
+    failures = 0
+    reserved: set[str] = set()
+
+    with ProcessPoolExecutor(max_workers=workers) as executor:
+        futures = {}
+        for filename in targets:
+            records = to_mask_records(masks_by_file[filename])
+            output_path = reserve_output_path(output_dir, filename, reserved)
+            future = executor.submit(
+                redact_file, os.path.join(folder, filename), records, output_path, password,
+                profile, chunk_pages
+            )
+            futures[future] = (filename, output_path)
+
+        for done, future in enumerate(as_completed(futures), 1):
+            filename, output_path = futures[future]
+            try:
+                ok, message = future.result()
+            except Exception as e:
+                # 작업자 프로세스 비정상 종료 등
+                ok, message = False, str(e)
+
+            if ok:
+                print(f"[{done}/{len(targets)}] 완료: {filename} - {message}")
+                log_manager.info(f"Batch Redaction: {filename} -> {output_path} ({message})")
+            else:
+                failures += 1
+                print(f"[{done}/{len(targets)}] 실패: {filename} - {message}")
+                log_manager.log_error(f"batch redaction ({filename})", message)
+
+    elapsed = time.perf_counter() - start_time
+    peak_mb = get_worker_peak_memory_mb()
+    peak_text = f", 작업자 최대 메모리 {peak_mb:.0f} MB" if peak_mb is not None else ""
+    summary = f"일괄 마스킹 종료: 성공 {len(targets) - failures}개, 실패 {failures}개 ({elapsed:.1f}초{peak_text})"
+    print(summary)
+    peak_log = f", peak worker RSS {peak_mb:.0f} MB" if peak_mb is not None else ""
+    log_manager.info(
+        f"Batch Redaction Finished: {len(targets) - failures} succeeded, {failures} failed "
+        f"({elapsed:.1f}s{peak_log})"
+    )
+    return failures
+
+
+def build_parser() -> argparse.ArgumentParser:
+    """명령줄 인자 파서 생성"""
+    parser = argparse.ArgumentParser(
+        prog="pdfmask batch",
+        description="저장된 마스킹 데이터를 폴더의 PDF 파일에 일괄 적용합니다."
+    )
+    parser.add_argument("folder", help="PDF 파일이 있는 폴더")
+    parser.add_argument("--date", help="사용할 마스킹 데이터 날짜 (YYYYMMDD, 기본값: 오늘)")
+    parser.add_argument("--output", help="결과 폴더 (기본값: pdf_result/YYYYMMDD)")
+    parser.add_argument("--workers", type=int, help="작업자 프로세스 수 (기본값: CPU 코어 수)")
+    parser.add_argument("--password", default="", help="암호화된 PDF의 암호")
+    parser.add_argument(
+        "--profile",
+        choices=list(SAVE_PROFILES),
+        default=DEFAULT_SAVE_PROFILE,
+        help="결과 파일 저장 프로필 ("
+        + ", ".join(f"{name}: {desc}" for name, desc in SAVE_PROFILE_DESCRIPTIONS.items())
+        + f", 기본값: {DEFAULT_SAVE_PROFILE})"
+    )
+    parser.add_argument(
+        "--chunk-pages",
+        type=int,
+        default=0,
+        help="한 번에 처리할 페이지 수. 메모리 사용량이 이 값에 비례합니다 "
+        f"(기본값: {CHUNKED_PAGE_THRESHOLD}페이지 이상인 파일만 {DEFAULT_CHUNK_PAGES}페이지씩 처리)"
+    )
+    return parser
+
+
+def main(argv: Optional[List[str]] = None) -> int:
+    """
+    일괄 마스킹 실행
+
+    Args:
+        argv: 명령줄 인자 (None이면 sys.argv[1:])
+
+    Returns:
+        int: 종료 코드 (0: 모두 성공, 1: 실패 있음, 2: 실행 불가)
+    """
+    args = build_parser().parse_args(argv)
+
+    if not os.path.isdir(args.folder):
+        print(f"폴더를 찾을 수 없습니다: {args.folder}")
+        return 2
+
+    # 라이선스 확인 (GUI와 달리 입력 창 없이 종료)
+    if not LicenseManager().is_licensed():
+        print("라이선스 인증이 필요합니다. 프로그램을 실행하여 먼저 인증해주세요.")
+        return 2
+
+    failures = run_batch(
+        args.folder, args.date, args.output, args.workers, args.password, args.profile,
+        args.chunk_pages
+    )
+    if failures is None:
+        return 2
+    return 1 if failures else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
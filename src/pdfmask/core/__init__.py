@@ -2,7 +2,8 @@
 Core module - 핵심 데이터 모델
 """
 
-from .models import MaskEntry
+from .models import MaskEntry, MaskTemplate
+from .mask_store import MaskStore
 
-__all__ = ['MaskEntry']
+__all__ = ['MaskEntry', 'MaskTemplate', 'MaskStore']
 
@@ -0,0 +1,202 @@
+"""
+마스킹 저장소
+
+페이지별로 마스킹을 보관하고, 각 페이지 안에서는 격자(grid) 공간 색인으로
+영역 조회를 빠르게 수행합니다.
+"""
+
+import itertools
+from typing import Dict, Iterable, Iterator, List, Set, Tuple
+
+import fitz  # PyMuPDF
+
+from .models import MaskEntry
+
+
+# 공간 색인 격자 한 칸의 크기 (PDF 좌표, pt)
+GRID_CELL_SIZE = 64.0
+
+
+def _bounds(rect: fitz.Rect) -> Tuple[float, float, float, float]:
+    """좌표 순서를 정규화한 (x0, y0, x1, y1)"""
+    return (
+        min(rect.x0, rect.x1), min(rect.y0, rect.y1),
+        max(rect.x0, rect.x1), max(rect.y0, rect.y1),
+    )
+
+
+def _cells(bounds: Tuple[float, float, float, float]) -> Iterator[Tuple[int, int]]:
+    """영역이 걸치는 격자 칸"""
+    x0, y0, x1, y1 = bounds
+    for cy in range(int(y0 // GRID_CELL_SIZE), int(y1 // GRID_CELL_SIZE) + 1):
+        for cx in range(int(x0 // GRID_CELL_SIZE), int(x1 // GRID_CELL_SIZE) + 1):
+            yield cx, cy
+
+
+def _overlaps(a: Tuple[float, float, float, float], b: Tuple[float, float, float, float]) -> bool:
+    """두 영역이 겹치거나 맞닿는지 여부"""
+    return a[0] <= b[2] and b[0] <= a[2] and a[1] <= b[3] and b[1] <= a[3]
+
+
+class _PageIndex:
+    """한 페이지의 마스킹과 격자 공간 색인"""
+
+    def __init__(self) -> None:
+        # 추가 순번 → (추가 순번, 영역, 마스킹)
+        self.entries: Dict[int, Tuple[int, Tuple[float, float, float, float], MaskEntry]] = {}
+        # 격자 칸 → 그 칸에 걸치는 마스킹의 추가 순번
+        self.cells: Dict[Tuple[int, int], Set[int]] = {}
+
+    def insert(self, seq: int, entry: MaskEntry) -> None:
+        bounds = _bounds(entry.rect)
+        self.entries[seq] = (seq, bounds, entry)
+        for cell in _cells(bounds):
+            self.cells.setdefault(cell, set()).add(seq)
+
+    def remove(self, seq: int) -> None:
+        _, bounds, _ = self.entries.pop(seq)
+        for cell in _cells(bounds):
+            seqs = self.cells.get(cell)
+            if seqs is not None:
+                seqs.discard(seq)
+                if not seqs:
+                    del self.cells[cell]
+
+    def query(self, bounds: Tuple[float, float, float, float]) -> List[MaskEntry]:
+        found: Set[int] = set()
+        for cell in _cells(bounds):
+            found.update(self.cells.get(cell, ()))
+
+        hits = [self.entries[key] for key in found]
+        hits = [hit for hit in hits if _overlaps(hit[1], bounds)]
+        hits.sort(key=lambda hit: hit[0])
+        return [entry for _, _, entry in hits]
+
+
+class MaskStore:
+    """
+    마스킹 저장소
+
+    추가된 순서(마스킹 리스트 테이블의 행 순서)를 유지하는 리스트처럼 동작하며,
+    페이지별 조회(for_page)와 영역 조회(query)는
+    전체 마스킹을 훑지 않고 페이지별 격자 색인을 사용합니다.
+    색인은 추가 순번으로 구분하므로 같은 객체를 두 번 추가해도 행마다 따로 관리됩니다.
+
+    색인은 추가 시점의 영역 기준이므로, 마스킹 영역을 바꿀 때는
+    삭제 후 다시 추가해야 합니다 (메모 수정은 그대로 가능).
+    """
+
+    def __init__(self, masks: Iterable[MaskEntry] = ()) -> None:
+        """
+        초기화
+
+        Args:
+            masks: 초기 마스킹 목록
+        """
+        # 행 순서대로 (추가 순번, 마스킹)
+        self._order: List[Tuple[int, MaskEntry]] = []
+        self._pages: Dict[int, _PageIndex] = {}
+        self._seq = itertools.count()
+        self.extend(masks)
+
+    def __len__(self) -> int:
+        return len(self._order)
+
+    def __iter__(self) -> Iterator[MaskEntry]:
+        return (entry for _, entry in self._order)
+
+    def __getitem__(self, row: int) -> MaskEntry:
+        return self._order[row][1]
+
+    def __delitem__(self, row: int) -> None:
+        seq, entry = self._order.pop(row)
+        self._remove_from_page(seq, entry)
+
+    def append(self, entry: MaskEntry) -> None:
+        """
+        마스킹 추가
+
+        Args:
+            entry: 추가할 마스킹
+        """
+        seq = next(self._seq)
+        self._order.append((seq, entry))
+        self._pages.setdefault(entry.page_index, _PageIndex()).insert(seq, entry)
+
+    def extend(self, masks: Iterable[MaskEntry]) -> None:
+        """
+        마스킹 여러 개 추가
+
+        Args:
+            masks: 추가할 마스킹 목록
+        """
+        for entry in masks:
+            self.append(entry)
+
+    def remove(self, entry: MaskEntry) -> None:
+        """
+        마스킹 삭제
+
+        Args:
+            entry: 삭제할 마스킹 (같은 객체)
+
+        Raises:
+            ValueError: 저장소에 없는 경우
+        """
+        for row, (_, stored) in enumerate(self._order):
+            if stored is entry:
+                del self[row]
+                return
+        raise ValueError("저장소에 없는 마스킹입니다.")
+
+    def clear(self) -> None:
+        """모든 마스킹 삭제"""
+        self._order.clear()
+        self._pages.clear()
+
+    def pages(self) -> List[int]:
+        """
+        마스킹이 있는 페이지 인덱스 목록 (오름차순)
+
+        Returns:
+            List[int]: 페이지 인덱스 목록
+        """
+        return sorted(self._pages)
+
+    def for_page(self, page_index: int) -> List[MaskEntry]:
+        """
+        페이지의 마스킹 목록 (추가된 순서)
+
+        Args:
+            page_index: 페이지 인덱스 (0-based)
+
+        Returns:
+            List[MaskEntry]: 마스킹 목록
+        """
+        page = self._pages.get(page_index)
+        if page is None:
+            return []
+        return [entry for _, _, entry in sorted(page.entries.values(), key=lambda item: item[0])]
+
+    def query(self, page_index: int, rect: fitz.Rect) -> List[MaskEntry]:
+        """
+        페이지에서 영역과 겹치는 마스킹 조회
+
+        Args:
+            page_index: 페이지 인덱스 (0-based)
+            rect: 조회 영역 (PDF 좌표)
+
+        Returns:
+            List[MaskEntry]: 겹치는 마스킹 목록 (추가된 순서)
+        """
+        page = self._pages.get(page_index)
+        if page is None:
+            return []
+        return page.query(_bounds(rect))
+
+    def _remove_from_page(self, seq: int, entry: MaskEntry) -> None:
+        """페이지 색인에서 마스킹 제거"""
+        page = self._pages[entry.page_index]
+        page.remove(seq)
+        if not page.entries:
+            del self._pages[entry.page_index]
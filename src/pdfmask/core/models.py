@@ -2,7 +2,8 @@
 데이터 모델 정의
 """
 
-from dataclasses import dataclass
+from dataclasses import dataclass, field
+from typing import List, Tuple
 import fitz  # PyMuPDF
 
 
@@ -20,3 +21,20 @@ class MaskEntry:
     rect: fitz.Rect
     note: str = ""
 
+
+
+@dataclass
+class MaskTemplate:
+    """
+    마스킹 템플릿 데이터 클래스
+
+    같은 양식의 여러 PDF에 반복 적용할 마스킹 목록입니다.
+
+    Attributes:
+        name (str): 템플릿 이름
+        page_sizes (List[Tuple[float, float]]): 템플릿을 만든 문서의 페이지별 크기 (너비, 높이)
+        masks (List[MaskEntry]): 마스킹 목록 (템플릿을 만든 문서의 PDF 좌표계)
+    """
+    name: str
+    page_sizes: List[Tuple[float, float]] = field(default_factory=list)
+    masks: List[MaskEntry] = field(default_factory=list)
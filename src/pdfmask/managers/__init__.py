@@ -5,15 +5,32 @@ Managers module - 각종 관리자 클래스
 from .license_manager import LicenseManager
 from .pdf_manager import PdfDocumentManager, PasswordRequiredException
 from .mask_data_manager import MaskDataManager
+from .autosave_journal import AutosaveJournal
 from .progress_manager import ProgressManager
 from .log_manager import LogManager
+from .excel_export_manager import ExcelExportManager
+from .save_queue import SaveQueue
+from .render_cache import RenderCache
+from .render_pool import RenderWorkerPool
+from .thumbnail_manager import ThumbnailManager
+from .suggestion_manager import SuggestionManager
+from .template_manager import TemplateManager, TemplateReplay
 
 __all__ = [
     'LicenseManager',
     'PdfDocumentManager',
     'PasswordRequiredException',
     'MaskDataManager',
+    'AutosaveJournal',
     'ProgressManager',
     'LogManager',
+    'ExcelExportManager',
+    'SaveQueue',
+    'RenderCache',
+    'RenderWorkerPool',
+    'ThumbnailManager',
+    'SuggestionManager',
+    'TemplateManager',
+    'TemplateReplay',
 ]
 
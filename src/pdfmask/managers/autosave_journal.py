@@ -0,0 +1,340 @@
+"""
+마스킹 자동 저장 저널 모듈
+
+저장(Ctrl+S)하기 전의 마스킹 작업을 문서별 저널 파일(autosave/*.jsonl)에 한 줄씩 이어 씁니다.
+프로그램이 비정상 종료되어도 같은 파일을 다시 열면 저널을 재생하여 작업을 복구합니다.
+
+마스킹을 그릴 때마다 파일에 쓰면 화면이 디스크를 기다리게 되므로, 화면 스레드에서는
+기록을 모아 두기만 하고 실제 쓰기와 fsync는 전용 스레드에서 묶어서 처리합니다.
+"""
+
+import os
+import json
+import hashlib
+from concurrent.futures import ThreadPoolExecutor
+from typing import IO, List, Optional
+
+import fitz  # PyMuPDF
+from PyQt6.QtCore import QObject, QTimer
+
+from ..core.models import MaskEntry
+from .mask_data_manager import compute_fingerprint
+
+
+# 기록을 모았다가 파일에 쓰는 간격 (ms)
+JOURNAL_FLUSH_MS = 200
+
+# 쓴 내용을 디스크에 확정(fsync)하는 간격 (ms, 정전 시 잃을 수 있는 최대 작업 시간)
+JOURNAL_FSYNC_MS = 1000
+
+
+def _mask_record(mask: MaskEntry) -> dict:
+    """마스킹 정보를 저널 기록 형식으로 변환"""
+    rect = mask.rect
+    return {"page": mask.page_index, "rect": [rect.x0, rect.y0, rect.x1, rect.y1], "note": mask.note}
+
+
+def _mask_entry(record: dict) -> MaskEntry:
+    """저널 기록을 마스킹 정보로 변환"""
+    return MaskEntry(page_index=record["page"], rect=fitz.Rect(record["rect"]), note=record.get("note", ""))
+
+
+def replay_journal(journal_path: str) -> Optional[List[MaskEntry]]:
+    """
+    저널 파일을 처음부터 재생하여 마지막 마스킹 목록 복원
+
+    기록 종류:
+        reset: 마스킹 목록 전체 (저널 시작, 정리 후)
+        add: 마스킹 추가 (목록 끝)
+        note: 행 번호의 메모 변경
+        delete: 행 번호의 마스킹 삭제
+
+    마지막 줄을 쓰는 도중 종료되어 줄이 잘린 경우 그 줄부터는 무시합니다.
+
+    Args:
+        journal_path: 저널 파일 경로
+
+    Returns:
+        Optional[List[MaskEntry]]: 복원한 마스킹 목록 (저널이 없거나 비어 있으면 None)
+    """
+    if not os.path.exists(journal_path):
+        return None
+
+    masks: Optional[List[MaskEntry]] = None
+    with open(journal_path, 'r', encoding='utf-8') as f:
+        for line in f:
+            try:
+                record = json.loads(line)
+            except ValueError:
+                break
+            op = record.get("op")
+            if op == "reset":
+                masks = [_mask_entry(mask) for mask in record["masks"]]
+            elif masks is None:
+                # 시작 기록이 없는 저널은 사용하지 않음
+                break
+            elif op == "add":
+                masks.append(_mask_entry(record["mask"]))
+            elif op == "note" and 0 <= record["row"] < len(masks):
+                masks[record["row"]].note = record["note"]
+            elif op == "delete" and 0 <= record["row"] < len(masks):
+                del masks[record["row"]]
+    return masks
+
+
+class AutosaveJournal(QObject):
+    """
+    현재 문서의 저장하지 않은 마스킹 작업을 저널 파일에 기록하는 클래스
+
+    화면 스레드의 record_*() 호출은 기록을 목록에 추가하기만 하고,
+    JOURNAL_FLUSH_MS마다 모인 기록을 전용 스레드(작업자 1개)에서 한 번에 씁니다.
+    fsync는 JOURNAL_FSYNC_MS마다 쓴 내용이 있을 때만 수행합니다.
+    파일 작업은 모두 같은 스레드에서 순서대로 실행되므로 따로 잠그지 않습니다.
+    """
+
+    def __init__(self, journal_dir: Optional[str] = None, parent: Optional[QObject] = None) -> None:
+        """
+        초기화
+
+        Args:
+            journal_dir: 저널 폴더 (기본값: 프로젝트 루트의 autosave)
+            parent: 부모 객체
+        """
+        super().__init__(parent)
+        if journal_dir is None:
+            # 프로젝트 루트 경로 (src/pdfmask/managers/ -> src/ -> project_root/)
+            current_file = os.path.abspath(__file__)
+            managers_dir = os.path.dirname(current_file)  # managers/
+            pdfmask_dir = os.path.dirname(managers_dir)   # pdfmask/
+            src_dir = os.path.dirname(pdfmask_dir)        # src/
+            project_root = os.path.dirname(src_dir)       # project_root/
+            journal_dir = os.path.join(project_root, "autosave")
+        self.journal_dir = journal_dir
+        os.makedirs(self.journal_dir, exist_ok=True)
+
+        # 현재 문서의 저널 (화면 스레드에서만 사용)
+        self.journal_path: Optional[str] = None
+        self._baseline: Optional[str] = None   # 첫 기록 전에 쓸 시작 기록 (reset)
+        self._pending: List[str] = []
+
+        # 쓰기 스레드에서만 사용하는 상태
+        self._file: Optional[IO[str]] = None
+        self._file_path: Optional[str] = None
+        self._dirty = False
+
+        self._executor = ThreadPoolExecutor(max_workers=1, thread_name_prefix="autosave")
+
+        self._flush_timer = QTimer(self)
+        self._flush_timer.setSingleShot(True)
+        self._flush_timer.setInterval(JOURNAL_FLUSH_MS)
+        self._flush_timer.timeout.connect(self.flush)
+
+        self._sync_timer = QTimer(self)
+        self._sync_timer.setInterval(JOURNAL_FSYNC_MS)
+        self._sync_timer.timeout.connect(lambda: self._executor.submit(self._sync))
+        self._sync_timer.start()
+
+    def get_journal_path(self, pdf_path: str) -> str:
+        """
+        문서의 저널 파일 경로 (문서 지문 기준, 파일을 옮기거나 이름을 바꿔도 같은 저널 사용)
+
+        Args:
+            pdf_path: PDF 파일 경로
+
+        Returns:
+            str: 저널 파일 경로 (autosave/<해시>.jsonl)
+        """
+        key = compute_fingerprint(pdf_path) or os.path.abspath(pdf_path)
+        name = hashlib.blake2b(key.encode('utf-8'), digest_size=12).hexdigest()
+        return os.path.join(self.journal_dir, f"{name}.jsonl")
+
+    def open(self, pdf_path: str, masks: List[MaskEntry]) -> Optional[List[MaskEntry]]:
+        """
+        문서의 저널 시작 (이전 문서의 저널은 닫음)
+
+        저장하지 않은 작업이 남은 저널이 있으면 재생하여 복원한 마스킹 목록을 반환하고,
+        저널은 복원한 목록 하나만 담도록 정리(compaction)합니다.
+
+        Args:
+            pdf_path: PDF 파일 경로
+            masks: 저장된 마스킹 데이터에서 불러온 현재 마스킹 목록
+
+        Returns:
+            Optional[List[MaskEntry]]: 저널에서 복원한 마스킹 목록 (복원할 작업이 없으면 None)
+        """
+        self.close()
+        journal_path = self.get_journal_path(pdf_path)
+
+        # 이전 쓰기가 끝난 뒤 읽도록 쓰기 스레드를 거쳐 재생
+        try:
+            recovered = self._executor.submit(replay_journal, journal_path).result()
+        except Exception as e:
+            print(f"자동 저장 저널 복원 오류: {str(e)}")
+            recovered = None
+
+        self.journal_path = journal_path
+        if recovered is not None:
+            # 정리: 복원한 목록을 시작 기록으로 새 저널 작성
+            line = self._reset_line(recovered)
+            self._executor.submit(self._compact, journal_path, line)
+            self._baseline = None
+        else:
+            # 읽을 수 없는 저널(첫 줄이 잘린 경우 등)은 지우고 새로 시작
+            self._executor.submit(self._remove, journal_path)
+            self._baseline = self._reset_line(masks)
+        return recovered
+
+    def recover(self, pdf_path: str) -> Optional[List[MaskEntry]]:
+        """
+        열려 있지 않은 문서의 저널을 재생하여 저장하지 않은 마스킹 목록 반환 (저널은 그대로 둠)
+
+        Args:
+            pdf_path: PDF 파일 경로
+
+        Returns:
+            Optional[List[MaskEntry]]: 저널에서 복원한 마스킹 목록 (저장하지 않은 작업이 없으면 None)
+        """
+        # 이전 쓰기가 끝난 뒤 읽도록 쓰기 스레드를 거쳐 재생
+        try:
+            return self._executor.submit(replay_journal, self.get_journal_path(pdf_path)).result()
+        except Exception as e:
+            print(f"자동 저장 저널 복원 오류: {str(e)}")
+            return None
+
+    def discard_file(self, pdf_path: str) -> None:
+        """
+        열려 있지 않은 문서의 작업이 저장되었으므로 저널 삭제
+
+        Args:
+            pdf_path: PDF 파일 경로
+        """
+        journal_path = self.get_journal_path(pdf_path)
+        if journal_path == self.journal_path:
+            self.discard()
+        else:
+            self._executor.submit(self._remove, journal_path)
+
+    def record_add(self, mask: MaskEntry) -> None:
+        """마스킹 추가 기록"""
+        self._append({"op": "add", "mask": _mask_record(mask)})
+
+    def record_note(self, row: int, note: str) -> None:
+        """메모 변경 기록"""
+        self._append({"op": "note", "row": row, "note": note})
+
+    def record_delete(self, row: int) -> None:
+        """마스킹 삭제 기록"""
+        self._append({"op": "delete", "row": row})
+
+    def flush(self) -> None:
+        """모아 둔 기록을 쓰기 스레드로 전달"""
+        self._flush_timer.stop()
+        if self.journal_path is None or not self._pending:
+            return
+        lines, self._pending = self._pending, []
+        self._executor.submit(self._write, self.journal_path, lines)
+
+    def discard(self) -> None:
+        """현재 문서의 작업이 저장되었으므로 저널 삭제"""
+        self._pending = []
+        self._flush_timer.stop()
+        if self.journal_path is not None:
+            self._executor.submit(self._remove, self.journal_path)
+        self.journal_path = None
+        self._baseline = None
+
+    def close(self) -> None:
+        """현재 문서의 저널 닫기 (저장하지 않은 작업은 다음에 열 때 복원)"""
+        self.flush()
+        self._executor.submit(self._close_file)
+        self.journal_path = None
+        self._baseline = None
+
+    def shutdown(self) -> None:
+        """남은 기록을 모두 쓰고 디스크에 확정한 뒤 쓰기 스레드 종료"""
+        self._sync_timer.stop()
+        self.close()
+        self._executor.shutdown(wait=True)
+
+    def _append(self, record: dict) -> None:
+        """기록 추가 (화면 스레드, 파일에 쓰지 않음)"""
+        if self.journal_path is None:
+            return
+        if self._baseline is not None:
+            self._pending.append(self._baseline)
+            self._baseline = None
+        self._pending.append(json.dumps(record, ensure_ascii=False) + "\n")
+        if not self._flush_timer.isActive():
+            self._flush_timer.start()
+
+    def _reset_line(self, masks: List[MaskEntry]) -> str:
+        """마스킹 목록 전체 기록"""
+        record = {"op": "reset", "masks": [_mask_record(mask) for mask in masks]}
+        return json.dumps(record, ensure_ascii=False) + "\n"
+
+    # ---- 아래는 쓰기 스레드에서 실행 ----
+
+    def _open_file(self, journal_path: str) -> IO[str]:
+        """저널 파일을 이어 쓰기 모드로 열기"""
+        if self._file_path != journal_path:
+            self._close_file()
+            self._file = open(journal_path, 'a', encoding='utf-8')
+            self._file_path = journal_path
+        return self._file
+
+    def _write(self, journal_path: str, lines: List[str]) -> None:
+        """기록 묶음을 저널 끝에 쓰기 (fsync는 _sync에서)"""
+        try:
+            f = self._open_file(journal_path)
+            f.writelines(lines)
+            # 프로그램이 종료되어도 남도록 운영체제에 전달
+            f.flush()
+            self._dirty = True
+        except Exception as e:
+            print(f"자동 저장 저널 기록 오류: {str(e)}")
+
+    def _sync(self) -> None:
+        """쓴 내용이 있으면 디스크에 확정 (정전 대비)"""
+        if not self._dirty or self._file is None:
+            return
+        try:
+            os.fsync(self._file.fileno())
+            self._dirty = False
+        except Exception as e:
+            print(f"자동 저장 저널 동기화 오류: {str(e)}")
+
+    def _close_file(self) -> None:
+        """열린 저널 파일을 확정하고 닫기"""
+        if self._file is None:
+            return
+        self._sync()
+        self._file.close()
+        self._file = None
+        self._file_path = None
+
+    def _compact(self, journal_path: str, line: str) -> None:
+        """저널을 기록 하나로 정리 (임시 파일에 쓴 뒤 교체)"""
+        try:
+            if self._file_path == journal_path:
+                self._close_file()
+            temp_path = journal_path + ".tmp"
+            with open(temp_path, 'w', encoding='utf-8') as f:
+                f.write(line)
+                f.flush()
+                os.fsync(f.fileno())
+            os.replace(temp_path, journal_path)
+        except Exception as e:
+            print(f"자동 저장 저널 정리 오류: {str(e)}")
+
+    def _remove(self, journal_path: str) -> None:
+        """저널 파일 삭제"""
+        try:
+            if self._file_path == journal_path:
+                self._file.close()
+                self._file = None
+                self._file_path = None
+                self._dirty = False
+            if os.path.exists(journal_path):
+                os.remove(journal_path)
+        except Exception as e:
+            print(f"자동 저장 저널 삭제 오류: {str(e)}")
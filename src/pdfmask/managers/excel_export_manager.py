@@ -0,0 +1,242 @@
+"""
+마스킹 작업 내역 엑셀 저장 모듈
+
+작업 내역은 저장할 때마다 일자별 CSV(마스킹_작업내역_YYYYMMDD.csv)에 행만 이어 쓰고,
+엑셀 파일은 메뉴에서 요청하거나 날짜가 바뀌었을 때 CSV에서 한 번에 만듭니다.
+저장할 때마다 그날의 엑셀 파일 전체를 불러와 다시 쓰던 방식과 달리
+하루에 저장한 파일 수와 관계없이 기록 시간이 일정합니다.
+"""
+
+import os
+import sys
+import csv
+import glob
+import threading
+from datetime import datetime
+from typing import Iterable, List, Optional, Tuple
+
+from ..core.models import MaskEntry
+
+
+# 작업 내역 헤더
+AUDIT_HEADER = ["작업일시", "PDF 파일명", "페이지", "마스킹 영역 좌표", "메모"]
+
+# 작업 내역 파일명 (확장자 제외)
+AUDIT_FILE_PREFIX = "마스킹_작업내역_"
+
+# 화면과 백그라운드 저장이 같은 CSV에 동시에 쓰지 않도록 잠금
+_audit_lock = threading.Lock()
+
+
+class ExcelExportManager:
+    """
+    마스킹 작업 내역을 일자별로 누적 저장하는 클래스
+
+    xlsx_result 폴더에 마스킹_작업내역_YYYYMMDD.csv로 기록하고,
+    같은 이름의 .xlsx 파일은 export_workbook()에서 만듭니다.
+    openpyxl은 실제로 엑셀 파일을 만들 때 불러옵니다.
+    """
+
+    def __init__(self, xlsx_dir: Optional[str] = None) -> None:
+        """
+        초기화
+
+        실행 환경에 따라 xlsx_result 폴더 위치를 결정합니다.
+
+        Args:
+            xlsx_dir: 작업 내역 폴더 (기본값: 실행 위치의 xlsx_result)
+        """
+        if xlsx_dir is None:
+            if getattr(sys, 'frozen', False):
+                # PyInstaller로 패키징된 exe 실행 시
+                base_dir = os.path.dirname(sys.executable)
+            else:
+                # 프로젝트 루트 경로 (src/pdfmask/managers/ -> src/ -> project_root/)
+                current_file = os.path.abspath(__file__)
+                managers_dir = os.path.dirname(current_file)  # managers/
+                pdfmask_dir = os.path.dirname(managers_dir)   # pdfmask/
+                src_dir = os.path.dirname(pdfmask_dir)        # src/
+                base_dir = os.path.dirname(src_dir)           # project_root/
+            xlsx_dir = os.path.join(base_dir, "xlsx_result")
+        self.xlsx_dir = xlsx_dir
+
+        # 지난 날짜의 엑셀 파일을 확인한 날짜 (하루에 한 번만 확인)
+        self._rollover_date: Optional[str] = None
+
+    def get_excel_path(self, date_str: Optional[str] = None) -> str:
+        """
+        날짜별 엑셀 파일 경로 반환
+
+        Args:
+            date_str: 날짜 문자열 (YYYYMMDD), None이면 오늘 날짜
+
+        Returns:
+            str: 엑셀 파일 경로
+        """
+        if date_str is None:
+            date_str = datetime.now().strftime("%Y%m%d")
+        return os.path.join(self.xlsx_dir, f"{AUDIT_FILE_PREFIX}{date_str}.xlsx")
+
+    def get_audit_path(self, date_str: Optional[str] = None) -> str:
+        """
+        날짜별 작업 내역 CSV 파일 경로 반환
+
+        Args:
+            date_str: 날짜 문자열 (YYYYMMDD), None이면 오늘 날짜
+
+        Returns:
+            str: CSV 파일 경로
+        """
+        if date_str is None:
+            date_str = datetime.now().strftime("%Y%m%d")
+        return os.path.join(self.xlsx_dir, f"{AUDIT_FILE_PREFIX}{date_str}.csv")
+
+    def append_masks(self, pdf_path: str, masks: Iterable[MaskEntry]) -> Tuple[bool, str]:
+        """
+        오늘 날짜 작업 내역에 마스킹 내역 추가
+
+        날짜가 바뀐 뒤 처음 기록할 때 지난 날짜의 엑셀 파일을 만듭니다.
+
+        Args:
+            pdf_path: 마스킹한 PDF 파일 경로
+            masks: 마스킹 정보
+
+        Returns:
+            Tuple[bool, str]: (성공 여부, 저장 경로 또는 오류 메시지)
+        """
+        try:
+            # xlsx_result 폴더가 없으면 생성
+            os.makedirs(self.xlsx_dir, exist_ok=True)
+            date_str = datetime.now().strftime("%Y%m%d")
+            if self._rollover_date != date_str:
+                self._rollover_date = date_str
+                self.export_previous_workbooks(date_str)
+
+            pdf_name = os.path.basename(pdf_path)
+            timestamp = datetime.now().strftime("%Y-%m-%d %H:%M:%S")
+            rows = []
+            for mask in masks:
+                rect = mask.rect
+                coords = f"({rect.x0:.2f}, {rect.y0:.2f}, {rect.x1:.2f}, {rect.y1:.2f})"
+                rows.append([timestamp, pdf_name, mask.page_index + 1, coords, mask.note or ""])
+
+            save_path = self.get_audit_path(date_str)
+            with _audit_lock:
+                self._prepare_audit_file(date_str)
+                with open(save_path, 'a', encoding='utf-8', newline='') as f:
+                    csv.writer(f).writerows(rows)
+            return True, save_path
+
+        except Exception as e:
+            return False, f"작업 내역 저장 실패: {str(e)}"
+
+    def export_workbook(self, date_str: Optional[str] = None) -> Tuple[bool, str]:
+        """
+        날짜별 작업 내역으로 엑셀 파일 만들기
+
+        openpyxl 쓰기 전용 모드로 행을 하나씩 내보내므로 행 수가 많아도 메모리를 적게 씁니다.
+
+        Args:
+            date_str: 날짜 문자열 (YYYYMMDD), None이면 오늘 날짜
+
+        Returns:
+            Tuple[bool, str]: (성공 여부, 엑셀 파일 경로 또는 오류 메시지)
+        """
+        # openpyxl 지연 로딩
+        try:
+            from openpyxl import Workbook
+        except ImportError:
+            return False, (
+                "openpyxl 패키지가 설치되어 있지 않습니다.\n\n"
+                "다음 명령으로 설치 후 다시 시도해주세요.\n"
+                "pip install openpyxl"
+            )
+
+        try:
+            if date_str is None:
+                date_str = datetime.now().strftime("%Y%m%d")
+            audit_path = self.get_audit_path(date_str)
+            save_path = self.get_excel_path(date_str)
+            temp_path = os.path.join(self.xlsx_dir, f".{os.path.basename(save_path)}.tmp")
+
+            with _audit_lock:
+                if not os.path.exists(audit_path) and not os.path.exists(save_path):
+                    return False, "저장된 작업 내역이 없습니다."
+                self._prepare_audit_file(date_str)
+
+                wb = Workbook(write_only=True)
+                ws = wb.create_sheet("마스킹 내역")
+                with open(audit_path, 'r', encoding='utf-8-sig', newline='') as f:
+                    for row in csv.reader(f):
+                        # 페이지 번호는 숫자로 저장 (헤더 제외)
+                        if len(row) > 2 and row[2].isdigit():
+                            row[2] = int(row[2])
+                        ws.append(row)
+                wb.save(temp_path)
+
+            # 엑셀에서 열어 둔 파일이 아니면 교체
+            os.replace(temp_path, save_path)
+            return True, save_path
+
+        except Exception as e:
+            return False, f"엑셀 파일 저장 실패: {str(e)}"
+
+    def export_previous_workbooks(self, today: Optional[str] = None) -> List[str]:
+        """
+        엑셀 파일이 없거나 작업 내역보다 오래된 지난 날짜의 엑셀 파일 만들기
+
+        Args:
+            today: 오늘 날짜 (YYYYMMDD), None이면 오늘 날짜
+
+        Returns:
+            List[str]: 만든 엑셀 파일 경로
+        """
+        if today is None:
+            today = datetime.now().strftime("%Y%m%d")
+
+        exported = []
+        pattern = os.path.join(glob.escape(self.xlsx_dir), f"{AUDIT_FILE_PREFIX}*.csv")
+        for audit_path in sorted(glob.glob(pattern)):
+            date_str = os.path.basename(audit_path)[len(AUDIT_FILE_PREFIX):-len(".csv")]
+            if date_str >= today:
+                continue
+            excel_path = self.get_excel_path(date_str)
+            if os.path.exists(excel_path) and os.path.getmtime(excel_path) >= os.path.getmtime(audit_path):
+                continue
+            success, msg = self.export_workbook(date_str)
+            if success:
+                exported.append(msg)
+            else:
+                print(f"작업 내역 엑셀 변환 오류: {msg}")
+        return exported
+
+    def _prepare_audit_file(self, date_str: str) -> None:
+        """
+        작업 내역 CSV가 없으면 헤더로 시작 (잠금 안에서 호출)
+
+        이전 버전이 만든 같은 날짜의 엑셀 파일이 있으면 그 행을 먼저 옮겨 옵니다.
+        엑셀에서 바로 열 수 있도록 UTF-8 BOM을 붙입니다.
+        """
+        audit_path = self.get_audit_path(date_str)
+        if os.path.exists(audit_path):
+            return
+
+        rows = [AUDIT_HEADER]
+        excel_path = self.get_excel_path(date_str)
+        if os.path.exists(excel_path):
+            from openpyxl import load_workbook
+            wb = load_workbook(excel_path, read_only=True)
+            try:
+                ws = wb.active
+                rows = [
+                    ["" if value is None else value for value in row]
+                    for row in ws.iter_rows(values_only=True)
+                ] or rows
+            finally:
+                wb.close()
+
+        os.makedirs(self.xlsx_dir, exist_ok=True)
+        temp_path = audit_path + ".tmp"
+        with open(temp_path, 'w', encoding='utf-8-sig', newline='') as f:
+            csv.writer(f).writerows(rows)
+        os.replace(temp_path, audit_path)
@@ -0,0 +1,90 @@
+"""
+결과 파일 전송 모듈
+
+로컬 임시 폴더에 먼저 저장한 결과 파일을 느린 저장소(네트워크 공유 폴더 등)의
+최종 위치로 옮깁니다. 최종 위치에는 복사와 검증이 끝난 파일만 나타납니다.
+"""
+
+import os
+import hashlib
+import tempfile
+from typing import Tuple
+
+
+# 복사 및 해시 계산 시 한 번에 읽을 크기
+COPY_CHUNK_BYTES = 1024 * 1024
+
+
+def default_staging_dir() -> str:
+    """
+    결과 파일을 먼저 저장할 로컬 임시 폴더
+
+    Returns:
+        str: 임시 폴더 경로
+    """
+    return os.path.join(tempfile.gettempdir(), "pdfmask_staging")
+
+
+def file_digest(path: str) -> str:
+    """
+    파일 내용의 SHA-256 해시 계산
+
+    Args:
+        path: 파일 경로
+
+    Returns:
+        str: 16진수 해시
+    """
+    sha256 = hashlib.sha256()
+    with open(path, "rb") as f:
+        while chunk := f.read(COPY_CHUNK_BYTES):
+            sha256.update(chunk)
+    return sha256.hexdigest()
+
+
+def transfer_file(source_path: str, dest_path: str) -> Tuple[bool, str]:
+    """
+    로컬 파일을 최종 위치로 복사, 검증 후 이름 변경으로 확정
+
+    최종 폴더의 숨김 임시 파일(.이름.part)에 복사하고 디스크에 기록(fsync)한 뒤,
+    다시 읽어 크기와 해시가 원본과 같을 때만 최종 파일명으로 바꿉니다.
+    성공하면 로컬 파일은 삭제하고, 실패하면 다시 시도할 수 있도록 남겨 둡니다.
+
+    Args:
+        source_path: 로컬 파일 경로
+        dest_path: 최종 파일 경로
+
+    Returns:
+        Tuple[bool, str]: (성공 여부, 최종 파일 경로 또는 오류 메시지)
+    """
+    dest_dir = os.path.dirname(dest_path)
+    temp_path = os.path.join(dest_dir, f".{os.path.basename(dest_path)}.part")
+    try:
+        os.makedirs(dest_dir, exist_ok=True)
+
+        # 복사하면서 원본 해시 계산
+        sha256 = hashlib.sha256()
+        with open(source_path, "rb") as src, open(temp_path, "wb") as dst:
+            while chunk := src.read(COPY_CHUNK_BYTES):
+                sha256.update(chunk)
+                dst.write(chunk)
+            dst.flush()
+            os.fsync(dst.fileno())
+
+        # 최종 위치에 기록된 내용 검증
+        if os.path.getsize(temp_path) != os.path.getsize(source_path):
+            raise OSError("복사된 파일 크기가 원본과 다릅니다.")
+        if file_digest(temp_path) != sha256.hexdigest():
+            raise OSError("복사된 파일 내용이 원본과 다릅니다.")
+
+        os.replace(temp_path, dest_path)
+        os.remove(source_path)
+        return True, dest_path
+
+    except Exception as e:
+        if os.path.exists(temp_path):
+            try:
+                os.remove(temp_path)
+            except OSError:
+                pass
+        return False, f"파일 전송 실패: {str(e)}"
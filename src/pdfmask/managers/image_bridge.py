@@ -0,0 +1,89 @@
+"""
+PyMuPDF Pixmap → Qt 이미지 변환 모듈
+
+렌더링 결과 버퍼를 복사하지 않고 QImage로 감싸서 전달합니다.
+"""
+
+from typing import Optional
+
+import fitz  # PyMuPDF
+from PyQt6.QtGui import QImage
+
+
+def image_format_for(n: int, alpha: bool) -> Optional[QImage.Format]:
+    """
+    PyMuPDF 픽셀 구성에 그대로 대응하는 QImage 포맷 반환
+
+    MuPDF의 알파 채널은 premultiplied 형식입니다.
+
+    Args:
+        n: 픽셀당 채널 수 (알파 포함)
+        alpha: 알파 채널 포함 여부
+
+    Returns:
+        Optional[QImage.Format]: 대응하는 포맷 (없으면 None)
+    """
+    if not alpha:
+        if n == 1:
+            return QImage.Format.Format_Grayscale8
+        if n == 3:
+            return QImage.Format.Format_RGB888
+    elif n == 4:
+        return QImage.Format.Format_RGBA8888_Premultiplied
+    return None
+
+
+class PixmapImage(QImage):
+    """
+    fitz.Pixmap의 샘플 버퍼를 복사 없이 사용하는 QImage
+
+    원본 Pixmap을 참조로 보관하므로 이 객체가 살아 있는 동안 버퍼가 유지됩니다.
+    Qt 내부에서 만들어진 복사본(암시적 공유)은 원본 Pixmap을 붙잡지 않으므로,
+    이미지를 오래 보관할 때는 이 객체 자체를 보관해야 합니다.
+    """
+
+    def __init__(self, pix: fitz.Pixmap) -> None:
+        """
+        초기화
+
+        Args:
+            pix: 렌더링된 PyMuPDF Pixmap
+        """
+        image_format = image_format_for(pix.n, bool(pix.alpha))
+        if image_format is None:
+            # CMYK 등 Qt가 직접 표시할 수 없는 색공간만 RGB로 변환
+            pix = fitz.Pixmap(fitz.csRGB, pix)
+            image_format = image_format_for(pix.n, bool(pix.alpha))
+
+        super().__init__(pix.samples_mv, pix.width, pix.height, pix.stride, image_format)
+        self._pix = pix
+
+
+def image_from_samples(
+    samples: bytes,
+    width: int,
+    height: int,
+    stride: int,
+    n: int,
+    alpha: bool
+) -> QImage:
+    """
+    다른 프로세스에서 전달받은 샘플 데이터를 복사 없이 QImage로 감싸기
+
+    PyQt가 samples 객체의 참조를 보관하므로 별도 관리가 필요 없습니다.
+
+    Args:
+        samples: 픽셀 데이터
+        width: 너비
+        height: 높이
+        stride: 한 줄의 바이트 수
+        n: 픽셀당 채널 수 (알파 포함)
+        alpha: 알파 채널 포함 여부
+
+    Returns:
+        QImage: 이미지
+    """
+    image_format = image_format_for(n, alpha)
+    if image_format is None:
+        raise ValueError(f"지원하지 않는 픽셀 형식입니다: n={n}, alpha={alpha}")
+    return QImage(samples, width, height, stride, image_format)
@@ -1,74 +1,249 @@
 """
 마스킹 데이터 관리 모듈
+
+마스킹 데이터는 masks_data/masks.db(SQLite)에 (날짜, PDF 파일명, 문서 지문)을 키로 저장합니다.
+저장할 때마다 그날의 데이터 전체를 읽고 다시 쓰던 일자별 JSON 파일과 달리
+파일 하나의 행만 트랜잭션으로 기록하므로, 하루에 저장한 파일 수와 관계없이
+저장과 로드 시간이 일정합니다. 기존 일자별 JSON 파일은 처음 열 때 옮겨 옵니다.
+
+문서 지문(파일 크기 + 앞/뒤 1MB의 해시)으로 색인하므로, 파일을 열면 저장한 날짜나
+폴더, 파일명과 관계없이 같은 내용의 파일에 저장한 마스킹을 바로 찾고,
+폴더가 달라 이름만 같은 파일끼리는 서로의 마스킹을 불러오지 않습니다.
 """
 
 import os
 import json
+import glob
+import hashlib
+import sqlite3
 import fitz
+from contextlib import contextmanager
 from datetime import datetime
-from typing import Tuple, List
+from typing import Dict, Iterator, List, Optional, Set, Tuple
 
 from ..core.models import MaskEntry
 
 
+# 마스킹 데이터베이스 파일명
+MASK_DATABASE_NAME = "masks.db"
+
+# 데이터베이스로 옮긴 일자별 JSON 파일에 붙이는 확장자
+MIGRATED_SUFFIX = ".migrated"
+
+# 데이터베이스 구조 버전 (PRAGMA user_version)
+# 1: (날짜, 파일명) 키, 2: (날짜, 파일명, 문서 지문) 키 + 문서 지문 색인
+SCHEMA_VERSION = 2
+
+# 데이터베이스 구조 (파일별 마스킹 목록은 기존 JSON 파일과 같은 형식의 JSON 문자열)
+# 문서 지문을 알 수 없는 데이터(JSON에서 이전한 데이터 등)는 fingerprint가 빈 문자열
+SCHEMA = (
+    """
+    CREATE TABLE IF NOT EXISTS mask_files (
+        id INTEGER PRIMARY KEY,
+        date TEXT NOT NULL,
+        pdf_file TEXT NOT NULL,
+        fingerprint TEXT NOT NULL DEFAULT '',
+        saved_at TEXT NOT NULL,
+        mask_count INTEGER NOT NULL,
+        masks TEXT NOT NULL,
+        UNIQUE (date, pdf_file, fingerprint)
+    )
+    """,
+    "CREATE INDEX IF NOT EXISTS mask_files_fingerprint ON mask_files (fingerprint, saved_at)",
+)
+
+# 문서 지문 계산에 사용하는 파일 앞/뒤 크기 (byte)
+FINGERPRINT_CHUNK_SIZE = 1024 * 1024
+
+# 한 번의 IN (...) 조회에 넣는 최대 값 수 (SQLite 변수 개수 제한)
+QUERY_CHUNK_SIZE = 500
+
+
+def compute_fingerprint(pdf_path: str) -> str:
+    """
+    파일 내용으로 문서 지문 계산
+
+    파일 전체 대신 크기와 앞/뒤 1MB만 해시하므로 큰 스캔 문서도 바로 계산됩니다.
+    PDF는 끝부분에 상호 참조 테이블과 문서 ID가 있어 내용이 바뀌면 대부분 뒤쪽도 바뀝니다.
+
+    Args:
+        pdf_path: PDF 파일 경로
+
+    Returns:
+        str: "크기:해시" 형식의 문서 지문 (파일을 읽을 수 없으면 빈 문자열)
+    """
+    try:
+        size = os.path.getsize(pdf_path)
+        digest = hashlib.blake2b(str(size).encode(), digest_size=16)
+        with open(pdf_path, 'rb') as f:
+            digest.update(f.read(FINGERPRINT_CHUNK_SIZE))
+            if size > FINGERPRINT_CHUNK_SIZE:
+                f.seek(max(FINGERPRINT_CHUNK_SIZE, size - FINGERPRINT_CHUNK_SIZE))
+                digest.update(f.read(FINGERPRINT_CHUNK_SIZE))
+        return f"{size}:{digest.hexdigest()}"
+    except OSError:
+        return ""
+
+
 class MaskDataManager:
     """
-    마스킹 데이터를 일자별 JSON 파일로 저장/로드하는 클래스
+    마스킹 데이터를 날짜별로 SQLite 데이터베이스에 저장/로드하는 클래스
     """
-    
-    def __init__(self) -> None:
+
+    def __init__(self, masks_dir: Optional[str] = None) -> None:
         """
         초기화
-        
+
         프로젝트 루트의 masks_data 폴더에 데이터를 저장합니다.
+
+        Args:
+            masks_dir: 마스킹 데이터 폴더 (기본값: 프로젝트 루트의 masks_data)
         """
-        # 프로젝트 루트 경로 (src/pdfmask/managers/ -> src/ -> project_root/)
-        current_file = os.path.abspath(__file__)
-        managers_dir = os.path.dirname(current_file)  # managers/
-        pdfmask_dir = os.path.dirname(managers_dir)   # pdfmask/
-        src_dir = os.path.dirname(pdfmask_dir)        # src/
-        self.project_root = os.path.dirname(src_dir)  # project_root/
-        self.masks_dir = os.path.join(self.project_root, "masks_data")
-        
+        if masks_dir is None:
+            # 프로젝트 루트 경로 (src/pdfmask/managers/ -> src/ -> project_root/)
+            current_file = os.path.abspath(__file__)
+            managers_dir = os.path.dirname(current_file)  # managers/
+            pdfmask_dir = os.path.dirname(managers_dir)   # pdfmask/
+            src_dir = os.path.dirname(pdfmask_dir)        # src/
+            project_root = os.path.dirname(src_dir)       # project_root/
+            masks_dir = os.path.join(project_root, "masks_data")
+        self.masks_dir = masks_dir
+        self.database_path = os.path.join(self.masks_dir, MASK_DATABASE_NAME)
+
         # 마스킹 데이터 폴더 생성
         os.makedirs(self.masks_dir, exist_ok=True)
-    
-    def get_mask_file_path(self) -> str:
+
+        # 데이터베이스 준비 및 기존 JSON 파일 이전
+        try:
+            self._prepare_database()
+            self.migrate_json_files()
+        except Exception as e:
+            print(f"마스킹 데이터베이스 준비 오류: {str(e)}")
+
+    def _prepare_database(self) -> None:
+        """데이터베이스 생성 및 이전 버전 구조 변환"""
+        with self._transaction() as conn:
+            # WAL: 일괄 마스킹(batch)이 읽는 동안에도 화면에서 저장 가능
+            conn.execute("PRAGMA journal_mode=WAL")
+            version = conn.execute("PRAGMA user_version").fetchone()[0]
+            if version >= SCHEMA_VERSION:
+                return
+
+            conn.execute("BEGIN IMMEDIATE")
+            columns = [row[1] for row in conn.execute("PRAGMA table_info(mask_files)")]
+            if columns and "fingerprint" not in columns:
+                # 버전 1: (날짜, 파일명) 키 테이블을 새 구조로 복사 (문서 지문은 알 수 없음)
+                conn.execute("ALTER TABLE mask_files RENAME TO mask_files_v1")
+                for statement in SCHEMA:
+                    conn.execute(statement)
+                conn.execute(
+                    "INSERT INTO mask_files (date, pdf_file, saved_at, mask_count, masks) "
+                    "SELECT date, pdf_file, saved_at, mask_count, masks FROM mask_files_v1"
+                )
+                conn.execute("DROP TABLE mask_files_v1")
+            else:
+                for statement in SCHEMA:
+                    conn.execute(statement)
+            conn.execute(f"PRAGMA user_version = {SCHEMA_VERSION}")
+
+    @contextmanager
+    def _transaction(self) -> Iterator[sqlite3.Connection]:
+        """
+        데이터베이스 트랜잭션
+
+        작업마다 연결을 새로 만들므로 어느 스레드/프로세스에서도 사용할 수 있습니다.
+        with 블록을 벗어나면 커밋(오류 시 롤백)하고 연결을 닫습니다.
+
+        Yields:
+            sqlite3.Connection: 데이터베이스 연결
         """
-        일자별 마스킹 데이터 파일 경로 반환
-        
+        conn = sqlite3.connect(self.database_path, timeout=10)
+        try:
+            with conn:
+                yield conn
+        finally:
+            conn.close()
+
+    def get_mask_file_path(self, date_str: Optional[str] = None) -> str:
+        """
+        일자별 마스킹 데이터 JSON 파일 경로 반환 (데이터베이스 이전 전 형식)
+
+        Args:
+            date_str: 날짜 (YYYYMMDD, None이면 오늘)
+
         Returns:
             str: 마스킹 데이터 파일 경로 (masks_data/mask_data_YYYYMMDD.json)
         """
-        today_str = datetime.now().strftime("%Y%m%d")
-        mask_filename = f"mask_data_{today_str}.json"
+        if date_str is None:
+            date_str = datetime.now().strftime("%Y%m%d")
+        mask_filename = f"mask_data_{date_str}.json"
         return os.path.join(self.masks_dir, mask_filename)
-    
-    def save_masks(self, pdf_path: str, masks: List[MaskEntry]) -> Tuple[bool, str]:
+
+    def migrate_json_files(self) -> int:
+        """
+        일자별 JSON 파일의 마스킹 데이터를 데이터베이스로 이전
+
+        파일 하나를 한 트랜잭션으로 옮긴 뒤 파일명 뒤에 .migrated를 붙여 보관합니다.
+        이미 데이터베이스에 있는 (날짜, 파일명)은 데이터베이스 쪽이 더 최근이므로
+        덮어쓰지 않습니다 (이름 변경 전에 종료되어 다시 이전하는 경우 포함).
+
+        Returns:
+            int: 이전한 파일별 마스킹 데이터 수
+        """
+        migrated = 0
+        pattern = os.path.join(self.masks_dir, "mask_data_*.json")
+        for json_path in sorted(glob.glob(pattern)):
+            date_str = os.path.basename(json_path)[len("mask_data_"):-len(".json")]
+            try:
+                with open(json_path, 'r', encoding='utf-8') as f:
+                    data = json.load(f)
+
+                rows = [
+                    (
+                        date_str,
+                        file_entry['pdf_file'],
+                        file_entry.get('saved_at', ''),
+                        len(file_entry.get('masks', [])),
+                        json.dumps(file_entry.get('masks', []), ensure_ascii=False),
+                    )
+                    for file_entry in data.get('files', [])
+                ]
+                with self._transaction() as conn:
+                    conn.executemany(
+                        "INSERT OR IGNORE INTO mask_files (date, pdf_file, saved_at, mask_count, masks) "
+                        "VALUES (?, ?, ?, ?, ?)",
+                        rows
+                    )
+                os.replace(json_path, json_path + MIGRATED_SUFFIX)
+                migrated += len(rows)
+                print(f"마스킹 데이터 이전 완료: {os.path.basename(json_path)} ({len(rows)}개 파일)")
+            except Exception as e:
+                print(f"마스킹 데이터 이전 오류 ({os.path.basename(json_path)}): {str(e)}")
+        return migrated
+
+    def save_masks(
+        self,
+        pdf_path: str,
+        masks: List[MaskEntry],
+        fingerprint: Optional[str] = None
+    ) -> Tuple[bool, str]:
         """
-        마스킹 데이터를 일자별 JSON 파일에 추가 저장
-        
+        마스킹 데이터를 오늘 날짜로 저장 (같은 파일의 데이터가 있으면 교체)
+
+        같은 파일은 (날짜, 파일명, 문서 지문)이 모두 같은 경우이므로,
+        폴더가 다르고 이름만 같은 파일의 데이터는 덮어쓰지 않습니다.
+
         Args:
             pdf_path: PDF 파일 경로
             masks: 마스킹 데이터 리스트
-            
+            fingerprint: 이미 계산한 문서 지문 (None이면 여기서 계산)
+
         Returns:
-            Tuple[bool, str]: (성공 여부, 메시지 또는 파일 경로)
+            Tuple[bool, str]: (성공 여부, 메시지 또는 데이터베이스 경로)
         """
         try:
-            mask_file = self.get_mask_file_path()
             pdf_filename = os.path.basename(pdf_path)
-            
-            # 기존 데이터 로드
-            if os.path.exists(mask_file):
-                with open(mask_file, 'r', encoding='utf-8') as f:
-                    data = json.load(f)
-            else:
-                data = {
-                    'date': datetime.now().strftime("%Y-%m-%d"),
-                    'files': []
-                }
-            
+
             # MaskEntry를 딕셔너리로 변환
             masks_data = []
             for mask in masks:
@@ -82,119 +257,269 @@ class MaskDataManager:
                     },
                     'note': mask.note,
                 })
-            
-            # 파일별 데이터 구성
-            file_data = {
-                'pdf_file': pdf_filename,
-                'saved_at': datetime.now().isoformat(),
-                'mask_count': len(masks),
-                'masks': masks_data,
-            }
-            
-            # 기존 파일 데이터가 있으면 업데이트, 없으면 추가
-            file_found = False
-            for i, file_entry in enumerate(data['files']):
-                if file_entry['pdf_file'] == pdf_filename:
-                    data['files'][i] = file_data
-                    file_found = True
-                    break
-            
-            if not file_found:
-                data['files'].append(file_data)
-            
-            # JSON으로 저장
-            with open(mask_file, 'w', encoding='utf-8') as f:
-                json.dump(data, f, indent=2, ensure_ascii=False)
-            
-            return True, mask_file
-            
+
+            # 파일 하나의 행만 교체 (트랜잭션)
+            if fingerprint is None:
+                fingerprint = compute_fingerprint(pdf_path)
+            now = datetime.now()
+            with self._transaction() as conn:
+                conn.execute(
+                    "INSERT INTO mask_files (date, pdf_file, fingerprint, saved_at, mask_count, masks) "
+                    "VALUES (?, ?, ?, ?, ?, ?) "
+                    "ON CONFLICT (date, pdf_file, fingerprint) DO UPDATE SET "
+                    "saved_at = excluded.saved_at, mask_count = excluded.mask_count, masks = excluded.masks",
+                    (
+                        now.strftime("%Y%m%d"),
+                        pdf_filename,
+                        fingerprint,
+                        now.isoformat(),
+                        len(masks),
+                        json.dumps(masks_data, ensure_ascii=False),
+                    )
+                )
+
+            return True, self.database_path
+
         except Exception as e:
             return False, f"마스킹 데이터 저장 실패: {str(e)}"
-    
+
     def load_masks(self, pdf_path: str) -> Tuple[bool, List[MaskEntry], str]:
         """
-        일자별 JSON 파일에서 특정 PDF의 마스킹 데이터 로드
-        
+        특정 PDF에 저장된 마스킹 데이터 로드
+
+        문서 지문 색인에서 같은 내용의 파일에 가장 최근 저장한 데이터를 찾으므로
+        저장한 날짜, 폴더, 파일명과 관계없이 불러옵니다. 문서 지문이 없는
+        이전 데이터(JSON에서 이전한 데이터)는 기존처럼 오늘 날짜의 같은 파일명에서 찾습니다.
+
         Args:
             pdf_path: PDF 파일 경로
-            
+
         Returns:
             Tuple[bool, List[MaskEntry], str]: (성공 여부, 마스킹 리스트, 메시지)
         """
         try:
-            mask_file = self.get_mask_file_path()
             pdf_filename = os.path.basename(pdf_path)
-            
-            if not os.path.exists(mask_file):
-                return True, [], "오늘 날짜의 마스킹 데이터 없음"
-            
-            with open(mask_file, 'r', encoding='utf-8') as f:
-                data = json.load(f)
-            
-            # 해당 PDF 파일의 데이터 찾기
-            file_data = None
-            for file_entry in data.get('files', []):
-                if file_entry['pdf_file'] == pdf_filename:
-                    file_data = file_entry
-                    break
-            
-            if not file_data:
+            fingerprint = compute_fingerprint(pdf_path)
+
+            with self._transaction() as conn:
+                row = None
+                if fingerprint:
+                    row = conn.execute(
+                        "SELECT date, masks FROM mask_files WHERE fingerprint = ? "
+                        "ORDER BY saved_at DESC LIMIT 1",
+                        (fingerprint,)
+                    ).fetchone()
+                if row is None:
+                    row = conn.execute(
+                        "SELECT date, masks FROM mask_files "
+                        "WHERE date = ? AND pdf_file = ? AND fingerprint = ''",
+                        (datetime.now().strftime("%Y%m%d"), pdf_filename)
+                    ).fetchone()
+
+            if row is None:
                 return True, [], f"{pdf_filename}의 마스킹 데이터 없음"
-            
+
             # 딕셔너리를 MaskEntry로 변환
-            masks = []
-            for mask_data in file_data.get('masks', []):
-                rect_data = mask_data['rect']
-                rect = fitz.Rect(
-                    rect_data['x0'],
-                    rect_data['y0'],
-                    rect_data['x1'],
-                    rect_data['y1']
-                )
-                mask = MaskEntry(
-                    page_index=mask_data['page_index'],
-                    rect=rect,
-                    note=mask_data.get('note', '')
-                )
-                masks.append(mask)
-            
-            return True, masks, f"{len(masks)}개의 마스킹 데이터 로드 완료"
-            
+            date_str, masks_json = row
+            masks = self._to_mask_entries(json.loads(masks_json))
+
+            return True, masks, f"{len(masks)}개의 마스킹 데이터 로드 완료 ({date_str} 저장)"
+
         except Exception as e:
             return False, [], f"마스킹 데이터 로드 실패: {str(e)}"
-    
+
+    def load_all_masks(
+        self,
+        date_str: Optional[str] = None
+    ) -> Tuple[bool, Dict[str, List[MaskEntry]], str]:
+        """
+        특정 날짜에 저장된 모든 PDF의 마스킹 데이터 로드
+
+        폴더가 달라 이름이 같은 파일이 여러 개 저장된 경우 가장 최근 저장한 데이터를 반환합니다.
+        파일별로 정확히 찾으려면 load_masks_for_files()를 사용합니다.
+
+        Args:
+            date_str: 날짜 (YYYYMMDD, None이면 오늘)
+
+        Returns:
+            Tuple[bool, Dict[str, List[MaskEntry]], str]:
+                (성공 여부, PDF 파일명 → 마스킹 리스트, 메시지)
+        """
+        try:
+            if date_str is None:
+                date_str = datetime.now().strftime("%Y%m%d")
+
+            with self._transaction() as conn:
+                rows = conn.execute(
+                    "SELECT pdf_file, masks FROM mask_files WHERE date = ? ORDER BY pdf_file, saved_at",
+                    (date_str,)
+                ).fetchall()
+
+            if not rows:
+                return True, {}, f"{date_str} 날짜의 마스킹 데이터 없음"
+
+            masks_by_file = {
+                pdf_file: self._to_mask_entries(json.loads(masks))
+                for pdf_file, masks in rows
+            }
+
+            return True, masks_by_file, f"{len(masks_by_file)}개 파일의 마스킹 데이터 로드 완료"
+
+        except Exception as e:
+            return False, {}, f"마스킹 데이터 로드 실패: {str(e)}"
+
+    def load_masks_for_files(
+        self,
+        pdf_paths: List[str],
+        date_str: Optional[str] = None
+    ) -> Tuple[bool, Dict[str, List[MaskEntry]], str]:
+        """
+        특정 날짜에 저장된 마스킹 데이터를 파일별로 찾기 (일괄 마스킹용)
+
+        파일마다 문서 지문이 같은 데이터를 찾고, 없으면 문서 지문이 없는 이전 데이터 중
+        파일명이 같은 데이터를 사용합니다. 이름만 같고 내용이 다른 파일에는 적용하지 않습니다.
+
+        Args:
+            pdf_paths: PDF 파일 경로 목록
+            date_str: 날짜 (YYYYMMDD, None이면 오늘)
+
+        Returns:
+            Tuple[bool, Dict[str, List[MaskEntry]], str]:
+                (성공 여부, PDF 파일 경로 → 마스킹 리스트, 메시지)
+        """
+        try:
+            if date_str is None:
+                date_str = datetime.now().strftime("%Y%m%d")
+
+            with self._transaction() as conn:
+                rows = conn.execute(
+                    "SELECT pdf_file, fingerprint, masks FROM mask_files WHERE date = ? ORDER BY saved_at",
+                    (date_str,)
+                ).fetchall()
+
+            # 문서 지문 → 마스킹, 파일명 → 마스킹 (문서 지문 없는 데이터), 최근 저장한 데이터 우선
+            by_fingerprint = {fingerprint: masks for _, fingerprint, masks in rows if fingerprint}
+            by_name = {pdf_file: masks for pdf_file, fingerprint, masks in rows if not fingerprint}
+
+            masks_by_path = {}
+            for pdf_path in pdf_paths:
+                masks_json = by_fingerprint.get(compute_fingerprint(pdf_path))
+                if masks_json is None:
+                    masks_json = by_name.get(os.path.basename(pdf_path))
+                if masks_json is not None:
+                    masks_by_path[pdf_path] = self._to_mask_entries(json.loads(masks_json))
+
+            return True, masks_by_path, f"{len(masks_by_path)}개 파일의 마스킹 데이터 로드 완료"
+
+        except Exception as e:
+            return False, {}, f"마스킹 데이터 로드 실패: {str(e)}"
+
+    def find_files_with_masks(
+        self,
+        pdf_paths: List[str],
+        fingerprints: Optional[Dict[str, str]] = None
+    ) -> Tuple[bool, Set[str], str]:
+        """
+        저장된 마스킹 데이터가 있는 파일 찾기
+
+        load_masks()와 같은 기준(문서 지문은 모든 날짜, 문서 지문이 없는 이전 데이터는
+        오늘 날짜의 같은 파일명)으로 찾으므로, 파일을 열었을 때 마스킹이 불러와지는 파일을 반환합니다.
+
+        Args:
+            pdf_paths: PDF 파일 경로 목록
+            fingerprints: 이미 계산한 파일별 문서 지문 (없는 파일은 여기서 계산)
+
+        Returns:
+            Tuple[bool, Set[str], str]: (성공 여부, 마스킹 데이터가 있는 PDF 파일 경로, 메시지)
+        """
+        try:
+            known = fingerprints or {}
+            fingerprints = {
+                pdf_path: known[pdf_path] if pdf_path in known else compute_fingerprint(pdf_path)
+                for pdf_path in pdf_paths
+            }
+            saved_fingerprints: Set[str] = set()
+            saved_names: Set[str] = set()
+
+            with self._transaction() as conn:
+                values = sorted({fingerprint for fingerprint in fingerprints.values() if fingerprint})
+                for start in range(0, len(values), QUERY_CHUNK_SIZE):
+                    chunk = values[start:start + QUERY_CHUNK_SIZE]
+                    saved_fingerprints.update(row[0] for row in conn.execute(
+                        f"SELECT DISTINCT fingerprint FROM mask_files "
+                        f"WHERE fingerprint IN ({', '.join('?' * len(chunk))})",
+                        chunk
+                    ))
+
+                names = sorted({os.path.basename(pdf_path) for pdf_path in pdf_paths})
+                for start in range(0, len(names), QUERY_CHUNK_SIZE):
+                    chunk = names[start:start + QUERY_CHUNK_SIZE]
+                    saved_names.update(row[0] for row in conn.execute(
+                        f"SELECT pdf_file FROM mask_files WHERE date = ? AND fingerprint = '' "
+                        f"AND pdf_file IN ({', '.join('?' * len(chunk))})",
+                        [datetime.now().strftime("%Y%m%d"), *chunk]
+                    ))
+
+            saved_paths = {
+                pdf_path for pdf_path, fingerprint in fingerprints.items()
+                if fingerprint in saved_fingerprints or os.path.basename(pdf_path) in saved_names
+            }
+            return True, saved_paths, f"{len(saved_paths)}개 파일의 마스킹 데이터 있음"
+
+        except Exception as e:
+            return False, set(), f"마스킹 데이터 조회 실패: {str(e)}"
+
+    def _to_mask_entries(self, masks_data: List[dict]) -> List[MaskEntry]:
+        """
+        파일별 마스킹 데이터(JSON)를 MaskEntry 리스트로 변환
+
+        Args:
+            masks_data: 마스킹 딕셔너리 리스트
+
+        Returns:
+            List[MaskEntry]: 마스킹 리스트
+        """
+        masks = []
+        for mask_data in masks_data:
+            rect_data = mask_data['rect']
+            rect = fitz.Rect(
+                rect_data['x0'],
+                rect_data['y0'],
+                rect_data['x1'],
+                rect_data['y1']
+            )
+            mask = MaskEntry(
+                page_index=mask_data['page_index'],
+                rect=rect,
+                note=mask_data.get('note', '')
+            )
+            masks.append(mask)
+        return masks
+
     def delete_masks(self, pdf_path: str) -> Tuple[bool, str]:
         """
-        일자별 JSON 파일에서 특정 PDF의 마스킹 데이터 삭제
-        
+        오늘 날짜로 저장된 특정 PDF의 마스킹 데이터 삭제
+
         Args:
             pdf_path: PDF 파일 경로
-            
+
         Returns:
             Tuple[bool, str]: (성공 여부, 메시지)
         """
         try:
-            mask_file = self.get_mask_file_path()
             pdf_filename = os.path.basename(pdf_path)
-            
-            if not os.path.exists(mask_file):
-                return True, "마스킹 데이터 파일 없음"
-            
-            with open(mask_file, 'r', encoding='utf-8') as f:
-                data = json.load(f)
-            
-            # 해당 PDF 파일 데이터 제거
-            original_count = len(data.get('files', []))
-            data['files'] = [f for f in data.get('files', []) if f['pdf_file'] != pdf_filename]
-            
-            if len(data['files']) < original_count:
-                # 데이터 저장
-                with open(mask_file, 'w', encoding='utf-8') as f:
-                    json.dump(data, f, indent=2, ensure_ascii=False)
+
+            with self._transaction() as conn:
+                deleted = conn.execute(
+                    "DELETE FROM mask_files WHERE date = ? AND pdf_file = ? AND fingerprint IN (?, '')",
+                    (datetime.now().strftime("%Y%m%d"), pdf_filename, compute_fingerprint(pdf_path))
+                ).rowcount
+
+            if deleted:
                 return True, "마스킹 데이터 삭제 완료"
             else:
                 return True, "해당 파일의 마스킹 데이터 없음"
-                
+
         except Exception as e:
             return False, f"마스킹 데이터 삭제 실패: {str(e)}"
 
@@ -2,11 +2,356 @@
 PDF 문서 관리 모듈
 """
 
+import os
+import itertools
 import fitz  # PyMuPDF
-from typing import Optional
-from PyQt6.QtGui import QPixmap, QImage
+from typing import Any, Dict, Iterable, List, Optional, Tuple
+from PyQt6.QtGui import QImage
 
 from ..core.models import MaskEntry
+from ..core.mask_store import MaskStore
+from .render_cache import (
+    RenderCache,
+    RenderKey,
+    DisplayListCache,
+    make_render_key,
+    DEFAULT_RENDER_CACHE_BYTES,
+    DEFAULT_DISPLAY_LIST_PAGES,
+)
+from .render_pool import RenderWorkerPool, COLORSPACES
+from .image_bridge import PixmapImage
+from .thumbnail_manager import ThumbnailManager
+from .suggestion_manager import SuggestionManager
+from .verification import verify_file
+
+# 문서 식별자 발급기 (문서를 열 때마다 새 값)
+_doc_ids = itertools.count(1)
+
+# 타일 렌더링 시 타일 한 변의 픽셀 크기
+TILE_SIZE = 512
+
+# 전체 페이지 렌더링 대신 타일 렌더링으로 전환하는 픽셀 수 기준 (약 4 메가픽셀)
+DEFAULT_TILE_THRESHOLD_PIXELS = 4 * 1024 * 1024
+
+# 전체 해상도 렌더링 전에 먼저 보여줄 미리보기 배율
+PREVIEW_ZOOM = 0.3
+
+# 결과 파일 저장 프로필: 이름 → doc.save() 옵션
+SAVE_PROFILES: Dict[str, Dict[str, Any]] = {
+    # 압축 없이 바로 저장 (가장 빠름, 기존 저장 방식)
+    "fast": {},
+    # 사용하지 않는 객체 제거 및 중복 병합, 스트림 압축, 객체 스트림 (보관용, 가장 작음)
+    "compact": {
+        "garbage": 4,
+        "deflate": True,
+        "deflate_images": True,
+        "deflate_fonts": True,
+        "use_objstms": True,
+    },
+    # 웹 배포용: 내용 스트림 정리 및 압축, 구형 뷰어 호환을 위해 객체 스트림 미사용
+    # (MuPDF 1.23부터 선형화(linear) 저장을 지원하지 않아 대신 사용)
+    "web": {
+        "garbage": 3,
+        "clean": True,
+        "deflate": True,
+        "deflate_images": True,
+        "deflate_fonts": True,
+    },
+}
+
+# 저장 프로필 설명 (화면 메뉴, 명령줄 도움말)
+SAVE_PROFILE_DESCRIPTIONS: Dict[str, str] = {
+    "fast": "빠르게 저장 (압축 안 함)",
+    "compact": "용량 최소화 (보관용)",
+    "web": "웹 배포용 (정리 + 압축)",
+}
+
+# 기본 저장 프로필
+DEFAULT_SAVE_PROFILE = "fast"
+
+# 마스킹 채움 색 (0~1 RGB, 흰색) - 결과 검증에서도 같은 색으로 확인
+REDACTION_FILL = (1, 1, 1)
+
+# 이 페이지 수 이상인 파일은 페이지 묶음 단위로 나누어 처리 (메모리 사용량 제한)
+CHUNKED_PAGE_THRESHOLD = 200
+
+# 나누어 처리할 때 한 번에 처리하는 페이지 수
+# (스캔 페이지 기준 묶음 하나에 수백 MB, 페이지 수를 늘리면 메모리 사용량도 비례해서 늘어남)
+DEFAULT_CHUNK_PAGES = 16
+
+# 이어 붙이기(incremental) 저장에서 사용할 수 있는 저장 옵션
+INCREMENTAL_SAVE_OPTIONS = ("deflate", "deflate_images", "deflate_fonts")
+
+
+def scaled_size(width: float, height: float, zoom: float) -> Tuple[int, int]:
+    """
+    PDF 페이지 크기를 지정된 배율로 렌더링했을 때의 픽셀 크기 계산
+    
+    Page.get_pixmap()이 만드는 Pixmap 크기와 같습니다.
+    
+    Args:
+        width: PDF 페이지 너비
+        height: PDF 페이지 높이
+        zoom: 확대/축소 배율
+        
+    Returns:
+        Tuple[int, int]: (너비, 높이)
+    """
+    irect = (fitz.Rect(0, 0, width, height) * fitz.Matrix(zoom, zoom)).round()
+    return irect.width, irect.height
+
+
+def apply_masks_to_document(doc: fitz.Document, masks: Iterable[MaskEntry]) -> Tuple[int, int]:
+    """
+    문서에 마스킹(Redaction)을 적용
+    
+    GUI 저장과 일괄 마스킹(batch)이 함께 사용하는 공통 처리입니다.
+    마스킹 영역은 흰색으로 채워지고 그 아래 내용은 영구적으로 제거됩니다.
+    
+    MuPDF는 내용 스트림을 한 번 훑으면서 마스킹과 겹치는 이미지만 픽셀을 지우므로
+    이미지/도형과의 겹침을 미리 계산하지 않습니다 (미리 계산하면 같은 내용 스트림을
+    한 번 더 읽게 되어 오히려 느려짐). 대신 픽셀을 지운 이미지가 있는 페이지 수를
+    반환하여, 저장 시 압축 없이 다시 기록된 이미지만 압축할 수 있게 합니다.
+    
+    Args:
+        doc: PDF 문서
+        masks: 적용할 마스킹 (MaskStore 또는 마스킹 정보 리스트)
+        
+    Returns:
+        Tuple[int, int]: (마스킹이 적용된 페이지 수, 이미지 픽셀을 지운 페이지 수)
+    """
+    # 페이지별로 묶인 저장소 사용
+    store = masks if isinstance(masks, MaskStore) else MaskStore(masks)
+    
+    applied_pages = 0
+    image_pages = 0
+    for page_num in store.pages():
+        if page_num < 0 or page_num >= len(doc):
+            continue
+        
+        page = doc.load_page(page_num)
+        
+        # 각 마스크에 대해 redaction annotation 추가
+        for mask in store.for_page(page_num):
+            # 흰색으로 마스킹 (1, 1, 1) = RGB white
+            page.add_redact_annot(mask.rect, fill=REDACTION_FILL)
+        
+        # 페이지별로 redaction 적용 (픽셀을 지운 이미지는 새 xref로 교체됨)
+        images_before = {image[0] for image in page.get_images(full=True)}
+        page.apply_redactions()
+        applied_pages += 1
+        if {image[0] for image in page.get_images(full=True)} - images_before:
+            image_pages += 1
+    
+    return applied_pages, image_pages
+
+
+def get_save_options(profile: str, redacted: bool = False, images_blanked: bool = False) -> Dict[str, Any]:
+    """
+    저장 프로필의 doc.save() 옵션 반환
+
+    Redaction을 적용하면 페이지는 새 내용 스트림과 이미지를 가리키고
+    원본 내용 스트림(지운 글자 포함)과 원본 이미지는 참조만 끊긴 채 문서에 남으므로,
+    마스킹을 적용한 문서는 프로필과 관계없이 사용하지 않는 객체를 제거합니다.
+    또한 픽셀을 지운 이미지는 압축 없이 다시 기록되어 스캔 페이지 한 장이
+    수십 MB가 되므로, 압축되지 않은 이미지만 압축합니다 (원래 압축된 이미지는 그대로 둠).
+
+    Args:
+        profile: 저장 프로필 이름 (SAVE_PROFILES)
+        redacted: 마스킹을 적용한 페이지가 있는지 여부
+        images_blanked: 이미지 픽셀을 지운 페이지가 있는지 여부
+
+    Returns:
+        Dict[str, Any]: doc.save() 옵션
+    """
+    options = dict(SAVE_PROFILES[profile])
+    if redacted or images_blanked:
+        # 참조가 끊긴 원본 내용 스트림과 이미지 제거
+        options["garbage"] = max(options.get("garbage", 0), 1)
+    if images_blanked:
+        options["deflate_images"] = True
+    return options
+
+
+# 작업자 프로세스로 전달하는 마스킹 정보: (페이지 인덱스, (x0, y0, x1, y1))
+MaskRecord = Tuple[int, Tuple[float, float, float, float]]
+
+
+def to_mask_records(masks: Iterable[MaskEntry]) -> List[MaskRecord]:
+    """
+    마스킹 정보를 작업자 프로세스로 전달할 수 있는 형태로 변환
+
+    Args:
+        masks: 마스킹 정보
+
+    Returns:
+        List[MaskRecord]: (페이지 인덱스, (x0, y0, x1, y1)) 리스트
+    """
+    return [
+        (mask.page_index, (mask.rect.x0, mask.rect.y0, mask.rect.x1, mask.rect.y1))
+        for mask in masks
+    ]
+
+
+def save_masked_in_chunks(
+    doc: fitz.Document,
+    masks: Iterable[MaskEntry],
+    output_path: str,
+    profile: str = DEFAULT_SAVE_PROFILE,
+    chunk_pages: int = DEFAULT_CHUNK_PAGES
+) -> Tuple[int, int]:
+    """
+    페이지 묶음 단위로 마스킹을 적용하여 저장 (메모리 사용량 제한)
+
+    문서 전체에 마스킹을 적용한 뒤 한 번에 저장하면, 픽셀을 지운 이미지가 압축되지 않은
+    상태로 저장할 때까지 모두 메모리에 남아 수천 페이지 스캔 문서는 수 GB를 사용합니다.
+    여기서는 묶음마다 페이지를 새 문서로 복사(insert_pdf)하여 마스킹을 적용하고,
+    중간 파일 끝에 이어 붙여(incremental) 저장한 뒤 닫으므로 메모리 사용량이
+    전체 페이지 수가 아니라 묶음 크기에 비례합니다.
+
+    이어 붙여 저장할 때마다 페이지 트리 등이 새로 기록되어 중간 파일은 묶음 수에 따라
+    점점 커지므로, 마지막에 중간 파일을 저장 프로필의 전체 옵션으로 한 번 다시 저장하여
+    결과 파일을 만듭니다 (중간 파일의 이미지는 이미 압축되어 있어 메모리 사용량은 크지 않음).
+    문서 정보와 목차는 유지되지만, 다른 묶음의 페이지를 가리키는 문서 내부 링크는 유지되지 않습니다.
+
+    Args:
+        doc: 원본 PDF 문서 (변경하지 않음)
+        masks: 적용할 마스킹 정보
+        output_path: 결과 파일 경로
+        profile: 저장 프로필 이름 (SAVE_PROFILES)
+        chunk_pages: 한 번에 처리할 페이지 수
+
+    Returns:
+        Tuple[int, int]: (마스킹이 적용된 페이지 수, 이미지 픽셀을 지운 페이지 수)
+    """
+    store = masks if isinstance(masks, MaskStore) else MaskStore(masks)
+    page_count = len(doc)
+
+    # 묶음을 이어 붙여 저장할 중간 파일
+    chunks_path = output_path + ".chunks"
+
+    applied_pages = 0
+    image_pages = 0
+    try:
+        for start in range(0, page_count, chunk_pages):
+            end = min(start + chunk_pages, page_count)
+
+            # 묶음의 페이지만 새 문서로 복사하고 묶음 안의 페이지 번호로 마스킹 적용
+            chunk = fitz.open()
+            try:
+                chunk.insert_pdf(doc, from_page=start, to_page=end - 1)
+                chunk_masks = [
+                    MaskEntry(page_index=page_index - start, rect=mask.rect)
+                    for page_index in range(start, end)
+                    for mask in store.for_page(page_index)
+                ]
+                chunk_applied, chunk_images = apply_masks_to_document(chunk, chunk_masks)
+                applied_pages += chunk_applied
+                image_pages += chunk_images
+                options = {
+                    key: value
+                    for key, value in get_save_options(profile, chunk_applied > 0, chunk_images > 0).items()
+                    if key in INCREMENTAL_SAVE_OPTIONS
+                }
+
+                if start == 0:
+                    chunk.save(chunks_path, garbage=1, **options)
+                else:
+                    output = fitz.open(chunks_path)
+                    try:
+                        output.insert_pdf(chunk)
+                        output.save(chunks_path, incremental=True, encryption=fitz.PDF_ENCRYPT_KEEP, **options)
+                    finally:
+                        output.close()
+            finally:
+                chunk.close()
+
+            # 묶음을 처리하며 디코딩한 이미지, 글꼴 등의 캐시 비우기
+            fitz.TOOLS.store_shrink(100)
+
+        # 문서 정보와 목차 복사 (insert_pdf는 페이지만 복사함) 후 저장 프로필로 한 번에 다시 저장
+        # (이어 붙여 저장하며 쌓인 이전 버전의 페이지 트리 등은 결과 파일에 기록되지 않음)
+        toc = doc.get_toc(simple=False)
+        output = fitz.open(chunks_path)
+        try:
+            output.set_metadata({key: value for key, value in doc.metadata.items() if value})
+            if toc:
+                output.set_toc(toc)
+            output.save(output_path, **get_save_options(profile, applied_pages > 0, image_pages > 0))
+        finally:
+            output.close()
+    finally:
+        if os.path.exists(chunks_path):
+            os.remove(chunks_path)
+
+    return applied_pages, image_pages
+
+
+def redact_file(
+    pdf_path: str,
+    mask_records: List[MaskRecord],
+    output_path: str,
+    password: str = "",
+    profile: str = DEFAULT_SAVE_PROFILE,
+    chunk_pages: int = 0
+) -> Tuple[bool, str]:
+    """
+    작업자 프로세스에서 PDF 파일 하나에 마스킹을 적용하여 저장
+
+    화면에 열린 문서와 별개로 파일을 직접 열어 처리합니다.
+    임시 파일(.part)에 저장한 뒤 이름을 바꾸므로, 중간에 종료되어도
+    완성되지 않은 결과 파일이 남지 않고 같은 작업을 다시 실행할 수 있습니다.
+    이름을 바꾸기 전에 임시 파일을 다시 열어 마스킹 영역에 글자나 내용이
+    남지 않았는지 검증하고, 검증에 실패하면 결과 파일을 만들지 않습니다.
+    페이지가 많은 파일은 메모리 사용량을 제한하기 위해 페이지 묶음 단위로 처리합니다.
+
+    Args:
+        pdf_path: 원본 PDF 경로
+        mask_records: 적용할 마스킹 정보
+        output_path: 결과 파일 경로
+        password: PDF 암호 (암호화된 PDF인 경우)
+        profile: 저장 프로필 이름 (SAVE_PROFILES)
+        chunk_pages: 한 번에 처리할 페이지 수
+            (0이면 CHUNKED_PAGE_THRESHOLD 페이지 이상인 파일만 DEFAULT_CHUNK_PAGES씩 처리)
+
+    Returns:
+        Tuple[bool, str]: (성공 여부, 메시지)
+    """
+    temp_path = output_path + ".part"
+    try:
+        doc = fitz.open(pdf_path)
+        try:
+            if doc.is_encrypted and not doc.authenticate(password):
+                return False, "암호가 필요하거나 올바르지 않습니다."
+
+            masks = [
+                MaskEntry(page_index=page_index, rect=fitz.Rect(rect))
+                for page_index, rect in mask_records
+            ]
+            if chunk_pages <= 0 and len(doc) >= CHUNKED_PAGE_THRESHOLD:
+                chunk_pages = DEFAULT_CHUNK_PAGES
+            if 0 < chunk_pages < len(doc):
+                applied_pages, image_pages = save_masked_in_chunks(
+                    doc, masks, temp_path, profile, chunk_pages
+                )
+            else:
+                applied_pages, image_pages = apply_masks_to_document(doc, masks)
+                doc.save(temp_path, **get_save_options(profile, applied_pages > 0, image_pages > 0))
+        finally:
+            doc.close()
+
+        verification = verify_file(temp_path, masks, password, REDACTION_FILL)
+        if not verification.passed:
+            os.remove(temp_path)
+            return False, verification.summary()
+
+        os.replace(temp_path, output_path)
+        return True, f"{applied_pages}개 페이지, {len(mask_records)}개 마스킹 적용, {verification.summary()}"
+
+    except Exception as e:
+        if os.path.exists(temp_path):
+            os.remove(temp_path)
+        return False, str(e)
 
 
 class PasswordRequiredException(Exception):
@@ -21,12 +366,52 @@ class PdfDocumentManager:
     PyMuPDF를 사용하여 PDF 파일을 처리합니다.
     """
 
-    def __init__(self) -> None:
+    def __init__(
+        self,
+        render_cache_bytes: int = DEFAULT_RENDER_CACHE_BYTES,
+        prefetch_radius: int = 2,
+        render_workers: int = 2,
+        tile_threshold_pixels: int = DEFAULT_TILE_THRESHOLD_PIXELS,
+        display_list_pages: int = DEFAULT_DISPLAY_LIST_PAGES
+    ) -> None:
         """
         초기화
+        
+        Args:
+            render_cache_bytes: 렌더링 캐시 메모리 예산 (바이트)
+            prefetch_radius: 현재 페이지 앞뒤로 미리 렌더링할 페이지 수
+            render_workers: 백그라운드 렌더링 작업자 프로세스 수
+            tile_threshold_pixels: 타일 렌더링으로 전환할 페이지 픽셀 수
+            display_list_pages: 해석된 페이지(DisplayList)를 보관할 페이지 수
         """
         self.doc: Optional[fitz.Document] = None
         self.file_path: Optional[str] = None
+        self.password: str = ""
+        
+        # 현재 열린 문서의 식별자 (렌더링 캐시 키에 사용)
+        self.doc_id: int = 0
+        
+        # 페이지 크기 캐시 (연속 스크롤 보기의 자리 표시에 사용)
+        self._page_sizes: Optional[List[Tuple[float, float]]] = None
+        
+        # 렌더링된 페이지 캐시
+        self.render_cache = RenderCache(render_cache_bytes)
+        
+        # 해석된 페이지 캐시 (배율 변경, 타일 렌더링 시 재사용)
+        self.display_lists = DisplayListCache(display_list_pages)
+        
+        # 이웃 페이지 미리 렌더링
+        self.prefetch_radius = prefetch_radius
+        self.render_pool = RenderWorkerPool(self.render_cache, render_workers)
+        
+        # 페이지 썸네일 (디스크 캐시, 미리보기로도 사용)
+        self.thumbnails = ThumbnailManager(self.render_pool)
+        
+        # 자동 마스킹 제안 (같은 작업자 프로세스에서 텍스트 검색)
+        self.suggestions = SuggestionManager(self.render_pool)
+        
+        # 고배율 타일 렌더링 기준
+        self.tile_threshold_pixels = tile_threshold_pixels
 
     def load_pdf(self, path: str, password: str = "") -> None:
         """
@@ -45,6 +430,15 @@ class PdfDocumentManager:
             if self.doc is not None:
                 self.doc.close()
                 self.doc = None
+            
+            # 이전 문서의 렌더링 작업 및 캐시 제거
+            self.render_pool.cancel_pending()
+            self.render_pool.current_doc_id = 0
+            self.render_cache.clear()
+            self.display_lists.clear()
+            self._page_sizes = None
+            self.thumbnails.close_document()
+            self.suggestions.cancel()
 
             # 새 문서 열기
             self.doc = fitz.open(path)
@@ -62,6 +456,14 @@ class PdfDocumentManager:
                         raise PasswordRequiredException("입력한 암호가 올바르지 않습니다.")
             
             self.file_path = path
+            self.password = password
+            self.doc_id = next(_doc_ids)
+            self.render_pool.current_doc_id = self.doc_id
+            
+            # 썸네일 준비 (디스크에 있으면 바로 사용, 없으면 백그라운드 생성)
+            self.thumbnails.open_document(
+                self.doc_id, path, password, len(self.doc), encrypted=self.doc.needs_pass
+            )
             
         except PasswordRequiredException:
             # 암호 예외는 그대로 전달
@@ -82,16 +484,25 @@ class PdfDocumentManager:
             return 0
         return len(self.doc)
 
-    def get_page_pixmap(self, page_index: int, zoom: float = 1.5) -> Optional[QPixmap]:
+    def get_page_image(
+        self,
+        page_index: int,
+        zoom: float = 1.5,
+        colorspace: str = "rgb"
+    ) -> Optional[QImage]:
         """
-        지정된 페이지를 QPixmap으로 렌더링
+        지정된 페이지를 QImage로 렌더링
+        
+        같은 문서/페이지/배율/색공간으로 렌더링한 결과가 캐시에 있으면
+        다시 렌더링하지 않고 캐시된 이미지를 반환합니다.
         
         Args:
             page_index: 페이지 인덱스 (0-based)
             zoom: 확대/축소 배율
+            colorspace: 색공간 ("rgb" 또는 "gray")
             
         Returns:
-            Optional[QPixmap]: 렌더링된 QPixmap 객체 또는 None
+            Optional[QImage]: 렌더링된 이미지 또는 None
         """
         if self.doc is None:
             return None
@@ -101,42 +512,270 @@ class PdfDocumentManager:
             if page_index < 0 or page_index >= len(self.doc):
                 return None
 
-            # 페이지 로드
-            page = self.doc.load_page(page_index)
+            # 캐시 조회
+            key = make_render_key(self.doc_id, page_index, zoom, colorspace)
+            cached = self.render_cache.get(key)
+            if cached is not None:
+                return cached
+
+            # 해석된 페이지 (없으면 페이지를 로드하여 해석)
+            display_list = self.display_lists.get(self.doc, self.doc_id, page_index)
 
             # 확대/축소 매트릭스 적용하여 렌더링
             mat = fitz.Matrix(zoom, zoom)
-            pix = page.get_pixmap(matrix=mat)
-
-            # PyMuPDF Pixmap을 QImage로 변환
-            img_data = pix.samples
-            img = QImage(
-                img_data,
-                pix.width,
-                pix.height,
-                pix.stride,
-                QImage.Format.Format_RGB888
-            )
+            pix = display_list.get_pixmap(matrix=mat, colorspace=COLORSPACES[colorspace])
 
-            # QImage를 QPixmap으로 변환
-            return QPixmap.fromImage(img)
+            # 버퍼를 복사하지 않고 QImage로 감싸서 캐시에 저장
+            image = PixmapImage(pix)
+            self.render_cache.put(key, image)
+            return image
 
         except Exception as e:
             print(f"페이지 렌더링 오류: {str(e)}")
             return None
 
-    def apply_masks_and_save(self, masks: list[MaskEntry], output_path: Optional[str] = None) -> None:
+    def render_key(self, page_index: int, zoom: float, colorspace: str = "rgb") -> RenderKey:
+        """
+        현재 문서 기준 렌더링 캐시 키 반환
+        
+        Args:
+            page_index: 페이지 인덱스 (0-based)
+            zoom: 확대/축소 배율
+            colorspace: 색공간 ("rgb" 또는 "gray")
+            
+        Returns:
+            RenderKey: 렌더링 캐시 키
+        """
+        return make_render_key(self.doc_id, page_index, zoom, colorspace)
+
+    def get_cached_page_image(
+        self,
+        page_index: int,
+        zoom: float,
+        colorspace: str = "rgb"
+    ) -> Optional[QImage]:
+        """
+        렌더링하지 않고 캐시에 있는 페이지 이미지만 반환
+        
+        Args:
+            page_index: 페이지 인덱스 (0-based)
+            zoom: 확대/축소 배율
+            colorspace: 색공간 ("rgb" 또는 "gray")
+            
+        Returns:
+            Optional[QImage]: 캐시된 이미지 또는 None
+        """
+        return self.render_cache.get(self.render_key(page_index, zoom, colorspace))
+
+    def get_preview_image(self, page_index: int) -> Optional[QImage]:
+        """
+        저해상도 미리보기 이미지 반환
+        
+        전체 해상도 이미지가 백그라운드에서 렌더링되는 동안 확대하여 표시합니다.
+        썸네일이 있으면 렌더링하지 않고 썸네일을 사용합니다.
+        
+        Args:
+            page_index: 페이지 인덱스 (0-based)
+            
+        Returns:
+            Optional[QImage]: 미리보기 이미지 또는 None
+        """
+        thumbnail = self.thumbnails.get_thumbnail(page_index)
+        if thumbnail is not None:
+            return thumbnail
+        return self.get_page_image(page_index, PREVIEW_ZOOM)
+
+    def get_page_sizes(self) -> List[Tuple[float, float]]:
+        """
+        모든 페이지의 PDF 좌표계 크기 반환
+        
+        문서마다 한 번만 계산하여 보관합니다.
+        
+        Returns:
+            List[Tuple[float, float]]: 페이지별 (너비, 높이)
+        """
+        if self.doc is None:
+            return []
+        
+        if self._page_sizes is None:
+            self._page_sizes = [(page.rect.width, page.rect.height) for page in self.doc]
+        return self._page_sizes
+
+    def get_render_size(self, page_index: int, zoom: float) -> Optional[Tuple[int, int]]:
+        """
+        지정된 배율로 렌더링했을 때의 페이지 픽셀 크기 반환
+        
+        Args:
+            page_index: 페이지 인덱스 (0-based)
+            zoom: 확대/축소 배율
+            
+        Returns:
+            Optional[Tuple[int, int]]: (너비, 높이) 또는 None
+        """
+        if self.doc is None or page_index < 0 or page_index >= len(self.doc):
+            return None
+        
+        width, height = self.get_page_sizes()[page_index]
+        return scaled_size(width, height, zoom)
+
+    def should_tile(self, page_index: int, zoom: float) -> bool:
+        """
+        전체 페이지 대신 타일 단위로 렌더링해야 하는지 확인
+        
+        Args:
+            page_index: 페이지 인덱스 (0-based)
+            zoom: 확대/축소 배율
+            
+        Returns:
+            bool: 렌더링 크기가 기준 픽셀 수를 넘으면 True
+        """
+        size = self.get_render_size(page_index, zoom)
+        if size is None:
+            return False
+        return size[0] * size[1] > self.tile_threshold_pixels
+
+    def get_tile_image(
+        self,
+        page_index: int,
+        zoom: float,
+        col: int,
+        row: int,
+        colorspace: str = "rgb"
+    ) -> Optional[QImage]:
+        """
+        페이지의 한 타일만 QImage로 렌더링
+        
+        타일 (col, row)은 렌더링된 페이지 픽셀 좌표에서
+        (col * TILE_SIZE, row * TILE_SIZE)부터 TILE_SIZE 크기의 영역입니다.
+        타일마다 따로 캐시됩니다.
+        
+        Args:
+            page_index: 페이지 인덱스 (0-based)
+            zoom: 확대/축소 배율
+            col: 타일 열 번호
+            row: 타일 행 번호
+            colorspace: 색공간 ("rgb" 또는 "gray")
+            
+        Returns:
+            Optional[QImage]: 렌더링된 타일 또는 None
+        """
+        size = self.get_render_size(page_index, zoom)
+        if size is None:
+            return None
+
+        try:
+            key = make_render_key(self.doc_id, page_index, zoom, colorspace) + (col, row)
+            cached = self.render_cache.get(key)
+            if cached is not None:
+                return cached
+
+            # 타일의 픽셀 영역
+            x0 = col * TILE_SIZE
+            y0 = row * TILE_SIZE
+            x1 = min(x0 + TILE_SIZE, size[0])
+            y1 = min(y0 + TILE_SIZE, size[1])
+            if x0 >= x1 or y0 >= y1:
+                return None
+
+            # 픽셀 영역을 PDF 좌표로 변환하여 해당 영역만 렌더링
+            display_list = self.display_lists.get(self.doc, self.doc_id, page_index)
+            clip = fitz.Rect(x0 / zoom, y0 / zoom, x1 / zoom, y1 / zoom)
+            pix = display_list.get_pixmap(
+                matrix=fitz.Matrix(zoom, zoom),
+                clip=clip,
+                colorspace=COLORSPACES[colorspace]
+            )
+
+            image = PixmapImage(pix)
+            self.render_cache.put(key, image)
+            return image
+
+        except Exception as e:
+            print(f"타일 렌더링 오류: {str(e)}")
+            return None
+
+    def prefetch_pages(self, page_index: int, zoom: float = 1.5, colorspace: str = "rgb") -> None:
+        """
+        현재 페이지와 이웃 페이지를 백그라운드에서 미리 렌더링
+        
+        현재 페이지가 캐시에 없으면 가장 먼저 요청하고,
+        이어서 N+1, N-1, N+2, N-2 ... 순서로 요청합니다.
+        이전에 요청했지만 아직 시작하지 않은 작업은 취소합니다.
+        
+        Args:
+            page_index: 현재 페이지 인덱스 (0-based)
+            zoom: 확대/축소 배율
+            colorspace: 색공간 ("rgb" 또는 "gray")
+        """
+        if self.doc is None or self.file_path is None:
+            return
+        
+        self.render_pool.cancel_pending()
+        
+        page_count = len(self.doc)
+        if 0 <= page_index < page_count:
+            key = make_render_key(self.doc_id, page_index, zoom, colorspace)
+            self.render_pool.submit(key, self.file_path, self.password)
+        
+        for distance in range(1, self.prefetch_radius + 1):
+            for neighbor in (page_index + distance, page_index - distance):
+                if 0 <= neighbor < page_count:
+                    key = make_render_key(self.doc_id, neighbor, zoom, colorspace)
+                    self.render_pool.submit(key, self.file_path, self.password)
+
+    def request_page_render(self, page_index: int, zoom: float, colorspace: str = "rgb") -> bool:
+        """
+        페이지 하나를 백그라운드 렌더링 대기열에 추가
+        
+        Args:
+            page_index: 페이지 인덱스 (0-based)
+            zoom: 확대/축소 배율
+            colorspace: 색공간 ("rgb" 또는 "gray")
+            
+        Returns:
+            bool: 새 작업 등록 여부
+        """
+        if self.doc is None or self.file_path is None:
+            return False
+        if page_index < 0 or page_index >= len(self.doc):
+            return False
+        
+        key = make_render_key(self.doc_id, page_index, zoom, colorspace)
+        return self.render_pool.submit(key, self.file_path, self.password)
+
+    def start_suggestions(self) -> bool:
+        """
+        현재 문서 전체의 자동 마스킹 제안 검색 시작
+        
+        결과는 suggestions.suggestionsFound 시그널로 페이지마다 전달됩니다.
+        
+        Returns:
+            bool: 검색 시작 여부 (열린 문서가 없으면 False)
+        """
+        if self.doc is None or self.file_path is None:
+            return False
+        self.suggestions.start(self.doc_id, self.file_path, self.password, len(self.doc))
+        return True
+
+    def apply_masks_and_save(
+        self,
+        masks: MaskStore,
+        output_path: Optional[str] = None,
+        profile: str = DEFAULT_SAVE_PROFILE
+    ) -> None:
         """
         마스킹을 PDF에 적용하고 저장
         
         PyMuPDF의 Redaction 기능을 사용하여 영구적으로 마스킹합니다.
+        저장한 파일을 다시 열어 마스킹 영역에 글자나 내용이 남지 않았는지 검증합니다.
         
         Args:
-            masks: 적용할 마스킹 정보 리스트
+            masks: 적용할 마스킹 저장소
             output_path: 저장할 파일 경로 (None이면 원본 파일에 저장)
+            profile: 별도 파일로 저장할 때 사용할 저장 프로필 이름 (SAVE_PROFILES)
             
         Raises:
-            Exception: 문서가 없거나 저장 중 오류 발생 시
+            Exception: 문서가 없거나 저장 또는 검증 중 오류 발생 시
         """
         if self.doc is None or self.file_path is None:
             raise Exception("열린 PDF 문서가 없습니다.")
@@ -146,32 +785,17 @@ class PdfDocumentManager:
         
         try:
             # 페이지별로 마스크 적용
-            for page_num in range(len(self.doc)):
-                # 현재 페이지의 마스크만 필터링
-                page_masks = [m for m in masks if m.page_index == page_num]
-                
-                if not page_masks:
-                    continue
-                
-                # 페이지 로드
-                page = self.doc.load_page(page_num)
-                
-                # 각 마스크에 대해 redaction annotation 추가
-                for mask in page_masks:
-                    # 흰색으로 마스킹 (1, 1, 1) = RGB white
-                    page.add_redact_annot(mask.rect, fill=(1, 1, 1))
-                
-                # 페이지별로 redaction 적용
-                page.apply_redactions()
-                
-                print(f"페이지 {page_num + 1}에 {len(page_masks)}개의 마스크 적용 완료")
-            
-            print("모든 페이지의 Redaction 적용 완료")
+            applied_pages, image_pages = apply_masks_to_document(self.doc, masks)
+            print(f"{applied_pages}개 페이지에 {len(masks)}개의 마스크 적용 완료 (이미지 처리 {image_pages}개 페이지)")
+            
+            # 문서 내용이 바뀌었으므로 이전 렌더링 결과 폐기
+            self.render_cache.invalidate(self.doc_id)
+            self.display_lists.invalidate(self.doc_id)
             
             # 파일 저장
             if output_path:
                 # 별도 파일로 저장 (새 파일 생성)
-                self.doc.save(save_path)
+                self.doc.save(save_path, **get_save_options(profile, applied_pages > 0, image_pages > 0))
             else:
                 # 원본 파일에 저장 (incremental 저장)
                 self.doc.save(
@@ -181,6 +805,12 @@ class PdfDocumentManager:
                 )
             print(f"파일 저장 완료: {save_path}")
             
+            # 저장한 파일 검증
+            verification = verify_file(save_path, masks, self.password, REDACTION_FILL)
+            if not verification.passed:
+                raise Exception(verification.summary())
+            print(verification.summary())
+            
         except Exception as e:
             error_msg = str(e)
             # Permission denied 오류 확인
@@ -202,4 +832,20 @@ class PdfDocumentManager:
             self.doc.close()
             self.doc = None
         self.file_path = None
+        self.password = ""
+        self.doc_id = 0
+        self.render_pool.cancel_pending()
+        self.render_pool.current_doc_id = 0
+        self.render_cache.clear()
+        self.display_lists.clear()
+        self._page_sizes = None
+        self.thumbnails.close_document()
+        self.suggestions.cancel()
+
+    def shutdown(self) -> None:
+        """
+        문서를 닫고 백그라운드 렌더링 작업자 종료
+        """
+        self.close()
+        self.render_pool.shutdown()
 
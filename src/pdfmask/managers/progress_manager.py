@@ -1,105 +1,328 @@
 """
 작업 진행상황 관리 모듈
+
+폴더별 진행상황은 progress/<폴더 해시>.jsonl에 완료한 파일을 한 줄씩 이어 씁니다.
+파일을 저장할 때마다 전체 파일 목록과 완료 목록을 다시 쓰던 progress.json과 달리
+기록 한 줄만 추가하므로, 폴더의 파일 수와 관계없이 저장 시간이 일정합니다.
+기록이 PROGRESS_COMPACT_RECORDS개 쌓이면 완료 목록 한 줄(snapshot)로 정리합니다.
+
+폴더마다 기록 파일이 따로 있으므로 여러 폴더의 작업을 번갈아 하거나
+프로그램을 여러 개 실행해도 서로의 진행상황을 덮어쓰지 않습니다.
+기존 progress.json은 처음 실행할 때 옮겨 옵니다.
 """
 
 import os
 import json
+import hashlib
 from datetime import datetime
-from typing import Tuple, List, Dict
+from typing import Tuple, Dict, Optional
+
+
+# 폴더별 진행상황 기록 폴더
+PROGRESS_DIR_NAME = "progress"
+
+# 기존 진행상황 파일 (프로젝트 루트)
+LEGACY_PROGRESS_FILE = "progress.json"
+
+# 정리(snapshot) 이후 이 개수만큼 기록이 쌓이면 다시 정리
+PROGRESS_COMPACT_RECORDS = 1000
 
 
 class ProgressManager:
     """
     폴더 일괄 작업 시 진행상황을 추적하는 클래스
-    
-    progress.json 파일에 현재 작업 상태를 저장합니다.
+
+    progress 폴더에 폴더별 진행상황 기록 파일을 관리합니다.
+
+    기록 종류 (한 줄에 JSON 하나):
+        snapshot: 폴더 경로, 전체 파일 수, 현재 인덱스, 완료 파일 목록 전체
+        done: 완료한 파일 하나와 그때의 현재 인덱스, 전체 파일 수
     """
-    
-    def __init__(self) -> None:
+
+    def __init__(self, progress_dir: Optional[str] = None) -> None:
         """
         초기화
-        
-        프로젝트 루트의 progress.json 파일을 관리합니다.
-        """
-        # 프로젝트 루트 경로 (src/pdfmask/managers/ -> src/ -> project_root/)
-        current_file = os.path.abspath(__file__)
-        managers_dir = os.path.dirname(current_file)  # managers/
-        pdfmask_dir = os.path.dirname(managers_dir)   # pdfmask/
-        src_dir = os.path.dirname(pdfmask_dir)        # src/
-        self.project_root = os.path.dirname(src_dir)  # project_root/
-        self.progress_file = os.path.join(self.project_root, "progress.json")
-    
-    def save_progress(
+
+        Args:
+            progress_dir: 진행상황 기록 폴더 (기본값: 프로젝트 루트의 progress)
+        """
+        if progress_dir is None:
+            # 프로젝트 루트 경로 (src/pdfmask/managers/ -> src/ -> project_root/)
+            current_file = os.path.abspath(__file__)
+            managers_dir = os.path.dirname(current_file)  # managers/
+            pdfmask_dir = os.path.dirname(managers_dir)   # pdfmask/
+            src_dir = os.path.dirname(pdfmask_dir)        # src/
+            project_root = os.path.dirname(src_dir)       # project_root/
+            progress_dir = os.path.join(project_root, PROGRESS_DIR_NAME)
+        self.progress_dir = progress_dir
+        os.makedirs(self.progress_dir, exist_ok=True)
+
+        # 정리 이후 이 프로그램에서 추가한 기록 수 (기록 파일별)
+        self._appended: Dict[str, int] = {}
+
+        self.migrate_legacy_progress()
+
+    def get_progress_path(self, folder_path: str) -> str:
+        """
+        폴더의 진행상황 기록 파일 경로
+
+        Args:
+            folder_path: 작업 중인 폴더 경로
+
+        Returns:
+            str: 기록 파일 경로 (progress/<해시>.jsonl)
+        """
+        key = os.path.normcase(os.path.abspath(folder_path))
+        name = hashlib.blake2b(key.encode('utf-8'), digest_size=12).hexdigest()
+        return os.path.join(self.progress_dir, f"{name}.jsonl")
+
+    def mark_completed(
         self,
         folder_path: str,
-        pdf_files: List[str],
-        completed_files: List[str],
-        current_index: int
+        filename: str,
+        current_index: int,
+        total_files: int
     ) -> Tuple[bool, str]:
         """
-        작업 진행상황 저장
-        
+        완료한 파일을 진행상황에 추가
+
         Args:
             folder_path: 작업 중인 폴더 경로
-            pdf_files: 전체 PDF 파일 리스트
-            completed_files: 완료된 파일 리스트
+            filename: 완료한 PDF 파일명
             current_index: 현재 작업 중인 파일 인덱스
-            
+            total_files: 폴더의 전체 PDF 파일 수
+
         Returns:
             Tuple[bool, str]: (성공 여부, 메시지)
         """
         try:
-            data = {
-                'folder_path': folder_path,
-                'last_updated': datetime.now().isoformat(),
-                'total_files': len(pdf_files),
-                'completed_count': len(completed_files),
+            progress_path = self.get_progress_path(folder_path)
+            now = datetime.now().isoformat()
+            lines = []
+            if not os.path.exists(progress_path):
+                # 폴더 경로를 알 수 있도록 빈 목록으로 시작
+                lines.append(self._snapshot_line(folder_path, total_files, current_index, now, []))
+            lines.append(json.dumps({
+                'op': 'done',
+                'file': filename,
                 'current_index': current_index,
-                'pdf_files': [os.path.basename(f) for f in pdf_files],
-                'completed_files': completed_files,
-            }
-            
-            with open(self.progress_file, 'w', encoding='utf-8') as f:
-                json.dump(data, f, indent=2, ensure_ascii=False)
-            
+                'total_files': total_files,
+                'last_updated': now,
+            }, ensure_ascii=False) + "\n")
+
+            # 한 번에 써서 다른 프로그램의 기록과 줄이 섞이지 않도록 함
+            with open(progress_path, 'ab+') as f:
+                # 이전에 쓰다 만 줄이 있으면 새 줄에서 시작
+                if f.seek(0, os.SEEK_END) > 0:
+                    f.seek(-1, os.SEEK_END)
+                    if f.read(1) != b"\n":
+                        lines.insert(0, "\n")
+                f.write("".join(lines).encode('utf-8'))
+
+            count = self._appended.get(progress_path, 0) + 1
+            self._appended[progress_path] = count
+            if count >= PROGRESS_COMPACT_RECORDS:
+                self.compact_progress(folder_path)
+
             return True, "진행상황 저장 완료"
-            
+
         except Exception as e:
             return False, f"진행상황 저장 실패: {str(e)}"
-    
-    def load_progress(self) -> Tuple[bool, Dict, str]:
+
+    def load_progress(self, folder_path: str) -> Tuple[bool, Dict, str]:
         """
-        작업 진행상황 로드
-        
+        폴더의 작업 진행상황 로드 (기록이 많이 쌓였으면 정리)
+
+        Args:
+            folder_path: 작업할 폴더 경로
+
         Returns:
             Tuple[bool, Dict, str]: (성공 여부, 진행상황 데이터, 메시지)
+                진행상황 데이터: folder_path, last_updated, total_files, completed_count,
+                current_index, completed_files (완료 파일명 set)
         """
         try:
-            if not os.path.exists(self.progress_file):
+            progress_path = self.get_progress_path(folder_path)
+            data, records = self._replay(progress_path)
+            if not data:
                 return True, {}, "진행상황 파일 없음"
-            
-            with open(self.progress_file, 'r', encoding='utf-8') as f:
-                data = json.load(f)
-            
+
+            if records >= PROGRESS_COMPACT_RECORDS:
+                self._write_snapshot(progress_path, data)
+
             return True, data, "진행상황 로드 완료"
-            
+
         except Exception as e:
             return False, {}, f"진행상황 로드 실패: {str(e)}"
-    
-    def clear_progress(self) -> Tuple[bool, str]:
+
+    def compact_progress(self, folder_path: str) -> Tuple[bool, str]:
+        """
+        폴더의 진행상황 기록을 완료 목록 한 줄로 정리
+
+        Args:
+            folder_path: 작업 중인 폴더 경로
+
+        Returns:
+            Tuple[bool, str]: (성공 여부, 메시지)
         """
-        작업 진행상황 삭제
-        
+        try:
+            progress_path = self.get_progress_path(folder_path)
+            data, _ = self._replay(progress_path)
+            if not data:
+                return True, "진행상황 파일 없음"
+            if not self._write_snapshot(progress_path, data):
+                return True, "다른 프로그램이 기록 중이어서 다음에 정리"
+            return True, "진행상황 정리 완료"
+
+        except Exception as e:
+            return False, f"진행상황 정리 실패: {str(e)}"
+
+    def clear_progress(self, folder_path: str) -> Tuple[bool, str]:
+        """
+        폴더의 작업 진행상황 삭제
+
+        Args:
+            folder_path: 작업한 폴더 경로
+
         Returns:
             Tuple[bool, str]: (성공 여부, 메시지)
         """
         try:
-            if os.path.exists(self.progress_file):
-                os.remove(self.progress_file)
+            progress_path = self.get_progress_path(folder_path)
+            self._appended.pop(progress_path, None)
+            if os.path.exists(progress_path):
+                os.remove(progress_path)
                 return True, "진행상황 삭제 완료"
             else:
                 return True, "진행상황 파일 없음"
-                
+
         except Exception as e:
             return False, f"진행상황 삭제 실패: {str(e)}"
 
+    def migrate_legacy_progress(self) -> Tuple[bool, str]:
+        """
+        기존 progress.json을 폴더별 기록으로 옮기기
+
+        옮긴 파일은 progress.json.migrated로 이름을 바꿔 남겨 둡니다.
+
+        Returns:
+            Tuple[bool, str]: (성공 여부, 메시지)
+        """
+        legacy_file = os.path.join(os.path.dirname(self.progress_dir), LEGACY_PROGRESS_FILE)
+        if not os.path.exists(legacy_file):
+            return True, "기존 진행상황 파일 없음"
+
+        try:
+            with open(legacy_file, 'r', encoding='utf-8') as f:
+                data = json.load(f)
+
+            folder_path = data.get('folder_path')
+            if folder_path:
+                progress_path = self.get_progress_path(folder_path)
+                # 이미 새 기록이 있으면 그쪽이 최신
+                if not os.path.exists(progress_path):
+                    self._write_snapshot(progress_path, {
+                        'folder_path': folder_path,
+                        'last_updated': data.get('last_updated', ''),
+                        'total_files': data.get('total_files', 0),
+                        'current_index': data.get('current_index', 0),
+                        'completed_files': set(data.get('completed_files', [])),
+                    })
+
+            os.replace(legacy_file, legacy_file + ".migrated")
+            return True, "기존 진행상황 이전 완료"
+
+        except Exception as e:
+            print(f"기존 진행상황 이전 오류: {str(e)}")
+            return False, f"기존 진행상황 이전 실패: {str(e)}"
+
+    def _replay(self, progress_path: str) -> Tuple[Dict, int]:
+        """
+        기록 파일을 처음부터 읽어 진행상황 복원
+
+        쓰는 도중 종료되어 잘린 줄은 건너뜁니다.
+
+        Args:
+            progress_path: 기록 파일 경로
+
+        Returns:
+            Tuple[Dict, int]: (진행상황 데이터 (기록이 없으면 빈 dict), 마지막 정리 이후 기록 수)
+        """
+        if not os.path.exists(progress_path):
+            return {}, 0
+
+        data: Dict = {}
+        completed: set = set()
+        records = 0
+        with open(progress_path, 'r', encoding='utf-8') as f:
+            for line in f:
+                try:
+                    record = json.loads(line)
+                except ValueError:
+                    continue
+                if record.get('op') == 'snapshot':
+                    completed = set(record.get('completed_files', []))
+                    data['folder_path'] = record.get('folder_path', '')
+                    records = 0
+                elif record.get('op') == 'done':
+                    completed.add(record['file'])
+                    records += 1
+                else:
+                    continue
+                data['last_updated'] = record.get('last_updated', '')
+                data['total_files'] = record.get('total_files', 0)
+                data['current_index'] = record.get('current_index', 0)
+
+        if not data.get('folder_path'):
+            return {}, 0
+        data['completed_files'] = completed
+        data['completed_count'] = len(completed)
+        return data, records
+
+    def _snapshot_line(
+        self,
+        folder_path: str,
+        total_files: int,
+        current_index: int,
+        last_updated: str,
+        completed_files
+    ) -> str:
+        """완료 목록 전체 기록"""
+        return json.dumps({
+            'op': 'snapshot',
+            'folder_path': folder_path,
+            'total_files': total_files,
+            'current_index': current_index,
+            'last_updated': last_updated,
+            'completed_files': sorted(completed_files),
+        }, ensure_ascii=False) + "\n"
+
+    def _write_snapshot(self, progress_path: str, data: Dict) -> bool:
+        """
+        진행상황을 기록 한 줄로 다시 쓰기 (임시 파일에 쓴 뒤 교체)
+
+        다른 프로그램이 그사이 기록을 추가했으면 그 기록을 잃지 않도록 교체하지 않습니다.
+
+        Returns:
+            bool: 교체 여부
+        """
+        size = os.path.getsize(progress_path) if os.path.exists(progress_path) else 0
+        temp_path = f"{progress_path}.{os.getpid()}.tmp"
+        with open(temp_path, 'w', encoding='utf-8') as f:
+            f.write(self._snapshot_line(
+                data['folder_path'],
+                data['total_files'],
+                data['current_index'],
+                data['last_updated'],
+                data['completed_files']
+            ))
+            f.flush()
+            os.fsync(f.fileno())
+
+        current_size = os.path.getsize(progress_path) if os.path.exists(progress_path) else 0
+        if current_size != size:
+            os.remove(temp_path)
+            return False
+        os.replace(temp_path, progress_path)
+        self._appended[progress_path] = 0
+        return True
@@ -0,0 +1,198 @@
+"""
+렌더링 캐시 모듈
+"""
+
+from collections import OrderedDict
+from typing import Hashable, Optional, Tuple
+
+import fitz  # PyMuPDF
+from PyQt6.QtGui import QImage
+
+
+# 캐시 키: (문서 식별자, 페이지 인덱스, 줌 배율, 색공간)
+# 타일 캐시 키는 뒤에 (열, 행)이 추가됩니다.
+RenderKey = Tuple[int, int, float, str]
+
+# 기본 메모리 예산 (256 MB)
+DEFAULT_RENDER_CACHE_BYTES = 256 * 1024 * 1024
+
+# DisplayList를 보관할 기본 페이지 수
+DEFAULT_DISPLAY_LIST_PAGES = 8
+
+
+def make_render_key(doc_id: int, page_index: int, zoom: float, colorspace: str) -> RenderKey:
+    """
+    렌더링 캐시 키 생성
+
+    줌 배율은 0.1 단위 증감 시 생기는 부동소수점 오차를 없애기 위해 반올림합니다.
+
+    Args:
+        doc_id: 문서 식별자
+        page_index: 페이지 인덱스 (0-based)
+        zoom: 확대/축소 배율
+        colorspace: 색공간 이름 ("rgb", "gray")
+
+    Returns:
+        RenderKey: 캐시 키
+    """
+    return (doc_id, page_index, round(zoom, 4), colorspace)
+
+
+class RenderCache:
+    """
+    렌더링된 페이지 이미지를 보관하는 LRU 캐시
+
+    저장된 이미지의 전체 바이트 수가 예산을 넘으면
+    가장 오래 사용되지 않은 항목부터 제거합니다.
+    """
+
+    def __init__(self, max_bytes: int = DEFAULT_RENDER_CACHE_BYTES) -> None:
+        """
+        초기화
+
+        Args:
+            max_bytes: 캐시 메모리 예산 (바이트)
+        """
+        self.max_bytes = max_bytes
+        self._entries: "OrderedDict[Hashable, Tuple[QImage, int]]" = OrderedDict()
+        self._current_bytes: int = 0
+
+    @property
+    def current_bytes(self) -> int:
+        """현재 캐시가 사용 중인 바이트 수"""
+        return self._current_bytes
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    def __contains__(self, key: Hashable) -> bool:
+        return key in self._entries
+
+    def get(self, key: Hashable) -> Optional[QImage]:
+        """
+        캐시된 이미지 조회
+
+        조회된 항목은 가장 최근에 사용된 항목으로 갱신됩니다.
+
+        Args:
+            key: 캐시 키
+
+        Returns:
+            Optional[QImage]: 캐시된 이미지 또는 None
+        """
+        entry = self._entries.get(key)
+        if entry is None:
+            return None
+        self._entries.move_to_end(key)
+        return entry[0]
+
+    def put(self, key: Hashable, image: QImage) -> None:
+        """
+        이미지를 캐시에 저장
+
+        예산보다 큰 이미지는 저장하지 않습니다.
+
+        Args:
+            key: 캐시 키
+            image: 저장할 이미지
+        """
+        size = image.sizeInBytes()
+
+        # 기존 항목 교체
+        self._remove(key)
+
+        if size > self.max_bytes:
+            return
+
+        self._entries[key] = (image, size)
+        self._current_bytes += size
+        self._evict()
+
+    def invalidate(self, doc_id: int) -> None:
+        """
+        특정 문서의 캐시 항목 모두 제거
+
+        Args:
+            doc_id: 문서 식별자
+        """
+        for key in [k for k in self._entries if k[0] == doc_id]:
+            self._remove(key)
+
+    def clear(self) -> None:
+        """캐시 전체 비우기"""
+        self._entries.clear()
+        self._current_bytes = 0
+
+    def _remove(self, key: Hashable) -> None:
+        """항목 제거 및 사용량 갱신"""
+        entry = self._entries.pop(key, None)
+        if entry is not None:
+            self._current_bytes -= entry[1]
+
+    def _evict(self) -> None:
+        """예산을 초과하면 가장 오래된 항목부터 제거"""
+        while self._current_bytes > self.max_bytes and self._entries:
+            _, (_, size) = self._entries.popitem(last=False)
+            self._current_bytes -= size
+
+
+class DisplayListCache:
+    """
+    페이지별 fitz.DisplayList를 보관하는 LRU 캐시
+
+    DisplayList는 페이지 내용 스트림을 한 번 해석한 결과이므로,
+    다른 배율이나 일부 영역(타일)을 렌더링할 때 페이지를 다시 해석하지 않고
+    재생만 합니다. 크기를 미리 알 수 없으므로 페이지 수로 제한합니다.
+    """
+
+    def __init__(self, max_pages: int = DEFAULT_DISPLAY_LIST_PAGES) -> None:
+        """
+        초기화
+
+        Args:
+            max_pages: 보관할 최대 페이지 수
+        """
+        self.max_pages = max_pages
+        self._entries: "OrderedDict[Tuple[int, int], fitz.DisplayList]" = OrderedDict()
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    def get(self, doc: fitz.Document, doc_id: int, page_index: int) -> fitz.DisplayList:
+        """
+        페이지의 DisplayList 반환 (없으면 페이지를 해석하여 생성)
+
+        Args:
+            doc: PDF 문서
+            doc_id: 문서 식별자
+            page_index: 페이지 인덱스 (0-based)
+
+        Returns:
+            fitz.DisplayList: 페이지의 DisplayList
+        """
+        key = (doc_id, page_index)
+        display_list = self._entries.get(key)
+        if display_list is not None:
+            self._entries.move_to_end(key)
+            return display_list
+
+        display_list = doc.load_page(page_index).get_displaylist()
+        if self.max_pages > 0:
+            self._entries[key] = display_list
+            while len(self._entries) > self.max_pages:
+                self._entries.popitem(last=False)
+        return display_list
+
+    def invalidate(self, doc_id: int) -> None:
+        """
+        특정 문서의 DisplayList 모두 제거
+
+        Args:
+            doc_id: 문서 식별자
+        """
+        for key in [k for k in self._entries if k[0] == doc_id]:
+            del self._entries[key]
+
+    def clear(self) -> None:
+        """캐시 전체 비우기"""
+        self._entries.clear()
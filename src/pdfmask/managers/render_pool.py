@@ -0,0 +1,333 @@
+"""
+백그라운드 페이지 렌더링 모듈
+
+PyMuPDF는 렌더링하는 동안 GIL을 해제하지 않으므로 스레드에서 렌더링하면
+GUI 스레드도 함께 멈춥니다. 따라서 렌더링은 별도 프로세스에서 수행하고,
+각 작업자 프로세스는 자신만의 fitz.Document 핸들을 열어 사용합니다.
+"""
+
+import os
+import multiprocessing
+from concurrent.futures import Future, ProcessPoolExecutor
+from typing import Any, Callable, Dict, Hashable, List, Optional, Tuple
+
+import fitz  # PyMuPDF
+from PyQt6.QtCore import QObject, pyqtSignal
+
+from .render_cache import RenderCache, RenderKey, DisplayListCache
+from .image_bridge import image_from_samples
+
+
+# 색공간 이름 → PyMuPDF 색공간
+COLORSPACES = {
+    "rgb": fitz.csRGB,
+    "gray": fitz.csGRAY,
+}
+
+# 렌더링 결과: (샘플 데이터, 너비, 높이, stride, 채널 수, 알파 여부)
+RenderResult = Tuple[bytes, int, int, int, int, bool]
+
+# 작업자 프로세스별 문서 핸들 (doc_id, fitz.Document)
+_worker_doc: Optional[Tuple[int, fitz.Document]] = None
+
+# 작업자 프로세스별 DisplayList 캐시 (같은 페이지를 다른 배율로 다시 렌더링할 때 사용)
+_worker_display_lists = DisplayListCache()
+
+
+def _open_worker_doc(doc_id: int, path: str, password: str) -> fitz.Document:
+    """
+    작업자 프로세스의 문서 핸들 반환
+
+    다른 문서를 요청받으면 이전 핸들을 닫고 새로 엽니다.
+    """
+    global _worker_doc
+
+    if _worker_doc is not None and _worker_doc[0] == doc_id:
+        return _worker_doc[1]
+
+    if _worker_doc is not None:
+        _worker_display_lists.clear()
+        _worker_doc[1].close()
+        _worker_doc = None
+
+    doc = fitz.open(path)
+    if doc.is_encrypted:
+        doc.authenticate(password)
+    _worker_doc = (doc_id, doc)
+    return doc
+
+
+def render_page_samples(
+    doc_id: int,
+    path: str,
+    password: str,
+    page_index: int,
+    zoom: float,
+    colorspace: str
+) -> RenderResult:
+    """
+    작업자 프로세스에서 페이지를 렌더링
+
+    Args:
+        doc_id: 문서 식별자
+        path: PDF 파일 경로
+        password: PDF 암호
+        page_index: 페이지 인덱스 (0-based)
+        zoom: 확대/축소 배율
+        colorspace: 색공간 ("rgb" 또는 "gray")
+
+    Returns:
+        RenderResult: (샘플 데이터, 너비, 높이, stride, 채널 수, 알파 여부)
+    """
+    doc = _open_worker_doc(doc_id, path, password)
+    display_list = _worker_display_lists.get(doc, doc_id, page_index)
+    pix = display_list.get_pixmap(matrix=fitz.Matrix(zoom, zoom), colorspace=COLORSPACES[colorspace])
+    return pix.samples, pix.width, pix.height, pix.stride, pix.n, bool(pix.alpha)
+
+
+def render_thumbnails(
+    doc_id: int,
+    path: str,
+    password: str,
+    page_indices: List[int],
+    max_size: int,
+    out_dir: Optional[str]
+) -> List[Tuple[int, RenderResult]]:
+    """
+    작업자 프로세스에서 페이지 썸네일을 렌더링
+
+    긴 변이 max_size 픽셀이 되도록 축소합니다. out_dir이 있으면 PNG 파일로도
+    저장하며, 임시 이름으로 쓴 뒤 교체하므로 중간에 종료되어도
+    깨진 썸네일이 남지 않습니다.
+
+    Args:
+        doc_id: 문서 식별자
+        path: PDF 파일 경로
+        password: PDF 암호
+        page_indices: 렌더링할 페이지 인덱스 목록
+        max_size: 썸네일 긴 변의 픽셀 수
+        out_dir: 저장 폴더 (None이면 저장하지 않음)
+
+    Returns:
+        List[Tuple[int, RenderResult]]: (페이지 인덱스, 렌더링 결과) 목록
+    """
+    doc = _open_worker_doc(doc_id, path, password)
+    if out_dir is not None:
+        os.makedirs(out_dir, exist_ok=True)
+
+    results = []
+    for page_index in page_indices:
+        page = doc.load_page(page_index)
+        zoom = max_size / max(page.rect.width, page.rect.height, 1)
+        pix = page.get_pixmap(matrix=fitz.Matrix(zoom, zoom), colorspace=fitz.csRGB)
+
+        if out_dir is not None:
+            out_path = os.path.join(out_dir, f"{page_index}.png")
+            tmp_path = f"{out_path}.{os.getpid()}.tmp"
+            pix.save(tmp_path, output="png")
+            os.replace(tmp_path, out_path)
+
+        results.append(
+            (page_index, (pix.samples, pix.width, pix.height, pix.stride, pix.n, bool(pix.alpha)))
+        )
+    return results
+
+
+class RenderWorkerPool(QObject):
+    """
+    작업자 프로세스 풀에서 페이지를 미리 렌더링하는 클래스
+
+    완료된 이미지는 GUI 스레드에서 공유 렌더링 캐시에 저장됩니다.
+    """
+
+    # 시그널: 캐시에 새 페이지가 저장됨 (RenderKey)
+    pageRendered = pyqtSignal(object)
+
+    # 시그널: 페이지 렌더링 실패 (RenderKey)
+    renderFailed = pyqtSignal(object)
+
+    # 시그널: 일반 작업 완료 (작업 키, 결과)
+    taskFinished = pyqtSignal(object, object)
+
+    # 시그널: 일반 작업 실패 (작업 키)
+    taskFailed = pyqtSignal(object)
+
+    # 내부 시그널: 작업 완료 (RenderKey, Future) - GUI 스레드로 전달
+    _futureDone = pyqtSignal(object, object)
+
+    # 내부 시그널: 일반 작업 완료 (작업 키, Future) - GUI 스레드로 전달
+    _taskDone = pyqtSignal(object, object)
+
+    def __init__(
+        self,
+        render_cache: RenderCache,
+        max_workers: int = 2,
+        parent: Optional[QObject] = None
+    ) -> None:
+        """
+        초기화
+
+        Args:
+            render_cache: 결과를 저장할 렌더링 캐시
+            max_workers: 최대 작업자 프로세스 수
+            parent: 부모 객체
+        """
+        super().__init__(parent)
+        self.render_cache = render_cache
+        self.max_workers = max(1, min(max_workers, os.cpu_count() or 1))
+
+        # 현재 문서 식별자 (다른 문서의 늦은 결과는 버림)
+        self.current_doc_id: int = 0
+
+        # 프로세스 풀 (첫 작업 요청 시 생성)
+        self._executor: Optional[ProcessPoolExecutor] = None
+
+        # 진행 중인 작업
+        self._pending: Dict[RenderKey, Future] = {}
+
+        # 요청 세대: cancel_pending()마다 증가하며, 이후 다시 요청되지 않은
+        # 작업의 결과는 늦게 도착해도 버림 (마지막 요청이 우선)
+        self._generation: int = 0
+        self._job_generations: Dict[RenderKey, int] = {}
+
+        # 진행 중인 일반 작업 (페이지 이동 시 취소되지 않음)
+        self._tasks: Dict[Hashable, Future] = {}
+
+        self._futureDone.connect(self._on_future_done)
+        self._taskDone.connect(self._on_task_done)
+
+    def submit(self, key: RenderKey, path: str, password: str) -> bool:
+        """
+        페이지 렌더링 작업 등록
+
+        이미 캐시에 있거나 진행 중인 페이지는 다시 등록하지 않으며,
+        진행 중인 작업은 현재 요청으로 다시 표시하여 결과를 사용합니다.
+
+        Args:
+            key: 렌더링 캐시 키 (doc_id, page_index, zoom, colorspace)
+            path: PDF 파일 경로
+            password: PDF 암호
+
+        Returns:
+            bool: 새 작업 등록 여부
+        """
+        if key in self._pending:
+            self._job_generations[key] = self._generation
+            return False
+        if key in self.render_cache:
+            return False
+
+        doc_id, page_index, zoom, colorspace = key
+        future = self._get_executor().submit(
+            render_page_samples, doc_id, path, password, page_index, zoom, colorspace
+        )
+        self._pending[key] = future
+        self._job_generations[key] = self._generation
+        # 완료 콜백은 풀의 내부 스레드에서 호출되므로 시그널로 GUI 스레드에 전달
+        future.add_done_callback(lambda f, k=key: self._futureDone.emit(k, f))
+        return True
+
+    def submit_task(self, key: Hashable, fn: Callable[..., Any], *args: Any) -> bool:
+        """
+        페이지 렌더링 외의 작업을 작업자 프로세스에서 실행
+
+        완료되면 taskFinished(key, 결과) 시그널이 발생합니다.
+        fn은 작업자 프로세스에서 import할 수 있는 모듈 수준 함수여야 합니다.
+
+        Args:
+            key: 작업 키 (진행 중인 같은 키의 작업이 있으면 등록하지 않음)
+            fn: 실행할 함수
+            *args: 함수 인자
+
+        Returns:
+            bool: 새 작업 등록 여부
+        """
+        if key in self._tasks:
+            return False
+
+        future = self._get_executor().submit(fn, *args)
+        self._tasks[key] = future
+        future.add_done_callback(lambda f, k=key: self._taskDone.emit(k, f))
+        return True
+
+    def cancel_tasks(self, kind: Optional[Hashable] = None) -> None:
+        """
+        아직 시작하지 않은 일반 작업 취소
+
+        Args:
+            kind: 작업 키(튜플)의 첫 항목이 같은 작업만 취소 (None이면 모든 작업)
+        """
+        for key, future in list(self._tasks.items()):
+            if kind is None or (isinstance(key, tuple) and key and key[0] == kind):
+                future.cancel()
+
+    def cancel_pending(self) -> None:
+        """
+        아직 시작하지 않은 작업 취소
+
+        이미 실행 중인 작업은 중단할 수 없으므로, 이후 다시 요청되지 않으면
+        완료되더라도 결과를 버립니다.
+        """
+        self._generation += 1
+        # 취소된 작업의 완료 콜백이 즉시 _pending을 수정하므로 복사본으로 순회
+        for future in list(self._pending.values()):
+            future.cancel()
+
+    def shutdown(self) -> None:
+        """작업자 프로세스 종료"""
+        self.cancel_pending()
+        self.cancel_tasks()
+        if self._executor is not None:
+            self._executor.shutdown(wait=False, cancel_futures=True)
+            self._executor = None
+        self._pending.clear()
+        self._job_generations.clear()
+        self._tasks.clear()
+
+    def _get_executor(self) -> ProcessPoolExecutor:
+        """프로세스 풀 반환 (없으면 생성)"""
+        if self._executor is None:
+            # Qt 스레드가 있는 프로세스를 fork하지 않도록 spawn 사용
+            self._executor = ProcessPoolExecutor(
+                max_workers=self.max_workers,
+                mp_context=multiprocessing.get_context("spawn")
+            )
+        return self._executor
+
+    def _on_future_done(self, key: RenderKey, future: Future) -> None:
+        """작업 완료 처리 (GUI 스레드)"""
+        if self._pending.get(key) is not future:
+            return
+        del self._pending[key]
+        generation = self._job_generations.pop(key)
+
+        # 취소되었거나, 다른 문서이거나, 이후 다시 요청되지 않은 오래된 작업은 버림
+        if future.cancelled() or key[0] != self.current_doc_id or generation != self._generation:
+            return
+
+        try:
+            # 전달받은 샘플 데이터를 복사 없이 QImage로 감싸서 캐시에 저장
+            self.render_cache.put(key, image_from_samples(*future.result()))
+        except Exception as e:
+            print(f"백그라운드 렌더링 오류: {str(e)}")
+            self.renderFailed.emit(key)
+            return
+
+        self.pageRendered.emit(key)
+
+    def _on_task_done(self, key: Hashable, future: Future) -> None:
+        """일반 작업 완료 처리 (GUI 스레드)"""
+        if self._tasks.get(key) is future:
+            del self._tasks[key]
+
+        if future.cancelled():
+            return
+
+        try:
+            result = future.result()
+        except Exception as e:
+            print(f"백그라운드 작업 오류: {str(e)}")
+            self.taskFailed.emit(key)
+            return
+
+        self.taskFinished.emit(key, result)
@@ -0,0 +1,593 @@
+"""
+백그라운드 마스킹 저장 모듈
+"""
+
+import os
+import json
+import uuid
+import multiprocessing
+from collections import deque
+from concurrent.futures import Future, ProcessPoolExecutor, ThreadPoolExecutor
+from concurrent.futures.process import BrokenProcessPool
+from dataclasses import dataclass
+from datetime import datetime
+from typing import Deque, Dict, Iterable, List, Optional, Set
+
+import fitz  # PyMuPDF
+from PyQt6.QtCore import QObject, QTimer, QEventLoop, pyqtSignal
+
+from ..core.models import MaskEntry
+from .pdf_manager import redact_file, to_mask_records, DEFAULT_SAVE_PROFILE
+from .excel_export_manager import ExcelExportManager
+from .file_transfer import default_staging_dir, transfer_file
+from .log_manager import LogManager
+
+
+# 동시에 저장하는 최대 파일 수
+MAX_CONCURRENT_SAVES = 2
+
+# 실패한 저장 작업의 최대 시도 횟수
+MAX_SAVE_ATTEMPTS = 3
+
+# 재시도 대기 시간 (시도 횟수만큼 늘어남)
+RETRY_DELAY_MS = 2000
+
+# 저장 작업 상태
+SAVE_QUEUED = "queued"
+SAVE_RUNNING = "saving"
+SAVE_TRANSFERRING = "transferring"
+SAVE_DONE = "done"
+SAVE_FAILED = "failed"
+SAVE_NEEDS_PASSWORD = "password"
+
+
+@dataclass
+class SaveJob:
+    """
+    마스킹 저장 작업
+
+    Attributes:
+        job_id: 작업 식별자
+        pdf_path: 원본 PDF 경로
+        output_path: 결과 파일 경로 (최종 위치)
+        masks: 저장 요청 시점의 마스킹 사본
+        password: PDF 암호 (작업 기록 파일에는 저장하지 않음)
+        profile: 저장 프로필 이름
+        staging_path: 결과 파일을 먼저 저장할 로컬 임시 파일 경로
+        status: 작업 상태 (SAVE_QUEUED, SAVE_RUNNING, SAVE_TRANSFERRING, SAVE_DONE,
+            SAVE_FAILED, SAVE_NEEDS_PASSWORD)
+        encrypted: 암호화된 PDF 여부 (다시 실행했을 때 암호를 다시 받아야 함)
+        attempts: 시도 횟수
+        message: 마지막 결과 메시지
+    """
+    job_id: str
+    pdf_path: str
+    output_path: str
+    masks: List[MaskEntry]
+    password: str = ""
+    profile: str = DEFAULT_SAVE_PROFILE
+    staging_path: str = ""
+    status: str = SAVE_QUEUED
+    encrypted: bool = False
+    attempts: int = 0
+    message: str = ""
+
+
+class SaveQueue(QObject):
+    """
+    마스킹 적용 및 결과 파일 저장을 백그라운드에서 처리하는 큐
+
+    작업자 프로세스가 파일을 직접 열어 처리하므로 화면에 열린 문서와 무관하게
+    저장이 진행되고, 사용자는 바로 다음 파일 작업을 할 수 있습니다.
+    결과 파일은 로컬 임시 폴더에 먼저 저장한 뒤 전송 단계에서 최종 위치로 복사,
+    검증하므로 네트워크 폴더가 느려도 저장 단계가 밀리지 않고,
+    결과 폴더에는 완성된 파일만 나타납니다.
+    끝나지 않은 작업은 작업 기록 파일(save_queue.json)에 남아 있어,
+    프로그램이 비정상 종료되어도 다음 실행 시 resume()으로 다시 저장합니다.
+    실패한 작업과 암호가 필요한 작업은 자동으로 다시 시작하지 않고,
+    사용자가 retry_job()으로 다시 시도하거나 dismiss_job()으로 취소할 때까지 남겨 둡니다.
+    """
+
+    # 시그널: 작업 상태 변경 (SaveJob)
+    jobStatusChanged = pyqtSignal(object)
+
+    # 내부 시그널: 저장 완료 (작업 ID, Future) - GUI 스레드로 전달
+    _saveDone = pyqtSignal(object, object)
+
+    # 내부 시그널: 전송 완료 (작업 ID, Future) - GUI 스레드로 전달
+    _transferDone = pyqtSignal(object, object)
+
+    # 내부 시그널: 작업 내역 기록 완료 (작업 ID, Future) - GUI 스레드로 전달
+    _exportDone = pyqtSignal(object, object)
+
+    def __init__(
+        self,
+        log_manager: LogManager,
+        max_workers: int = MAX_CONCURRENT_SAVES,
+        journal_path: Optional[str] = None,
+        staging_dir: Optional[str] = None,
+        parent: Optional[QObject] = None
+    ) -> None:
+        """
+        초기화
+
+        Args:
+            log_manager: 저장 결과를 기록할 로그 관리자
+            max_workers: 동시에 저장하는 최대 파일 수
+            journal_path: 작업 기록 파일 경로 (기본값: 프로젝트 루트의 save_queue.json)
+            staging_dir: 결과 파일을 먼저 저장할 로컬 폴더 (기본값: 시스템 임시 폴더의 pdfmask_staging)
+            parent: 부모 객체
+        """
+        super().__init__(parent)
+        self.log_manager = log_manager
+        self.excel_manager = ExcelExportManager()
+        self.max_workers = max_workers
+
+        if journal_path is None:
+            # 프로젝트 루트 경로 (src/pdfmask/managers/ -> src/ -> project_root/)
+            current_file = os.path.abspath(__file__)
+            managers_dir = os.path.dirname(current_file)  # managers/
+            pdfmask_dir = os.path.dirname(managers_dir)   # pdfmask/
+            src_dir = os.path.dirname(pdfmask_dir)        # src/
+            project_root = os.path.dirname(src_dir)       # project_root/
+            journal_path = os.path.join(project_root, "save_queue.json")
+        self.journal_path = journal_path
+        self.staging_dir = staging_dir if staging_dir is not None else default_staging_dir()
+
+        # 끝나지 않은 작업 (등록 순서), 시작을 기다리는 작업, 실행 중인 작업
+        self._jobs: Dict[str, SaveJob] = {}
+        self._waiting: Deque[str] = deque()
+        self._running: Dict[str, Future] = {}
+        self._transferring: Dict[str, Future] = {}
+
+        self._executor: Optional[ProcessPoolExecutor] = None
+        # 최종 위치로의 복사는 I/O 대기가 대부분이므로 스레드에서 처리
+        self._transfer_executor = ThreadPoolExecutor(max_workers=max_workers)
+        # 작업 내역은 여러 작업이 동시에 쓰지 않도록 한 스레드에서 차례로 기록
+        self._export_executor = ThreadPoolExecutor(max_workers=1)
+
+        self._saveDone.connect(self._on_save_done)
+        self._transferDone.connect(self._on_transfer_done)
+        self._exportDone.connect(self._on_export_done)
+
+    def enqueue(
+        self,
+        pdf_path: str,
+        output_path: str,
+        masks: Iterable[MaskEntry],
+        password: str = "",
+        profile: str = DEFAULT_SAVE_PROFILE
+    ) -> SaveJob:
+        """
+        저장 작업 등록
+
+        마스킹은 등록 시점의 사본을 사용하므로, 이후 화면의 마스킹을 바꾸거나
+        다른 파일을 열어도 저장 내용에 영향이 없습니다.
+
+        Args:
+            pdf_path: 원본 PDF 경로
+            output_path: 결과 파일 경로
+            masks: 적용할 마스킹
+            password: PDF 암호 (암호화된 PDF인 경우)
+            profile: 저장 프로필 이름 (SAVE_PROFILES)
+
+        Returns:
+            SaveJob: 등록된 작업
+        """
+        snapshot = [
+            MaskEntry(page_index=mask.page_index, rect=fitz.Rect(mask.rect), note=mask.note)
+            for mask in masks
+        ]
+        job_id = uuid.uuid4().hex
+        job = SaveJob(
+            job_id=job_id,
+            pdf_path=pdf_path,
+            output_path=output_path,
+            masks=snapshot,
+            password=password,
+            profile=profile,
+            staging_path=os.path.join(self.staging_dir, f"{job_id}.pdf"),
+            encrypted=bool(password),
+        )
+        self._jobs[job.job_id] = job
+        self._write_journal()
+
+        self._schedule(job)
+        return job
+
+    def resume(self) -> int:
+        """
+        이전 실행에서 끝나지 않은 작업을 작업 기록 파일에서 읽어 다시 등록
+
+        실패한 작업은 실패 상태로 남겨 두고, 암호화된 PDF를 처음부터 다시 저장해야 하는
+        작업은 암호가 저장되어 있지 않으므로 SAVE_NEEDS_PASSWORD 상태로 남겨 둡니다.
+        두 경우 모두 retry_job()을 호출할 때까지 시작하지 않습니다.
+
+        Returns:
+            int: 다시 시작한 작업 수
+        """
+        try:
+            if not os.path.exists(self.journal_path):
+                return 0
+            with open(self.journal_path, 'r', encoding='utf-8') as f:
+                data = json.load(f)
+        except Exception as e:
+            print(f"저장 작업 기록 로드 오류: {str(e)}")
+            return 0
+
+        resumed = 0
+        for entry in data.get('jobs', []):
+            if entry['job_id'] in self._jobs:
+                continue
+            job = SaveJob(
+                job_id=entry['job_id'],
+                pdf_path=entry['pdf_path'],
+                output_path=entry['output_path'],
+                profile=entry.get('profile', DEFAULT_SAVE_PROFILE),
+                staging_path=entry.get(
+                    'staging_path', os.path.join(self.staging_dir, f"{entry['job_id']}.pdf")
+                ),
+                masks=[
+                    MaskEntry(
+                        page_index=mask_data['page_index'],
+                        rect=fitz.Rect(
+                            mask_data['rect']['x0'], mask_data['rect']['y0'],
+                            mask_data['rect']['x1'], mask_data['rect']['y1'],
+                        ),
+                        note=mask_data.get('note', ''),
+                    )
+                    for mask_data in entry.get('masks', [])
+                ],
+                message=entry.get('message', ''),
+            )
+            self._jobs[job.job_id] = job
+
+            # 이전 버전의 작업 기록에는 암호화 여부가 없으므로 파일을 열어 확인
+            if 'encrypted' in entry:
+                job.encrypted = entry['encrypted']
+            else:
+                job.encrypted = self._needs_password(job.pdf_path)
+
+            # 화면은 아직 파일 목록을 표시하기 전이므로 상태 변경 시그널 없이 상태만 기록
+            if entry.get('status') == SAVE_FAILED:
+                job.status = SAVE_FAILED
+            elif job.encrypted and not os.path.exists(job.staging_path):
+                job.status = SAVE_NEEDS_PASSWORD
+                job.message = "암호화된 PDF는 암호를 다시 입력해야 저장할 수 있습니다."
+            else:
+                self._restart(job)
+                resumed += 1
+
+        self._write_journal()
+        if resumed:
+            self.log_manager.info(f"Save Queue Resumed: {resumed} unfinished jobs")
+        return resumed
+
+    def jobs(self) -> List[SaveJob]:
+        """
+        끝나지 않은 작업 목록 (실패한 작업 포함, 등록 순서)
+
+        Returns:
+            List[SaveJob]: 작업 목록
+        """
+        return list(self._jobs.values())
+
+    def jobs_needing_attention(self) -> List[SaveJob]:
+        """
+        실패했거나 암호를 기다리는 작업 목록 (retry_job() 또는 dismiss_job()이 필요함)
+
+        Returns:
+            List[SaveJob]: 작업 목록
+        """
+        return [
+            job for job in self._jobs.values()
+            if job.status in (SAVE_FAILED, SAVE_NEEDS_PASSWORD)
+        ]
+
+    def pending_count(self) -> int:
+        """
+        대기 중이거나 저장 중인 작업 수 (실패했거나 암호를 기다리는 작업 제외)
+
+        Returns:
+            int: 작업 수
+        """
+        return sum(
+            1 for job in self._jobs.values()
+            if job.status not in (SAVE_FAILED, SAVE_NEEDS_PASSWORD)
+        )
+
+    def reserved_paths(self) -> Set[str]:
+        """
+        끝나지 않은 작업이 사용할 결과 파일 경로
+
+        Returns:
+            Set[str]: 결과 파일 경로
+        """
+        return {job.output_path for job in self._jobs.values()}
+
+    def retry_job(self, job_id: str, password: Optional[str] = None) -> bool:
+        """
+        실패했거나 암호를 기다리는 작업 다시 시도
+
+        Args:
+            job_id: 작업 식별자
+            password: PDF 암호 (None이면 기존 암호 사용)
+
+        Returns:
+            bool: 다시 시작했는지 여부
+        """
+        job = self._jobs.get(job_id)
+        if job is None or job.status not in (SAVE_FAILED, SAVE_NEEDS_PASSWORD):
+            return False
+        if password is not None:
+            job.password = password
+        if job.encrypted and not job.password and not os.path.exists(job.staging_path):
+            # 암호 없이는 저장할 수 없으므로 시도하지 않음
+            job.status = SAVE_NEEDS_PASSWORD
+            self.jobStatusChanged.emit(job)
+            return False
+
+        job.attempts = 0
+        job.message = ""
+        self.log_manager.info(f"Save Job Retried: {job.pdf_path}")
+        self._restart(job)
+        return True
+
+    def dismiss_job(self, job_id: str) -> bool:
+        """
+        실패했거나 암호를 기다리는 작업 취소 (작업 기록과 로컬 결과 파일 삭제)
+
+        Args:
+            job_id: 작업 식별자
+
+        Returns:
+            bool: 취소했는지 여부
+        """
+        job = self._jobs.get(job_id)
+        if job is None or job.status not in (SAVE_FAILED, SAVE_NEEDS_PASSWORD):
+            return False
+
+        del self._jobs[job_id]
+        self._write_journal()
+        try:
+            if os.path.exists(job.staging_path):
+                os.remove(job.staging_path)
+        except OSError as e:
+            print(f"로컬 결과 파일 삭제 오류: {str(e)}")
+        self.log_manager.warning(f"Save Job Dismissed: {job.pdf_path} ({job.message})")
+        return True
+
+    def wait_until_idle(self) -> None:
+        """대기 중이거나 저장 중인 작업이 모두 끝날 때까지 이벤트를 처리하며 대기"""
+        if not self.pending_count():
+            return
+
+        loop = QEventLoop()
+
+        def on_status_changed(_job: SaveJob) -> None:
+            if not self.pending_count():
+                loop.quit()
+
+        self.jobStatusChanged.connect(on_status_changed)
+        loop.exec()
+        self.jobStatusChanged.disconnect(on_status_changed)
+
+    def shutdown(self) -> None:
+        """
+        작업자 프로세스 종료
+
+        끝나지 않은 작업은 작업 기록 파일에 남아 다음 실행 시 다시 저장됩니다.
+        """
+        self._waiting.clear()
+        if self._executor is not None:
+            self._executor.shutdown(wait=False, cancel_futures=True)
+            self._executor = None
+        self._running.clear()
+        self._transfer_executor.shutdown(wait=False, cancel_futures=True)
+        self._transferring.clear()
+        self._export_executor.shutdown(wait=True)
+
+    def _needs_password(self, pdf_path: str) -> bool:
+        """PDF를 여는 데 암호가 필요한지 확인 (파일을 열 수 없으면 False)"""
+        try:
+            with fitz.open(pdf_path) as doc:
+                return bool(doc.needs_pass)
+        except Exception:
+            return False
+
+    def _restart(self, job: SaveJob) -> None:
+        """로컬 결과 파일이 이미 있으면 전송 단계부터, 없으면 저장 단계부터 다시 시작"""
+        if os.path.exists(job.staging_path):
+            self._start_transfer(job)
+        else:
+            self._schedule(job)
+
+    def _schedule(self, job: SaveJob) -> None:
+        """작업을 대기열에 넣고 가능한 만큼 시작"""
+        job.status = SAVE_QUEUED
+        self._waiting.append(job.job_id)
+        self.jobStatusChanged.emit(job)
+        self._start_waiting()
+
+    def _start_waiting(self) -> None:
+        """동시 저장 수 안에서 대기 중인 작업 시작"""
+        while self._waiting and len(self._running) < self.max_workers:
+            job = self._jobs.get(self._waiting.popleft())
+            if job is None:
+                continue
+
+            job.status = SAVE_RUNNING
+            job.attempts += 1
+            self.jobStatusChanged.emit(job)
+
+            os.makedirs(self.staging_dir, exist_ok=True)
+            future = self._get_executor().submit(
+                redact_file, job.pdf_path, to_mask_records(job.masks), job.staging_path,
+                job.password, job.profile
+            )
+            self._running[job.job_id] = future
+            # 완료 콜백은 풀의 내부 스레드에서 호출되므로 시그널로 GUI 스레드에 전달
+            future.add_done_callback(lambda f, j=job.job_id: self._saveDone.emit(j, f))
+
+    def _get_executor(self) -> ProcessPoolExecutor:
+        """프로세스 풀 반환 (없으면 생성)"""
+        if self._executor is None:
+            # Qt 스레드가 있는 프로세스를 fork하지 않도록 spawn 사용
+            self._executor = ProcessPoolExecutor(
+                max_workers=self.max_workers,
+                mp_context=multiprocessing.get_context("spawn")
+            )
+        return self._executor
+
+    def _on_save_done(self, job_id: str, future: Future) -> None:
+        """저장 완료 처리 (GUI 스레드)"""
+        if self._running.get(job_id) is not future:
+            return
+        del self._running[job_id]
+        job = self._jobs[job_id]
+
+        try:
+            success, message = future.result()
+        except BrokenProcessPool as e:
+            # 작업자 프로세스가 비정상 종료되면 풀을 새로 만들어 재시도
+            self._executor = None
+            success, message = False, f"작업자 프로세스 종료: {str(e)}"
+        except Exception as e:
+            success, message = False, str(e)
+
+        job.message = message
+        if success:
+            # 로컬에 저장된 결과 파일을 최종 위치로 전송
+            job.attempts = 0
+            self._start_transfer(job)
+        else:
+            self._handle_failure(job, message)
+
+        self._start_waiting()
+
+    def _start_transfer(self, job: SaveJob) -> None:
+        """로컬 결과 파일을 최종 위치로 전송 시작"""
+        job.status = SAVE_TRANSFERRING
+        job.attempts += 1
+        self._write_journal()
+        self.jobStatusChanged.emit(job)
+
+        future = self._transfer_executor.submit(transfer_file, job.staging_path, job.output_path)
+        self._transferring[job.job_id] = future
+        future.add_done_callback(lambda f, j=job.job_id: self._transferDone.emit(j, f))
+
+    def _on_transfer_done(self, job_id: str, future: Future) -> None:
+        """전송 완료 처리 (GUI 스레드)"""
+        if self._transferring.get(job_id) is not future:
+            return
+        del self._transferring[job_id]
+        job = self._jobs[job_id]
+
+        try:
+            success, message = future.result()
+        except Exception as e:
+            success, message = False, str(e)
+
+        if not success:
+            job.message = message
+            self._handle_failure(job, message)
+            return
+
+        # 최종 위치의 파일이 검증된 뒤에만 저장 완료로 기록
+        self.log_manager.log_mask_save(job.pdf_path, job.masks)
+        self.log_manager.info(f"Mask Result Saved: {job.output_path} ({job.message})")
+        # 작업 내역 기록까지 끝나야 작업 완료
+        export_future = self._export_executor.submit(
+            self.excel_manager.append_masks, job.pdf_path, job.masks
+        )
+        export_future.add_done_callback(lambda f, j=job_id: self._exportDone.emit(j, f))
+
+    def _handle_failure(self, job: SaveJob, message: str) -> None:
+        """실패한 작업을 잠시 후 다시 시도하거나, 시도 횟수를 넘으면 실패로 기록"""
+        if job.attempts < MAX_SAVE_ATTEMPTS:
+            print(f"저장 실패, 재시도 예정 ({job.attempts}/{MAX_SAVE_ATTEMPTS}): {message}")
+            job.status = SAVE_QUEUED
+            self.jobStatusChanged.emit(job)
+            QTimer.singleShot(RETRY_DELAY_MS * job.attempts, lambda j=job: self._retry(j))
+        else:
+            job.status = SAVE_FAILED
+            self._write_journal()
+            self.log_manager.error(f"Mask Save Failed: {job.pdf_path} ({message})")
+            self.jobStatusChanged.emit(job)
+
+    def _retry(self, job: SaveJob) -> None:
+        """재시도 대기 후 작업 다시 시작"""
+        if (
+            self._jobs.get(job.job_id) is job
+            and job.job_id not in self._running
+            and job.job_id not in self._transferring
+        ):
+            self._restart(job)
+
+    def _on_export_done(self, job_id: str, future: Future) -> None:
+        """작업 내역 기록 완료 처리 (GUI 스레드)"""
+        job = self._jobs.pop(job_id, None)
+        if job is None:
+            return
+
+        try:
+            success, message = future.result()
+        except Exception as e:
+            success, message = False, str(e)
+        if success:
+            print(f"작업 내역 기록 완료: {message}")
+        else:
+            print(f"작업 내역 기록 오류: {message}")
+            self.log_manager.warning(f"Excel Export Failed: {job.pdf_path} ({message})")
+
+        job.status = SAVE_DONE
+        self._write_journal()
+        self.jobStatusChanged.emit(job)
+
+    def _write_journal(self) -> None:
+        """끝나지 않은 작업을 작업 기록 파일에 저장 (임시 파일에 쓴 뒤 교체)"""
+        try:
+            if not self._jobs:
+                if os.path.exists(self.journal_path):
+                    os.remove(self.journal_path)
+                return
+
+            data = {
+                'last_updated': datetime.now().isoformat(),
+                'jobs': [
+                    {
+                        'job_id': job.job_id,
+                        'pdf_path': job.pdf_path,
+                        'output_path': job.output_path,
+                        'profile': job.profile,
+                        'staging_path': job.staging_path,
+                        'status': job.status,
+                        'encrypted': job.encrypted,
+                        'message': job.message,
+                        'masks': [
+                            {
+                                'page_index': mask.page_index,
+                                'rect': {
+                                    'x0': mask.rect.x0,
+                                    'y0': mask.rect.y0,
+                                    'x1': mask.rect.x1,
+                                    'y1': mask.rect.y1,
+                                },
+                                'note': mask.note,
+                            }
+                            for mask in job.masks
+                        ],
+                    }
+                    for job in self._jobs.values()
+                ],
+            }
+
+            temp_path = self.journal_path + ".tmp"
+            with open(temp_path, 'w', encoding='utf-8') as f:
+                json.dump(data, f, indent=2, ensure_ascii=False)
+                f.flush()
+                os.fsync(f.fileno())
+            os.replace(temp_path, self.journal_path)
+
+        except Exception as e:
+            print(f"저장 작업 기록 오류: {str(e)}")
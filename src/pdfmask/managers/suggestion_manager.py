@@ -0,0 +1,321 @@
+"""
+자동 마스킹 제안 모듈
+
+페이지 텍스트에서 개인정보 패턴(주민등록번호, 전화번호, 계좌번호, 이메일)을 찾아
+마스킹 후보를 제안합니다. 텍스트 추출은 렌더링과 같은 작업자 프로세스에서 수행하므로
+(PyMuPDF는 GIL을 해제하지 않음) 검색 중에도 화면이 멈추지 않습니다.
+"""
+
+import re
+from dataclasses import dataclass
+from typing import Dict, List, Optional, Sequence, Tuple
+
+import fitz  # PyMuPDF
+from PyQt6.QtCore import QObject, pyqtSignal
+
+from ..core.models import MaskEntry
+from .render_pool import RenderWorkerPool, _open_worker_doc
+
+
+# 작업 하나에서 검색할 페이지 수 (결과를 페이지 묶음 단위로 바로 표시)
+SUGGESTION_BATCH_PAGES = 4
+
+# 제안된 마스킹의 메모 앞에 붙는 표시
+SUGGESTION_NOTE_PREFIX = "[자동] "
+
+# 페이지별 검색 결과: (페이지 인덱스, [(영역 좌표, 규칙 이름), ...])
+PageSuggestions = Tuple[int, List[Tuple[Tuple[float, float, float, float], str]]]
+
+
+@dataclass(frozen=True)
+class SuggestionRule:
+    """
+    자동 마스킹 제안 규칙
+
+    Attributes:
+        name (str): 규칙 이름 (작업자 프로세스에 전달하는 식별자)
+        label (str): 화면에 표시할 이름 (마스킹 메모)
+        pattern (re.Pattern): 미리 컴파일한 정규식
+        min_digits (int): 일치한 문자열에 들어 있어야 하는 최소 숫자 수
+    """
+    name: str
+    label: str
+    pattern: re.Pattern
+    min_digits: int = 0
+
+
+# 기본 제안 규칙 (앞의 규칙과 겹치는 뒤 규칙의 결과는 버림)
+BUILTIN_RULES: Tuple[SuggestionRule, ...] = (
+    SuggestionRule(
+        "rrn", "주민등록번호",
+        # 생년월일(YYMMDD) - 성별 및 출생 구분(1~8) + 6자리 (외국인등록번호 포함)
+        re.compile(r"(?<!\d)\d{2}(?:0[1-9]|1[0-2])(?:0[1-9]|[12]\d|3[01])\s?-?\s?[1-8]\d{6}(?!\d)"),
+    ),
+    SuggestionRule(
+        "phone", "전화번호",
+        # 휴대전화(010 등), 지역번호(02, 031 ~ 064), 인터넷전화(070)
+        re.compile(r"(?<!\d)(?:01[016789]|02|0[3-6][1-5]|070)[-.\s]?\d{3,4}[-.\s]?\d{4}(?!\d)"),
+    ),
+    SuggestionRule(
+        "account", "계좌번호",
+        # 은행마다 자릿수가 다르므로 하이픈으로 구분된 숫자 10자리 이상
+        re.compile(r"(?<![\d-])\d{2,6}-\d{2,6}-\d{2,7}(?:-\d{1,3})?(?![\d-])"),
+        min_digits=10,
+    ),
+    SuggestionRule(
+        "email", "이메일",
+        re.compile(r"[A-Za-z0-9._%+-]+@[A-Za-z0-9-]+(?:\.[A-Za-z0-9-]+)*\.[A-Za-z]{2,}"),
+    ),
+)
+
+_RULES_BY_NAME: Dict[str, SuggestionRule] = {rule.name: rule for rule in BUILTIN_RULES}
+
+
+def _match_rect(
+    words: Sequence[Tuple[int, int, tuple]],
+    start: int,
+    end: int
+) -> fitz.Rect:
+    """
+    한 줄 문자열에서 일치한 구간 [start, end)을 덮는 영역 계산
+
+    단어 일부만 일치한 경우 글자 수 비율로 잘라내되, 글자 폭이 달라도
+    가려지지 않는 부분이 없도록 잘린 쪽으로 반 글자 폭만큼 여유를 둡니다.
+
+    Args:
+        words: (단어 시작 위치, 단어 끝 위치, 단어 정보) 목록
+        start: 일치 시작 위치
+        end: 일치 끝 위치
+
+    Returns:
+        fitz.Rect: 마스킹 영역
+    """
+    rect = fitz.Rect()
+    for word_start, word_end, word in words:
+        if word_end <= start or word_start >= end:
+            continue
+        x0, y0, x1, y1 = word[:4]
+        length = word_end - word_start
+        char_width = (x1 - x0) / length
+        if start > word_start:
+            x0 = max(x0, x0 + char_width * (start - word_start - 0.5))
+        if end < word_end:
+            x1 = min(x1, x1 - char_width * (word_end - end - 0.5))
+        rect |= fitz.Rect(x0, y0, x1, y1)
+    return rect
+
+
+def find_page_suggestions(page: fitz.Page, rule_names: Sequence[str]) -> List[Tuple[fitz.Rect, str]]:
+    """
+    페이지 텍스트에서 규칙에 맞는 마스킹 후보 검색
+
+    page.get_text("words")의 단어를 줄 단위로 이어 붙여 검색하므로
+    "010 1234 5678"처럼 여러 단어로 나뉜 번호도 찾습니다.
+
+    Args:
+        page: 검색할 페이지
+        rule_names: 사용할 규칙 이름 목록 (앞의 규칙이 우선)
+
+    Returns:
+        List[Tuple[fitz.Rect, str]]: (마스킹 영역, 규칙 이름) 목록
+    """
+    rules = [_RULES_BY_NAME[name] for name in rule_names]
+
+    # 줄별 단어 모음: (블록 번호, 줄 번호) → 단어 목록
+    lines: Dict[Tuple[int, int], List[tuple]] = {}
+    for word in page.get_text("words"):
+        lines.setdefault((word[5], word[6]), []).append(word)
+
+    results = []
+    for line_words in lines.values():
+        line_words.sort(key=lambda w: w[7])
+
+        # 단어를 공백으로 이어 붙이고 각 단어의 문자열 위치 기록
+        spans = []
+        parts = []
+        offset = 0
+        for word in line_words:
+            spans.append((offset, offset + len(word[4]), word))
+            parts.append(word[4])
+            offset += len(word[4]) + 1
+        text = " ".join(parts)
+
+        taken: List[Tuple[int, int]] = []
+        for rule in rules:
+            for match in rule.pattern.finditer(text):
+                start, end = match.span()
+                if any(start < t_end and t_start < end for t_start, t_end in taken):
+                    continue
+                if rule.min_digits and sum(c.isdigit() for c in match.group()) < rule.min_digits:
+                    continue
+                taken.append((start, end))
+                rect = _match_rect(spans, start, end)
+                if not rect.is_empty:
+                    results.append((rect, rule.name))
+    return results
+
+
+def find_suggestions(
+    doc_id: int,
+    path: str,
+    password: str,
+    page_indices: List[int],
+    rule_names: Sequence[str]
+) -> List[PageSuggestions]:
+    """
+    작업자 프로세스에서 여러 페이지의 마스킹 후보 검색
+
+    Args:
+        doc_id: 문서 식별자
+        path: PDF 파일 경로
+        password: PDF 암호
+        page_indices: 검색할 페이지 인덱스 목록
+        rule_names: 사용할 규칙 이름 목록
+
+    Returns:
+        List[PageSuggestions]: 페이지별 (영역 좌표, 규칙 이름) 목록
+    """
+    doc = _open_worker_doc(doc_id, path, password)
+    results = []
+    for page_index in page_indices:
+        found = find_page_suggestions(doc.load_page(page_index), rule_names)
+        results.append((page_index, [(tuple(rect), name) for rect, name in found]))
+    return results
+
+
+class SuggestionManager(QObject):
+    """
+    문서 전체의 자동 마스킹 제안을 백그라운드에서 찾는 클래스
+
+    페이지 묶음마다 작업자 프로세스에 검색을 요청하고, 후보를 찾은 페이지는
+    바로 suggestionsFound 시그널로 알리므로 문서 전체 검색이 끝나기 전에도
+    앞쪽 페이지의 제안을 확인할 수 있습니다.
+    """
+
+    # 시그널: 페이지에서 마스킹 후보 찾음 (페이지 인덱스, MaskEntry 리스트)
+    suggestionsFound = pyqtSignal(int, object)
+
+    # 시그널: 검색 진행 (검색한 페이지 수, 전체 페이지 수)
+    progressChanged = pyqtSignal(int, int)
+
+    # 시그널: 검색 완료 (찾은 후보 수)
+    finished = pyqtSignal(int)
+
+    def __init__(
+        self,
+        render_pool: RenderWorkerPool,
+        rules: Optional[Sequence[str]] = None,
+        parent: Optional[QObject] = None
+    ) -> None:
+        """
+        초기화
+
+        Args:
+            render_pool: 검색을 수행할 작업자 프로세스 풀
+            rules: 사용할 규칙 이름 목록 (기본값: 모든 기본 규칙)
+            parent: 부모 객체
+        """
+        super().__init__(parent)
+        self.render_pool = render_pool
+        self.rules: Tuple[str, ...] = tuple(rules) if rules is not None else tuple(_RULES_BY_NAME)
+
+        # 현재 검색 정보 (검색할 때마다 새 run_id, 이전 검색의 늦은 결과는 버림)
+        self._run_id: int = 0
+        self._running: bool = False
+        self._doc_id: int = 0
+        self._path: str = ""
+        self._password: str = ""
+        self._missing: List[int] = []
+        self._page_count: int = 0
+        self._searched: int = 0
+        self._found: int = 0
+
+        self.render_pool.taskFinished.connect(self._on_task_finished)
+        self.render_pool.taskFailed.connect(self._on_task_failed)
+
+    def start(self, doc_id: int, path: str, password: str, page_count: int) -> None:
+        """
+        문서 전체 검색 시작 (진행 중인 검색은 취소)
+
+        Args:
+            doc_id: 문서 식별자
+            path: PDF 파일 경로
+            password: PDF 암호
+            page_count: 전체 페이지 수
+        """
+        self.cancel()
+        self._run_id += 1
+        self._running = True
+        self._doc_id = doc_id
+        self._path = path
+        self._password = password
+        self._missing = list(range(page_count))
+        self._page_count = page_count
+        self._searched = 0
+        self._found = 0
+        self._submit_next_batch()
+
+    def cancel(self) -> None:
+        """진행 중인 검색 취소 (이미 실행 중인 묶음의 결과는 버림)"""
+        self.render_pool.cancel_tasks("suggestions")
+        self._running = False
+        self._missing = []
+        self._password = ""
+
+    def is_running(self) -> bool:
+        """검색 진행 여부"""
+        return self._running
+
+    def _submit_next_batch(self) -> None:
+        """아직 검색하지 않은 페이지의 다음 묶음 요청"""
+        if not self._running:
+            return
+
+        if not self._missing:
+            self._running = False
+            self._password = ""
+            self.finished.emit(self._found)
+            return
+
+        batch = self._missing[:SUGGESTION_BATCH_PAGES]
+        key = ("suggestions", self._run_id, batch[0])
+        if self.render_pool.submit_task(
+            key, find_suggestions,
+            self._doc_id, self._path, self._password, batch, self.rules
+        ):
+            del self._missing[:len(batch)]
+
+    def _on_task_finished(self, key: object, result: object) -> None:
+        """검색 작업 완료 처리"""
+        if not self._is_current_task(key):
+            return
+
+        for page_index, found in result:
+            self._searched += 1
+            if not found:
+                continue
+            masks = [
+                MaskEntry(
+                    page_index=page_index,
+                    rect=fitz.Rect(rect),
+                    note=SUGGESTION_NOTE_PREFIX + _RULES_BY_NAME[name].label
+                )
+                for rect, name in found
+            ]
+            self._found += len(masks)
+            self.suggestionsFound.emit(page_index, masks)
+
+        self.progressChanged.emit(self._searched, self._page_count)
+        self._submit_next_batch()
+
+    def _on_task_failed(self, key: object) -> None:
+        """검색 작업 실패 시 해당 묶음은 건너뛰고 계속 진행"""
+        if self._is_current_task(key):
+            self._submit_next_batch()
+
+    def _is_current_task(self, key: object) -> bool:
+        """현재 검색의 작업인지 확인"""
+        return (
+            self._running and isinstance(key, tuple) and len(key) == 3
+            and key[0] == "suggestions" and key[1] == self._run_id
+        )
@@ -0,0 +1,456 @@
+"""
+마스킹 템플릿 관리 모듈
+
+같은 양식의 PDF가 많은 폴더에서, 한 파일에 그린 마스킹을 템플릿으로 저장해
+나머지 파일에 한 번에 적용합니다. 파일별 문서 지문 계산, 페이지 크기 확인과
+미리보기 생성은 작업자 프로세스에서 수행합니다.
+"""
+
+import os
+import json
+import itertools
+from concurrent.futures import Future, ThreadPoolExecutor
+from datetime import datetime
+from typing import Dict, List, Optional, Sequence, Tuple
+
+import fitz  # PyMuPDF
+from PyQt6.QtCore import QObject, pyqtSignal
+from PyQt6.QtGui import QImage
+
+from ..core.models import MaskEntry, MaskTemplate
+from .pdf_manager import MaskRecord, to_mask_records
+from .mask_data_manager import MaskDataManager, compute_fingerprint
+from .render_pool import RenderWorkerPool, RenderResult
+from .image_bridge import image_from_samples
+
+
+# 페이지 크기 비교 허용 오차 (가로세로 비율 차이, 3%)
+# 허용 오차 안이면 크기 비율대로 마스킹 좌표를 늘리거나 줄이고, 벗어나면 다른 양식으로 보고 건너뜀
+PAGE_ASPECT_TOLERANCE = 0.03
+
+# 미리보기 긴 변의 픽셀 수
+TEMPLATE_PREVIEW_SIZE = 360
+
+# 미리보기에서 마스킹 영역을 칠할 색 (RGB)
+PREVIEW_MASK_COLOR = (230, 40, 40)
+
+# 작업 키 발급기 (적용할 때마다 새 값, 이전 적용의 늦은 결과는 버림)
+_run_ids = itertools.count(1)
+
+
+def fit_template_masks(
+    template_sizes: Sequence[Tuple[float, float]],
+    records: Sequence[MaskRecord],
+    target_sizes: Sequence[Tuple[float, float]]
+) -> Tuple[List[Tuple[int, Tuple[float, float, float, float]]], int]:
+    """
+    템플릿 마스킹 좌표를 대상 문서의 페이지 크기에 맞춤
+
+    스캔 해상도나 용지 여백 차이로 페이지 크기가 조금 다른 경우 크기 비율대로
+    좌표를 조정합니다. 대상 문서에 없는 페이지이거나 가로세로 비율이 허용 오차를
+    벗어나는 페이지(다른 양식, 회전된 페이지)의 마스킹은 건너뜁니다.
+
+    Args:
+        template_sizes: 템플릿 문서의 페이지별 크기 (너비, 높이)
+        records: 템플릿 마스킹 정보 (페이지 인덱스, (x0, y0, x1, y1))
+        target_sizes: 대상 문서의 페이지별 크기 (너비, 높이)
+
+    Returns:
+        Tuple[List[Tuple[int, Tuple[float, float, float, float]]], int]:
+            ((템플릿 마스킹 순번, 조정된 좌표) 목록, 건너뛴 마스킹 수)
+    """
+    fitted = []
+    skipped = 0
+    for number, (page_index, (x0, y0, x1, y1)) in enumerate(records):
+        if page_index >= len(target_sizes) or page_index >= len(template_sizes):
+            skipped += 1
+            continue
+
+        src_width, src_height = template_sizes[page_index]
+        dst_width, dst_height = target_sizes[page_index]
+        if min(src_width, src_height, dst_width, dst_height) <= 0:
+            skipped += 1
+            continue
+
+        src_aspect = src_width / src_height
+        dst_aspect = dst_width / dst_height
+        if abs(dst_aspect - src_aspect) / src_aspect > PAGE_ASPECT_TOLERANCE:
+            skipped += 1
+            continue
+
+        sx = dst_width / src_width
+        sy = dst_height / src_height
+        fitted.append((number, (x0 * sx, y0 * sy, x1 * sx, y1 * sy)))
+    return fitted, skipped
+
+
+def prepare_template_file(
+    path: str,
+    template_sizes: Sequence[Tuple[float, float]],
+    records: Sequence[MaskRecord],
+    preview_size: int
+) -> Tuple[str, List[Tuple[int, Tuple[float, float, float, float]]], int, Optional[Tuple[int, RenderResult]]]:
+    """
+    작업자 프로세스에서 파일 하나에 템플릿을 맞추고 미리보기 생성
+
+    미리보기는 마스킹이 있는 첫 페이지를 축소 렌더링한 뒤 마스킹 영역을 칠한 이미지입니다.
+    화면 렌더링용 문서 핸들과 섞이지 않도록 파일을 따로 열고 닫습니다.
+    저장된 마스킹 데이터를 찾고 저장할 때 쓰는 문서 지문도 여기서 계산하여
+    화면 스레드에서 파일을 읽지 않게 합니다.
+
+    Args:
+        path: PDF 파일 경로
+        template_sizes: 템플릿 문서의 페이지별 크기
+        records: 템플릿 마스킹 정보
+        preview_size: 미리보기 긴 변의 픽셀 수
+
+    Returns:
+        Tuple: (문서 지문, 맞춘 마스킹 목록, 건너뛴 마스킹 수,
+            (미리보기 페이지 인덱스, 렌더링 결과) 또는 None)
+
+    Raises:
+        ValueError: 암호로 보호된 파일인 경우
+    """
+    fingerprint = compute_fingerprint(path)
+    with fitz.open(path) as doc:
+        if doc.needs_pass:
+            raise ValueError("암호로 보호된 파일에는 템플릿을 적용할 수 없습니다.")
+
+        target_sizes = [(page.rect.width, page.rect.height) for page in doc]
+        fitted, skipped = fit_template_masks(template_sizes, records, target_sizes)
+        if not fitted:
+            return fingerprint, fitted, skipped, None
+
+        page_index = records[fitted[0][0]][0]
+        page = doc.load_page(page_index)
+        zoom = preview_size / max(page.rect.width, page.rect.height, 1)
+        pix = page.get_pixmap(matrix=fitz.Matrix(zoom, zoom), colorspace=fitz.csRGB)
+        for number, rect in fitted:
+            if records[number][0] == page_index:
+                pix.set_rect((fitz.Rect(rect) * zoom).irect, PREVIEW_MASK_COLOR)
+
+        preview = (pix.samples, pix.width, pix.height, pix.stride, pix.n, bool(pix.alpha))
+        return fingerprint, fitted, skipped, (page_index, preview)
+
+
+class TemplateManager:
+    """
+    마스킹 템플릿을 JSON 파일로 저장/로드하는 클래스
+
+    프로젝트 루트의 mask_templates/templates.json에 이름별로 저장합니다.
+    """
+
+    def __init__(self, templates_dir: Optional[str] = None) -> None:
+        """
+        초기화
+
+        Args:
+            templates_dir: 템플릿 저장 폴더 (기본값: 프로젝트 루트의 mask_templates)
+        """
+        if templates_dir is None:
+            # 프로젝트 루트 경로 (src/pdfmask/managers/ -> src/ -> project_root/)
+            current_file = os.path.abspath(__file__)
+            managers_dir = os.path.dirname(current_file)  # managers/
+            pdfmask_dir = os.path.dirname(managers_dir)   # pdfmask/
+            src_dir = os.path.dirname(pdfmask_dir)        # src/
+            project_root = os.path.dirname(src_dir)       # project_root/
+            templates_dir = os.path.join(project_root, "mask_templates")
+        self.templates_dir = templates_dir
+        self.templates_file = os.path.join(templates_dir, "templates.json")
+
+    def load_templates(self) -> Tuple[bool, Dict[str, MaskTemplate], str]:
+        """
+        저장된 모든 템플릿 로드
+
+        Returns:
+            Tuple[bool, Dict[str, MaskTemplate], str]: (성공 여부, 이름 → 템플릿, 메시지)
+        """
+        try:
+            if not os.path.exists(self.templates_file):
+                return True, {}, "저장된 템플릿 없음"
+
+            with open(self.templates_file, 'r', encoding='utf-8') as f:
+                data = json.load(f)
+
+            templates = {}
+            for name, entry in data.get('templates', {}).items():
+                masks = [
+                    MaskEntry(
+                        page_index=mask_data['page_index'],
+                        rect=fitz.Rect(mask_data['rect']),
+                        note=mask_data.get('note', '')
+                    )
+                    for mask_data in entry.get('masks', [])
+                ]
+                page_sizes = [tuple(size) for size in entry.get('page_sizes', [])]
+                templates[name] = MaskTemplate(name=name, page_sizes=page_sizes, masks=masks)
+
+            return True, templates, f"{len(templates)}개의 템플릿 로드 완료"
+
+        except Exception as e:
+            return False, {}, f"템플릿 로드 실패: {str(e)}"
+
+    def save_template(self, template: MaskTemplate) -> Tuple[bool, str]:
+        """
+        템플릿 저장 (같은 이름이 있으면 덮어씀)
+
+        Args:
+            template: 저장할 템플릿
+
+        Returns:
+            Tuple[bool, str]: (성공 여부, 파일 경로 또는 오류 메시지)
+        """
+        try:
+            data = self._read_data()
+            data['templates'][template.name] = {
+                'saved_at': datetime.now().isoformat(),
+                'page_sizes': [list(size) for size in template.page_sizes],
+                'masks': [
+                    {
+                        'page_index': mask.page_index,
+                        'rect': [mask.rect.x0, mask.rect.y0, mask.rect.x1, mask.rect.y1],
+                        'note': mask.note,
+                    }
+                    for mask in template.masks
+                ],
+            }
+            self._write_data(data)
+            return True, self.templates_file
+
+        except Exception as e:
+            return False, f"템플릿 저장 실패: {str(e)}"
+
+    def delete_template(self, name: str) -> Tuple[bool, str]:
+        """
+        템플릿 삭제
+
+        Args:
+            name: 템플릿 이름
+
+        Returns:
+            Tuple[bool, str]: (성공 여부, 메시지)
+        """
+        try:
+            data = self._read_data()
+            if data['templates'].pop(name, None) is None:
+                return True, "해당 템플릿 없음"
+            self._write_data(data)
+            return True, "템플릿 삭제 완료"
+
+        except Exception as e:
+            return False, f"템플릿 삭제 실패: {str(e)}"
+
+    def _read_data(self) -> dict:
+        """템플릿 파일 읽기 (없으면 빈 데이터)"""
+        if not os.path.exists(self.templates_file):
+            return {'templates': {}}
+        with open(self.templates_file, 'r', encoding='utf-8') as f:
+            data = json.load(f)
+        data.setdefault('templates', {})
+        return data
+
+    def _write_data(self, data: dict) -> None:
+        """템플릿 파일 쓰기 (임시 파일에 쓴 뒤 교체)"""
+        os.makedirs(self.templates_dir, exist_ok=True)
+        temp_path = self.templates_file + ".tmp"
+        with open(temp_path, 'w', encoding='utf-8') as f:
+            json.dump(data, f, indent=2, ensure_ascii=False)
+        os.replace(temp_path, self.templates_file)
+
+
+class TemplateReplay(QObject):
+    """
+    템플릿을 여러 PDF 파일에 백그라운드로 적용하는 클래스
+
+    파일마다 작업자 프로세스에서 문서 지문, 페이지 크기에 맞춘 마스킹과 미리보기를 만들고,
+    저장 스레드에서 저장된 마스킹 데이터가 있는지 확인한 뒤 없으면 템플릿 마스킹을 저장하여
+    완료되는 대로 fileReady 시그널로 알립니다 (화면 스레드에서 파일을 읽거나 데이터베이스에 쓰지 않음).
+    작업은 한 번에 하나씩 요청하므로 나머지 작업자는 화면 렌더링에 계속 사용됩니다.
+    """
+
+    # 시그널: 파일 준비됨, 마스킹 데이터 저장 완료 (파일 경로, MaskEntry 리스트, 건너뛴 마스킹 수, 미리보기 QImage 또는 None)
+    fileReady = pyqtSignal(str, object, int, object)
+
+    # 시그널: 저장된 마스킹 데이터가 있어 적용하지 않음 (파일 경로)
+    fileSkipped = pyqtSignal(str)
+
+    # 시그널: 파일 처리 실패 (파일 경로)
+    fileFailed = pyqtSignal(str)
+
+    # 시그널: 모든 파일 처리 완료 (준비된 파일 수)
+    finished = pyqtSignal(int)
+
+    # 내부 시그널: 저장 스레드 작업 완료 (작업 키, Future) - 화면 스레드로 전달
+    _storeDone = pyqtSignal(object, object)
+
+    def __init__(
+        self,
+        render_pool: RenderWorkerPool,
+        mask_data_manager: MaskDataManager,
+        parent: Optional[QObject] = None
+    ) -> None:
+        """
+        초기화
+
+        Args:
+            render_pool: 작업을 수행할 작업자 프로세스 풀
+            mask_data_manager: 템플릿 마스킹을 저장할 마스킹 데이터 관리자
+            parent: 부모 객체
+        """
+        super().__init__(parent)
+        self.render_pool = render_pool
+        self.mask_data_manager = mask_data_manager
+
+        # 저장된 마스킹 확인과 저장 (파일 순서대로 하나씩)
+        self._store_executor = ThreadPoolExecutor(max_workers=1, thread_name_prefix="template")
+        self._storing: int = 0
+
+        self._run_id: int = 0
+        self._running: bool = False
+        self._template: Optional[MaskTemplate] = None
+        self._records: List[MaskRecord] = []
+        self._paths: List[str] = []
+        self._next: int = 0
+        self._ready: int = 0
+
+        self.render_pool.taskFinished.connect(self._on_task_finished)
+        self.render_pool.taskFailed.connect(self._on_task_failed)
+        self._storeDone.connect(self._on_store_done)
+
+    def start(self, template: MaskTemplate, paths: Sequence[str]) -> None:
+        """
+        템플릿 적용 시작 (진행 중인 적용은 취소)
+
+        Args:
+            template: 적용할 템플릿
+            paths: 적용할 PDF 파일 경로 목록
+        """
+        self.cancel()
+        self._run_id = next(_run_ids)
+        self._running = True
+        self._template = template
+        self._records = to_mask_records(template.masks)
+        self._paths = list(paths)
+        self._next = 0
+        self._ready = 0
+        self._storing = 0
+        self._submit_next()
+
+    def cancel(self) -> None:
+        """진행 중인 적용 취소 (이미 실행 중인 파일의 결과는 버림)"""
+        self.render_pool.cancel_tasks("template")
+        self._running = False
+        self._paths = []
+
+    def shutdown(self) -> None:
+        """적용 취소 후 진행 중인 마스킹 데이터 저장이 끝날 때까지 대기"""
+        self.cancel()
+        self._store_executor.shutdown(wait=True)
+
+    def is_running(self) -> bool:
+        """적용 진행 여부"""
+        return self._running
+
+    def _submit_next(self) -> None:
+        """다음 파일 작업 요청"""
+        if not self._running:
+            return
+
+        if self._next >= len(self._paths):
+            # 마지막 파일의 저장이 끝나면 완료
+            if self._storing == 0:
+                self._running = False
+                self.finished.emit(self._ready)
+            return
+
+        key = ("template", self._run_id, self._next)
+        self.render_pool.submit_task(
+            key, prepare_template_file,
+            self._paths[self._next], self._template.page_sizes, self._records, TEMPLATE_PREVIEW_SIZE
+        )
+
+    def _on_task_finished(self, key: object, result: object) -> None:
+        """파일 작업 완료 처리"""
+        if not self._is_current_task(key):
+            return
+
+        path = self._paths[key[2]]
+        fingerprint, fitted, skipped, preview = result
+        masks = [
+            MaskEntry(
+                page_index=self._records[number][0],
+                rect=fitz.Rect(rect),
+                note=self._template.masks[number].note
+            )
+            for number, rect in fitted
+        ]
+        image: Optional[QImage] = image_from_samples(*preview[1]) if preview is not None else None
+
+        # 저장된 마스킹 확인과 저장은 저장 스레드에서 (다음 파일 작업은 바로 요청)
+        self._storing += 1
+        future = self._store_executor.submit(self._store_masks, path, fingerprint, masks)
+        future.add_done_callback(
+            lambda f, k=key, p=path, m=masks, s=skipped, i=image: self._storeDone.emit(k, (f, p, m, s, i))
+        )
+        self._next += 1
+        self._submit_next()
+
+    def _store_masks(self, path: str, fingerprint: str, masks: List[MaskEntry]) -> bool:
+        """
+        저장 스레드: 저장된 마스킹 데이터가 없으면 템플릿 마스킹 저장
+
+        저장된 데이터는 열었을 때 불러오는 데이터와 같은 기준(문서 지문은 모든 날짜,
+        문서 지문이 없는 이전 데이터는 오늘 날짜의 같은 파일명)으로 찾아 덮어쓰지 않습니다.
+
+        Returns:
+            bool: 템플릿을 적용했는지 여부 (저장된 데이터가 있으면 False)
+
+        Raises:
+            RuntimeError: 조회 또는 저장 실패 시
+        """
+        success, saved_paths, msg = self.mask_data_manager.find_files_with_masks([path], {path: fingerprint})
+        if not success:
+            raise RuntimeError(msg)
+        if path in saved_paths:
+            return False
+        if masks:
+            success, msg = self.mask_data_manager.save_masks(path, masks, fingerprint)
+            if not success:
+                raise RuntimeError(msg)
+        return True
+
+    def _on_store_done(self, key: object, done: object) -> None:
+        """저장 스레드 작업 완료 처리 (화면 스레드)"""
+        if not self._is_current_task(key):
+            return
+
+        future, path, masks, skipped, image = done
+        self._storing -= 1
+        try:
+            applied = future.result()
+        except Exception as e:
+            print(f"템플릿 마스킹 데이터 저장 오류 ({os.path.basename(path)}): {str(e)}")
+            self.fileFailed.emit(path)
+        else:
+            if applied:
+                self._ready += 1
+                self.fileReady.emit(path, masks, skipped, image)
+            else:
+                self.fileSkipped.emit(path)
+        self._submit_next()
+
+    def _on_task_failed(self, key: object) -> None:
+        """파일 작업 실패 시 해당 파일은 건너뛰고 계속 진행"""
+        if not self._is_current_task(key):
+            return
+
+        self.fileFailed.emit(self._paths[key[2]])
+        self._next += 1
+        self._submit_next()
+
+    def _is_current_task(self, key: object) -> bool:
+        """현재 적용의 작업인지 확인"""
+        return (
+            self._running and isinstance(key, tuple) and len(key) == 3
+            and key[0] == "template" and key[1] == self._run_id
+        )
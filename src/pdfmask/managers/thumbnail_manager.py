@@ -0,0 +1,248 @@
+"""
+페이지 썸네일 관리 모듈
+"""
+
+import os
+import shutil
+import hashlib
+from typing import List, Optional, Set
+
+from PyQt6.QtCore import QObject, pyqtSignal
+from PyQt6.QtGui import QImage
+
+from .render_pool import RenderWorkerPool, render_thumbnails
+from .render_cache import RenderCache
+from .image_bridge import image_from_samples
+from .mask_data_manager import compute_fingerprint
+
+
+# 썸네일 긴 변의 픽셀 수
+THUMBNAIL_SIZE = 200
+
+# 작업 하나에서 만들 썸네일 수 (페이지 렌더링 작업이 오래 밀리지 않도록 나눠서 요청)
+THUMBNAIL_BATCH_PAGES = 8
+
+# 디스크에 보관할 최대 문서 수 (오래 사용하지 않은 문서부터 삭제)
+MAX_CACHED_DOCUMENTS = 200
+
+# 메모리에 올려 둘 썸네일 예산 (32 MB, 200px 썸네일 약 200장)
+THUMBNAIL_CACHE_BYTES = 32 * 1024 * 1024
+
+
+class ThumbnailManager(QObject):
+    """
+    페이지 썸네일을 백그라운드에서 만들고 디스크에 보관하는 클래스
+
+    썸네일은 문서 지문별 폴더에 페이지별 PNG로 저장되므로,
+    같은 파일을 다시 열면 (경로가 바뀌어도) 렌더링 없이 바로 표시됩니다.
+    디스크의 썸네일은 요청된 페이지만 읽고, 메모리에는 THUMBNAIL_CACHE_BYTES까지만 보관합니다.
+    암호화된 PDF의 썸네일은 내용이 노출되지 않도록 디스크에 저장하지 않습니다.
+    """
+
+    # 시그널: 새 썸네일 준비됨 (페이지 인덱스 리스트)
+    thumbnailsReady = pyqtSignal(object)
+
+    def __init__(
+        self,
+        render_pool: RenderWorkerPool,
+        cache_dir: Optional[str] = None,
+        parent: Optional[QObject] = None
+    ) -> None:
+        """
+        초기화
+
+        Args:
+            render_pool: 썸네일을 만들 작업자 프로세스 풀
+            cache_dir: 썸네일 저장 폴더 (기본값: 프로젝트 루트의 thumbnails_cache)
+            parent: 부모 객체
+        """
+        super().__init__(parent)
+        self.render_pool = render_pool
+
+        if cache_dir is None:
+            # 프로젝트 루트 경로 (src/pdfmask/managers/ -> src/ -> project_root/)
+            current_file = os.path.abspath(__file__)
+            managers_dir = os.path.dirname(current_file)  # managers/
+            pdfmask_dir = os.path.dirname(managers_dir)   # pdfmask/
+            src_dir = os.path.dirname(pdfmask_dir)        # src/
+            project_root = os.path.dirname(src_dir)       # project_root/
+            cache_dir = os.path.join(project_root, "thumbnails_cache")
+        self.cache_dir = cache_dir
+
+        # 현재 문서 정보
+        self._doc_id: int = 0
+        self._path: str = ""
+        self._password: str = ""
+        self._doc_dir: Optional[str] = None
+
+        # 메모리에 올린 썸네일 (키: (문서 식별자, 페이지 인덱스))
+        self._thumbnails = RenderCache(THUMBNAIL_CACHE_BYTES)
+
+        # 디스크에 있는 썸네일 / 디스크 없이 만든 썸네일 (암호화 문서) / 아직 만들지 않은 페이지
+        self._on_disk: Set[int] = set()
+        self._in_memory_only: Set[int] = set()
+        self._missing: List[int] = []
+
+        self.render_pool.taskFinished.connect(self._on_task_finished)
+        self.render_pool.taskFailed.connect(self._on_task_failed)
+
+    def open_document(
+        self,
+        doc_id: int,
+        path: str,
+        password: str,
+        page_count: int,
+        encrypted: bool = False
+    ) -> None:
+        """
+        문서의 썸네일 준비
+
+        디스크에 있는 썸네일은 바로 사용하고, 없는 페이지만 백그라운드에서 만듭니다.
+
+        Args:
+            doc_id: 문서 식별자
+            path: PDF 파일 경로
+            password: PDF 암호
+            page_count: 전체 페이지 수
+            encrypted: 암호화된 PDF 여부 (True면 디스크에 저장하지 않음)
+        """
+        self.close_document()
+
+        self._doc_id = doc_id
+        self._path = path
+        self._password = password
+
+        if not encrypted:
+            try:
+                self._doc_dir = os.path.join(self.cache_dir, self._document_key(path))
+                if os.path.isdir(self._doc_dir):
+                    # 최근 사용 시각 갱신 (오래된 문서 정리 기준)
+                    os.utime(self._doc_dir)
+                    for filename in os.listdir(self._doc_dir):
+                        name, ext = os.path.splitext(filename)
+                        if ext == ".png" and name.isdigit() and int(name) < page_count:
+                            self._on_disk.add(int(name))
+                else:
+                    self._prune()
+            except OSError as e:
+                print(f"썸네일 캐시 오류: {str(e)}")
+                self._doc_dir = None
+
+        self._missing = [i for i in range(page_count) if i not in self._on_disk]
+        self._submit_next_batch()
+
+    def close_document(self) -> None:
+        """현재 문서의 썸네일 작업 취소 및 메모리 해제"""
+        self.render_pool.cancel_tasks("thumbnails")
+        self._doc_id = 0
+        self._path = ""
+        self._password = ""
+        self._doc_dir = None
+        self._thumbnails.clear()
+        self._on_disk = set()
+        self._in_memory_only = set()
+        self._missing = []
+
+    def get_thumbnail(self, page_index: int) -> Optional[QImage]:
+        """
+        페이지 썸네일 반환
+
+        디스크에만 있는 썸네일은 요청될 때 읽어 옵니다.
+        메모리 예산 때문에 밀려난 암호화 문서의 썸네일은 다시 만들도록 요청합니다.
+
+        Args:
+            page_index: 페이지 인덱스 (0-based)
+
+        Returns:
+            Optional[QImage]: 썸네일 또는 None (아직 만들어지지 않은 경우)
+        """
+        image = self._thumbnails.get((self._doc_id, page_index))
+        if image is not None:
+            return image
+
+        if page_index in self._in_memory_only:
+            self._in_memory_only.discard(page_index)
+            self._missing.insert(0, page_index)
+            self._submit_next_batch()
+            return None
+
+        if page_index not in self._on_disk or self._doc_dir is None:
+            return None
+
+        image = QImage(os.path.join(self._doc_dir, f"{page_index}.png"))
+        if image.isNull():
+            # 손상된 파일은 다시 만들기
+            self._on_disk.discard(page_index)
+            self._missing.append(page_index)
+            self._submit_next_batch()
+            return None
+
+        self._thumbnails.put((self._doc_id, page_index), image)
+        return image
+
+    def _submit_next_batch(self) -> None:
+        """아직 만들지 않은 페이지의 다음 묶음 요청"""
+        if not self._missing or self._doc_id == 0:
+            return
+
+        batch = self._missing[:THUMBNAIL_BATCH_PAGES]
+        key = ("thumbnails", self._doc_id, batch[0])
+        if self.render_pool.submit_task(
+            key, render_thumbnails,
+            self._doc_id, self._path, self._password, batch, THUMBNAIL_SIZE, self._doc_dir
+        ):
+            del self._missing[:len(batch)]
+
+    def _on_task_finished(self, key: object, result: object) -> None:
+        """썸네일 작업 완료 처리"""
+        if not self._is_current_task(key):
+            return
+
+        ready = []
+        for page_index, samples in result:
+            self._thumbnails.put((self._doc_id, page_index), image_from_samples(*samples))
+            if self._doc_dir is not None:
+                self._on_disk.add(page_index)
+            else:
+                self._in_memory_only.add(page_index)
+            ready.append(page_index)
+
+        self.thumbnailsReady.emit(ready)
+        self._submit_next_batch()
+
+    def _on_task_failed(self, key: object) -> None:
+        """썸네일 작업 실패 시 해당 묶음은 건너뛰고 계속 진행"""
+        if self._is_current_task(key):
+            self._submit_next_batch()
+
+    def _is_current_task(self, key: object) -> bool:
+        """현재 문서의 썸네일 작업인지 확인"""
+        return (
+            isinstance(key, tuple) and len(key) == 3
+            and key[0] == "thumbnails" and key[1] == self._doc_id != 0
+        )
+
+    def _document_key(self, path: str) -> str:
+        """
+        썸네일 폴더 이름 (문서 지문의 해시)
+
+        파일 전체 대신 크기와 앞/뒤 1MB만 읽는 문서 지문을 사용하므로
+        큰 스캔 문서도 화면 스레드를 멈추지 않습니다.
+        """
+        key = compute_fingerprint(path)
+        if not key:
+            raise OSError(f"파일을 읽을 수 없습니다: {path}")
+        return hashlib.blake2b(key.encode('utf-8'), digest_size=12).hexdigest()
+
+    def _prune(self) -> None:
+        """보관 문서 수를 넘으면 오래 사용하지 않은 문서의 썸네일 삭제"""
+        if not os.path.isdir(self.cache_dir):
+            return
+
+        entries = [entry for entry in os.scandir(self.cache_dir) if entry.is_dir()]
+        if len(entries) < MAX_CACHED_DOCUMENTS:
+            return
+
+        entries.sort(key=lambda entry: entry.stat().st_mtime)
+        for entry in entries[:len(entries) - MAX_CACHED_DOCUMENTS + 1]:
+            shutil.rmtree(entry.path, ignore_errors=True)
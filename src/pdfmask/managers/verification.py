@@ -0,0 +1,338 @@
+"""
+마스킹 결과 검증 모듈
+
+저장한 결과 파일을 다시 열어 마스킹 영역마다 글자가 남아 있지 않은지,
+화면에 채움 색 외의 내용이 보이지 않는지 확인합니다.
+텍스트는 가까운 마스킹 영역끼리 묶어서 추출하고, 렌더링은 페이지를 한 번만 해석한 뒤
+마스킹 영역만 잘라서 하므로 저장 시간에 비해 부담이 작습니다.
+
+페이지에 보이지 않아도 파일에 남는 내용(참조가 끊긴 원본 내용 스트림,
+이어 붙여 저장하기 전의 이전 버전)이 있는지도 파일 단위로 확인합니다.
+"""
+
+import re
+import time
+from dataclasses import dataclass, field
+from typing import Dict, Iterable, List, Sequence, Tuple
+
+import fitz  # PyMuPDF
+
+from ..core.models import MaskEntry
+
+
+# 영역 렌더링 배율 (72 dpi, 남은 글자나 이미지를 찾기에 충분)
+VERIFY_ZOOM = 1.0
+
+# 영역 렌더링 시 가장자리에서 안쪽으로 줄이는 폭 (pt)
+# 마스킹 경계의 안티에일리어싱 때문에 바깥 내용과 섞인 픽셀은 검사하지 않음
+VERIFY_EDGE_INSET = 1.0
+
+# 텍스트 추출 범위를 마스킹 영역보다 넓히는 폭 (pt, 경계에 걸친 글자 포함)
+VERIFY_TEXT_MARGIN = 12.0
+
+# 텍스트 추출 옵션 (이미지 정보는 필요 없음)
+VERIFY_TEXT_FLAGS = fitz.TEXT_PRESERVE_LIGATURES | fitz.TEXT_MEDIABOX_CLIP
+
+# 오류 메시지에 표시할 최대 문제 수
+MAX_REPORTED_ISSUES = 5
+
+# 객체 참조 (예: "12 0 R")
+_OBJECT_REFERENCE = re.compile(r"\b(\d+)\s+\d+\s+R\b")
+
+# 다른 객체가 참조하지 않는 것이 정상인 파일 구조 객체 (교차 참조 스트림, 객체 스트림)
+STRUCTURAL_OBJECT_TYPES = ("/XRef", "/ObjStm")
+
+
+@dataclass
+class VerificationIssue:
+    """
+    검증에 실패한 마스킹 영역
+
+    파일 단위 문제는 page_index가 -1이고 rect가 빈 영역입니다.
+
+    Attributes:
+        page_index (int): 페이지 인덱스 (0-based, 파일 단위 문제는 -1)
+        rect (fitz.Rect): 마스킹 영역
+        reason (str): 실패 원인 ("text": 글자가 남음, "pixels": 채움 색 외의 내용이 보임,
+            "unreachable": 어디에서도 참조하지 않는 객체가 남음, "revisions": 이전 버전이 남음)
+        detail (str): 남은 글자 또는 상세 설명
+    """
+    page_index: int
+    rect: fitz.Rect
+    reason: str
+    detail: str = ""
+
+    def describe(self) -> str:
+        """한 줄 설명"""
+        if self.reason == "unreachable":
+            return f"파일: 참조되지 않는 객체가 남아 있음 {self.detail}"
+        if self.reason == "revisions":
+            return f"파일: 이어 붙여 저장하기 전의 이전 버전이 남아 있음 {self.detail}"
+        rect = self.rect
+        where = f"페이지 {self.page_index + 1} ({rect.x0:.0f}, {rect.y0:.0f}, {rect.x1:.0f}, {rect.y1:.0f})"
+        if self.reason == "text":
+            return f"{where}: 글자가 남아 있음 '{self.detail}'"
+        return f"{where}: 채움 색 외의 내용이 보임 {self.detail}".rstrip()
+
+
+@dataclass
+class VerificationResult:
+    """
+    마스킹 결과 검증 결과
+
+    Attributes:
+        checked (int): 검사한 마스킹 영역 수
+        pages (int): 검사한 페이지 수
+        elapsed (float): 검증 시간 (초)
+        issues (List[VerificationIssue]): 검증에 실패한 영역 (파일 단위 문제 포함)
+    """
+    checked: int = 0
+    pages: int = 0
+    elapsed: float = 0.0
+    issues: List[VerificationIssue] = field(default_factory=list)
+
+    @property
+    def passed(self) -> bool:
+        """모든 영역이 검증을 통과했는지 여부"""
+        return not self.issues
+
+    def summary(self) -> str:
+        """로그와 오류 메시지에 사용할 요약"""
+        if self.passed:
+            return f"검증 통과 ({self.pages}개 페이지, {self.checked}개 영역, {self.elapsed * 1000:.0f} ms)"
+        lines = [issue.describe() for issue in self.issues[:MAX_REPORTED_ISSUES]]
+        if len(self.issues) > MAX_REPORTED_ISSUES:
+            lines.append(f"외 {len(self.issues) - MAX_REPORTED_ISSUES}개")
+        failed = sum(1 for issue in self.issues if issue.page_index >= 0)
+        return f"마스킹 검증 실패 ({failed}/{self.checked}개 영역): " + "; ".join(lines)
+
+
+def _fill_pixel(fill: Sequence[float]) -> bytes:
+    """0~1 범위 RGB 색을 픽셀 하나의 샘플 데이터로 변환"""
+    return bytes(int(round(component * 255)) for component in fill)
+
+
+def _group_rects(rects: Sequence[fitz.Rect], page_rect: fitz.Rect) -> List[Tuple[fitz.Rect, List[int]]]:
+    """
+    텍스트 추출 여유 폭 안에서 서로 겹치는 마스킹 영역끼리 묶기
+
+    Args:
+        rects: 마스킹 영역 목록
+        page_rect: 페이지 영역
+
+    Returns:
+        List[Tuple[fitz.Rect, List[int]]]: (추출 범위, 묶음에 속한 영역 번호) 목록
+    """
+    margin = (-VERIFY_TEXT_MARGIN, -VERIFY_TEXT_MARGIN, VERIFY_TEXT_MARGIN, VERIFY_TEXT_MARGIN)
+    clips: List[fitz.Rect] = []
+    members: List[List[int]] = []
+    for number in sorted(range(len(rects)), key=lambda n: (rects[n].y0, rects[n].x0)):
+        clip = (rects[number] + margin) & page_rect
+        for group, group_clip in enumerate(clips):
+            if group_clip.intersects(clip):
+                clips[group] = group_clip | clip
+                members[group].append(number)
+                break
+        else:
+            clips.append(clip)
+            members.append([number])
+    return list(zip(clips, members))
+
+
+def verify_page(
+    page: fitz.Page,
+    rects: Sequence[fitz.Rect],
+    fill: Sequence[float] = (1, 1, 1)
+) -> List[VerificationIssue]:
+    """
+    한 페이지의 마스킹 영역 검증
+
+    텍스트는 가까운 영역끼리 묶어 묶음마다 한 번만 추출하여, 글자 중심이 마스킹 영역 안에
+    있는 글자가 남아 있는지 확인합니다. 픽셀은 페이지를 한 번 해석한 DisplayList에서
+    영역별로 잘라 렌더링하여 한 가지 색(채움 색)인지 확인합니다.
+
+    Args:
+        page: 결과 파일의 페이지
+        rects: 페이지의 마스킹 영역 목록
+        fill: 마스킹 채움 색 (0~1 RGB)
+
+    Returns:
+        List[VerificationIssue]: 검증에 실패한 영역
+    """
+    issues: List[VerificationIssue] = []
+    rects = [fitz.Rect(rect) & page.rect for rect in rects]
+    rects = [rect for rect in rects if not rect.is_empty]
+    if not rects:
+        return issues
+
+    # 텍스트: 가까운 영역끼리 묶어서 묶음마다 한 번만 추출
+    # (추출 범위를 좁혀야 글자 정보를 만드는 비용이 줄어듦)
+    # 글자 수만큼 반복하므로 fitz.Rect 대신 숫자 튜플로 비교
+    boxes = [tuple(rect) for rect in rects]
+    leftovers: Dict[int, List[str]] = {}
+    for clip, members in _group_rects(rects, page.rect):
+        text = page.get_text("rawdict", clip=clip, flags=VERIFY_TEXT_FLAGS)
+        for block in text["blocks"]:
+            for line in block.get("lines", ()):
+                # 마스킹 영역과 겹치지 않는 줄은 글자를 보지 않음
+                lx0, ly0, lx1, ly1 = line["bbox"]
+                line_boxes = [
+                    (number, boxes[number]) for number in members
+                    if lx0 < boxes[number][2] and boxes[number][0] < lx1
+                    and ly0 < boxes[number][3] and boxes[number][1] < ly1
+                ]
+                if not line_boxes:
+                    continue
+                for span in line["spans"]:
+                    for char in span["chars"]:
+                        if char["c"].isspace():
+                            continue
+                        x0, y0, x1, y1 = char["bbox"]
+                        cx = (x0 + x1) / 2
+                        cy = (y0 + y1) / 2
+                        for number, (bx0, by0, bx1, by1) in line_boxes:
+                            if bx0 <= cx < bx1 and by0 <= cy < by1:
+                                leftovers.setdefault(number, []).append(char["c"])
+                                break
+
+    for number, chars in leftovers.items():
+        issues.append(VerificationIssue(page.number, rects[number], "text", "".join(chars)[:40]))
+
+    # 픽셀: 페이지를 한 번 해석하고 영역만 렌더링
+    display_list = page.get_displaylist()
+    matrix = fitz.Matrix(VERIFY_ZOOM, VERIFY_ZOOM)
+    expected = _fill_pixel(fill)
+    for number, rect in enumerate(rects):
+        if number in leftovers:
+            continue
+        inner = rect + (VERIFY_EDGE_INSET, VERIFY_EDGE_INSET, -VERIFY_EDGE_INSET, -VERIFY_EDGE_INSET)
+        if inner.is_empty or inner.width < 1 or inner.height < 1:
+            continue
+        pix = display_list.get_pixmap(matrix=matrix, colorspace=fitz.csRGB, alpha=False, clip=inner)
+        if pix.width == 0 or pix.height == 0:
+            continue
+        # Pixmap.is_unicolor는 픽셀을 하나씩 읽으므로 샘플 데이터를 통째로 비교
+        if pix.samples != expected * (pix.width * pix.height):
+            issues.append(VerificationIssue(page.number, rect, "pixels"))
+
+    return issues
+
+
+def find_unreachable_objects(doc: fitz.Document) -> List[int]:
+    """
+    트레일러에서 참조를 따라가도 닿지 않는 객체 찾기
+
+    apply_redactions()는 페이지에 새 내용 스트림과 이미지를 연결하고 원본은 참조만 끊으므로,
+    사용하지 않는 객체를 제거하지 않고 저장하면 지운 글자와 이미지가 파일에 그대로 남습니다.
+    화면과 텍스트 추출로는 보이지 않으므로 객체 참조 관계로 확인합니다.
+
+    Args:
+        doc: PDF 문서
+
+    Returns:
+        List[int]: 참조되지 않는 객체의 xref 목록 (빈 객체, 파일 구조 객체 제외)
+    """
+    xref_count = doc.xref_length()
+    reachable = {0}
+    pending = [int(xref) for xref in _OBJECT_REFERENCE.findall(doc.pdf_trailer(compressed=True))]
+    while pending:
+        xref = pending.pop()
+        if xref in reachable or not 0 < xref < xref_count:
+            continue
+        reachable.add(xref)
+        pending.extend(int(ref) for ref in _OBJECT_REFERENCE.findall(doc.xref_object(xref, compressed=True)))
+
+    unreachable = []
+    for xref in range(1, xref_count):
+        if xref in reachable:
+            continue
+        # 사용하지 않는 번호(free)는 null로 읽힘
+        if doc.xref_object(xref, compressed=True) == "null":
+            continue
+        if doc.xref_get_key(xref, "Type")[1] in STRUCTURAL_OBJECT_TYPES:
+            continue
+        unreachable.append(xref)
+    return unreachable
+
+
+def verify_structure(doc: fitz.Document) -> List[VerificationIssue]:
+    """
+    파일 단위 검증 (페이지에 보이지 않는 내용이 파일에 남았는지 확인)
+
+    Args:
+        doc: 결과 PDF 문서
+
+    Returns:
+        List[VerificationIssue]: 파일 단위 문제 (page_index -1)
+    """
+    issues: List[VerificationIssue] = []
+    if doc.version_count > 1:
+        # 이전 버전의 객체(마스킹 전 내용 스트림 등)가 파일에 그대로 남음
+        issues.append(VerificationIssue(-1, fitz.Rect(), "revisions", f"({doc.version_count}개 버전)"))
+
+    unreachable = find_unreachable_objects(doc)
+    if unreachable:
+        shown = ", ".join(str(xref) for xref in unreachable[:MAX_REPORTED_ISSUES])
+        more = f" 외 {len(unreachable) - MAX_REPORTED_ISSUES}개" if len(unreachable) > MAX_REPORTED_ISSUES else ""
+        issues.append(VerificationIssue(-1, fitz.Rect(), "unreachable", f"(xref {shown}{more})"))
+    return issues
+
+
+def verify_document(
+    doc: fitz.Document,
+    masks: Iterable[MaskEntry],
+    fill: Sequence[float] = (1, 1, 1)
+) -> VerificationResult:
+    """
+    문서의 모든 마스킹 영역과 파일 구조 검증 (마스킹 영역은 페이지 단위로 묶어서 처리)
+
+    Args:
+        doc: 결과 PDF 문서
+        masks: 적용한 마스킹 정보
+        fill: 마스킹 채움 색 (0~1 RGB)
+
+    Returns:
+        VerificationResult: 검증 결과
+    """
+    begin = time.perf_counter()
+    by_page: Dict[int, List[fitz.Rect]] = {}
+    for mask in masks:
+        if 0 <= mask.page_index < len(doc):
+            by_page.setdefault(mask.page_index, []).append(mask.rect)
+
+    result = VerificationResult()
+    for page_index in sorted(by_page):
+        rects = by_page[page_index]
+        result.issues.extend(verify_page(doc.load_page(page_index), rects, fill))
+        result.checked += len(rects)
+        result.pages += 1
+
+    if by_page:
+        result.issues.extend(verify_structure(doc))
+
+    result.elapsed = time.perf_counter() - begin
+    return result
+
+
+def verify_file(
+    path: str,
+    masks: Iterable[MaskEntry],
+    password: str = "",
+    fill: Sequence[float] = (1, 1, 1)
+) -> VerificationResult:
+    """
+    저장된 결과 파일을 다시 열어 마스킹 영역 검증
+
+    Args:
+        path: 결과 PDF 파일 경로
+        masks: 적용한 마스킹 정보
+        password: PDF 암호 (암호화된 PDF인 경우)
+        fill: 마스킹 채움 색 (0~1 RGB)
+
+    Returns:
+        VerificationResult: 검증 결과
+    """
+    with fitz.open(path) as doc:
+        if doc.is_encrypted:
+            doc.authenticate(password)
+        return verify_document(doc, masks, fill)
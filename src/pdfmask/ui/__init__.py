@@ -4,13 +4,18 @@ UI module - GUI 컴포넌트
 
 from .main_window import MainWindow
 from .pdf_view import PdfPageView, ScrollablePdfView
-from .dialogs import SerialInputDialog, PasswordInputDialog
+from .continuous_view import ContinuousPdfView
+from .thumbnail_panel import ThumbnailPanel
+from .dialogs import SerialInputDialog, PasswordInputDialog, TemplatePreviewDialog
 
 __all__ = [
     'MainWindow',
     'PdfPageView',
     'ScrollablePdfView',
+    'ContinuousPdfView',
+    'ThumbnailPanel',
     'SerialInputDialog',
     'PasswordInputDialog',
+    'TemplatePreviewDialog',
 ]
 
@@ -0,0 +1,291 @@
+"""
+연속 스크롤 PDF 뷰 UI 컴포넌트
+"""
+
+import bisect
+from typing import Callable, Optional
+
+from PyQt6.QtWidgets import QWidget, QScrollArea
+from PyQt6.QtCore import Qt, QRect, QSize, pyqtSignal
+from PyQt6.QtGui import QImage
+
+from ..core.mask_store import MaskStore
+from ..managers.pdf_manager import scaled_size
+from .pdf_view import PdfPageView
+
+
+# (불러올 페이지 목록 (우선순위 순), 화면에 보이는 페이지 범위) → 페이지별 이미지
+ImageProvider = Callable[[list[int], range], dict[int, QImage]]
+
+
+# 페이지 사이 간격 (픽셀)
+PAGE_SPACING = 12
+
+# 화면 밖에서도 렌더링해 둘 페이지 수 (위/아래 각각)
+LOADED_PAGE_MARGIN = 1
+
+# 이 범위를 벗어나면 이미지를 해제하고 위젯을 다른 페이지에 다시 사용하는 페이지 수 (위/아래 각각)
+RELEASE_PAGE_MARGIN = 3
+
+
+class ContinuousPdfView(QScrollArea):
+    """
+    모든 페이지를 세로로 이어서 보여주는 스크롤 뷰
+
+    페이지 위치와 전체 높이는 페이지 크기로 계산하고, 페이지 위젯(PdfPageView)은
+    화면에 보이는 페이지와 그 주변 페이지에만 두어 계산한 위치에 배치합니다.
+    스크롤하여 범위를 벗어난 위젯은 다른 페이지에 다시 사용하므로
+    페이지 수가 많아도 위젯 수는 늘지 않습니다.
+    그중 보이는 페이지와 바로 옆 페이지만 이미지를 가지며 나머지는 빈 자리 표시로 둡니다.
+    각 페이지는 PdfPageView이므로 Ctrl + 드래그 마스킹이 페이지별로 동작합니다.
+    """
+
+    # 시그널: (page_index, fitz.Rect)
+    maskCreated = pyqtSignal(int, object)
+
+    # 시그널: 화면 중앙에 있는 페이지가 바뀜 (page_index)
+    currentPageChanged = pyqtSignal(int)
+
+    def __init__(self, parent: Optional[QWidget] = None) -> None:
+        """
+        초기화
+
+        Args:
+            parent: 부모 위젯
+        """
+        super().__init__(parent)
+
+        # 페이지 위젯 컨테이너 (레이아웃 없이 계산한 위치에 배치)
+        self._container = QWidget()
+        self.setWidget(self._container)
+        self.setAlignment(Qt.AlignmentFlag.AlignHCenter)
+
+        # 페이지 상태
+        self._page_sizes: list[tuple[float, float]] = []
+        self._zoom: float = 0.0
+        self._masks: Optional[MaskStore] = None
+        self._current_page: int = 0
+
+        # 페이지별 컨테이너 안 위치와 표시 크기
+        self._page_rects: list[QRect] = []
+
+        # 페이지 인덱스 → 배치된 페이지 위젯, 다시 사용할 페이지 위젯
+        self._page_views: dict[int, PdfPageView] = {}
+        self._spare_views: list[PdfPageView] = []
+
+        # 페이지 이미지 공급 함수
+        self._image_provider: Optional[ImageProvider] = None
+
+        # 배경색 설정 (회색)
+        self.setStyleSheet("QScrollArea { background-color: #808080; }")
+
+        # 스크롤/크기 변경 시 보이는 페이지 갱신
+        self.verticalScrollBar().valueChanged.connect(self.update_visible_pages)
+        self.verticalScrollBar().rangeChanged.connect(self.update_visible_pages)
+
+    def show_document(
+        self,
+        page_sizes: list[tuple[float, float]],
+        zoom: float,
+        masks: Optional[MaskStore],
+        image_provider: ImageProvider
+    ) -> None:
+        """
+        문서 표시 (같은 문서, 같은 배율이면 마스킹만 갱신)
+
+        Args:
+            page_sizes: 페이지별 PDF 좌표계 크기
+            zoom: 확대/축소 배율
+            masks: 저장된 마스킹 저장소
+            image_provider: 불러올 페이지 목록과 보이는 범위를 받아
+                지금 표시할 수 있는 이미지를 반환하는 함수
+        """
+        self._masks = masks
+        self._image_provider = image_provider
+
+        if page_sizes is self._page_sizes and zoom == self._zoom:
+            for view in self._page_views.values():
+                if view.has_image():
+                    view.set_masks(masks)
+            self.update_visible_pages()
+            return
+
+        # 배율만 바뀌면 현재 페이지 위치 유지, 새 문서면 처음부터
+        anchor = self._current_page if page_sizes is self._page_sizes else 0
+        self._page_sizes = page_sizes
+        self._zoom = zoom
+
+        # 페이지 위치가 모두 바뀌므로 배치된 위젯을 반납하고 다시 배치
+        self._release_all_views()
+        self._layout_pages()
+        self.scroll_to_page(anchor)
+        self.update_visible_pages()
+
+    def refresh_masks(self, page_index: int) -> None:
+        """
+        페이지의 마스킹 표시만 갱신 (이미지가 표시된 페이지만)
+
+        Args:
+            page_index: 페이지 인덱스 (0-based)
+        """
+        view = self._page_views.get(page_index)
+        if view is not None and view.has_image():
+            view.set_masks(self._masks)
+
+    def clear(self) -> None:
+        """모든 페이지 제거 (페이지 위젯은 다음 문서에서 다시 사용)"""
+        self._release_all_views()
+        self._page_sizes = []
+        self._page_rects = []
+        self._container.resize(0, 0)
+        self._zoom = 0.0
+        self._masks = None
+        self._image_provider = None
+        self._current_page = 0
+
+    def scroll_to_page(self, page_index: int) -> None:
+        """
+        지정된 페이지의 위쪽이 보이도록 스크롤
+
+        Args:
+            page_index: 페이지 인덱스 (0-based)
+        """
+        if not (0 <= page_index < len(self._page_rects)):
+            return
+
+        self.verticalScrollBar().setValue(self._page_rects[page_index].top() - PAGE_SPACING)
+
+        # 마지막 페이지 근처에서는 화면 중앙이 다른 페이지일 수 있으므로 요청한 페이지로 고정
+        if self._current_page != page_index:
+            self._current_page = page_index
+            self.currentPageChanged.emit(page_index)
+
+    def replace_image(self, page_index: int, image: QImage) -> None:
+        """
+        백그라운드 렌더링이 끝난 페이지 이미지 교체
+
+        주변 범위를 벗어나 이미 해제된 페이지는 무시합니다.
+
+        Args:
+            page_index: 페이지 인덱스 (0-based)
+            image: 전체 해상도 이미지
+        """
+        view = self._page_views.get(page_index)
+        if view is None:
+            return
+
+        if view.has_image():
+            view.replace_image(page_index, image)
+        elif page_index in self._loaded_range():
+            self._set_image(page_index, view, image)
+
+    def update_visible_pages(self, *args) -> None:
+        """보이는 페이지와 주변 페이지는 불러오고, 멀리 떨어진 페이지의 위젯은 반납"""
+        if not self._page_rects or self._image_provider is None:
+            return
+
+        first, last = self._visible_page_range()
+
+        # 화면 중앙 페이지 갱신
+        center = self._page_at(self.verticalScrollBar().value() + self.viewport().height() // 2)
+        if center != self._current_page:
+            self._current_page = center
+            self.currentPageChanged.emit(center)
+
+        # 멀리 떨어진 페이지의 위젯은 반납하고, 주변 페이지에는 위젯 배치
+        keep = range(
+            max(0, first - RELEASE_PAGE_MARGIN),
+            min(len(self._page_rects), last + RELEASE_PAGE_MARGIN + 1)
+        )
+        for page_index in [index for index in self._page_views if index not in keep]:
+            self._release_view(page_index)
+        for page_index in keep:
+            if page_index not in self._page_views:
+                self._acquire_view(page_index)
+
+        # 보이는 페이지 먼저, 이어서 주변 페이지 불러오기
+        visible = range(first, last + 1)
+        order = list(visible) + [i for i in self._loaded_range() if i not in visible]
+        images = self._image_provider(order, visible)
+        for page_index, image in images.items():
+            view = self._page_views.get(page_index)
+            if view is None:
+                continue
+            if view.has_image():
+                view.replace_image(page_index, image)
+            else:
+                self._set_image(page_index, view, image)
+
+    def resizeEvent(self, event) -> None:
+        """크기 변경 시 보이는 페이지 갱신"""
+        super().resizeEvent(event)
+        self.update_visible_pages()
+
+    def _display_size(self, page_index: int) -> QSize:
+        """배율이 적용된 페이지 표시 크기"""
+        return self._page_rects[page_index].size()
+
+    def _set_placeholder(self, page_index: int, view: PdfPageView) -> None:
+        """페이지를 이미지 없는 자리 표시로 설정"""
+        width, height = self._page_sizes[page_index]
+        view.set_page(page_index, None, width, height, None, self._display_size(page_index))
+
+    def _set_image(self, page_index: int, view: PdfPageView, image: QImage) -> None:
+        """페이지에 이미지 설정 (미리보기는 표시 크기로 확대)"""
+        width, height = self._page_sizes[page_index]
+        view.set_page(page_index, image, width, height, self._masks, self._display_size(page_index))
+
+    def _layout_pages(self) -> None:
+        """페이지 크기로 페이지별 위치를 계산하고 컨테이너 크기를 맞춤 (가운데 정렬)"""
+        sizes = [scaled_size(width, height, self._zoom) for width, height in self._page_sizes]
+        content_width = max((width for width, _ in sizes), default=0) + 2 * PAGE_SPACING
+
+        self._page_rects = []
+        top = PAGE_SPACING
+        for width, height in sizes:
+            self._page_rects.append(QRect((content_width - width) // 2, top, width, height))
+            top += height + PAGE_SPACING
+        self._container.resize(content_width, top)
+
+    def _acquire_view(self, page_index: int) -> None:
+        """페이지 자리에 위젯 배치 (반납된 위젯이 있으면 다시 사용)"""
+        if self._spare_views:
+            view = self._spare_views.pop()
+        else:
+            view = PdfPageView(self._container)
+            view.maskCreated.connect(self.maskCreated)
+        self._set_placeholder(page_index, view)
+        view.move(self._page_rects[page_index].topLeft())
+        view.show()
+        self._page_views[page_index] = view
+
+    def _release_view(self, page_index: int) -> None:
+        """페이지 위젯의 이미지를 해제하고 다시 사용할 수 있게 반납"""
+        view = self._page_views.pop(page_index)
+        view.hide()
+        view.clear()
+        self._spare_views.append(view)
+
+    def _release_all_views(self) -> None:
+        """배치된 페이지 위젯을 모두 반납"""
+        for page_index in list(self._page_views):
+            self._release_view(page_index)
+
+    def _page_at(self, y: int) -> int:
+        """컨테이너 좌표 y에 있는 페이지 인덱스"""
+        index = bisect.bisect_right(self._page_rects, y, key=QRect.top) - 1
+        return min(max(index, 0), len(self._page_rects) - 1)
+
+    def _visible_page_range(self) -> tuple[int, int]:
+        """화면에 보이는 첫 페이지와 마지막 페이지 인덱스"""
+        top = self.verticalScrollBar().value()
+        visible = QRect(0, top, self.viewport().width(), self.viewport().height())
+        return self._page_at(visible.top()), self._page_at(visible.bottom())
+
+    def _loaded_range(self) -> range:
+        """이미지를 가지고 있어야 하는 페이지 범위"""
+        first, last = self._visible_page_range()
+        return range(
+            max(0, first - LOADED_PAGE_MARGIN),
+            min(len(self._page_rects), last + LOADED_PAGE_MARGIN + 1)
+        )
@@ -2,7 +2,8 @@
 다이얼로그 UI 컴포넌트
 """
 
-from typing import Optional
+import os
+from typing import Dict, Optional
 from PyQt6.QtWidgets import (
     QDialog,
     QWidget,
@@ -14,8 +15,12 @@ from PyQt6.QtWidgets import (
     QMessageBox,
     QProgressDialog,
     QApplication,
+    QListWidget,
+    QListWidgetItem,
+    QListView,
 )
-from PyQt6.QtCore import Qt
+from PyQt6.QtCore import Qt, QSize, pyqtSignal
+from PyQt6.QtGui import QIcon, QImage, QPixmap
 
 from ..managers.license_manager import LicenseManager
 
@@ -208,3 +213,150 @@ class PasswordInputDialog(QDialog):
     def get_password(self) -> str:
         """입력된 암호 반환"""
         return self.password
+
+
+class TemplatePreviewDialog(QDialog):
+    """
+    템플릿 적용 결과 미리보기 다이얼로그
+    
+    템플릿을 적용한 파일마다 마스킹 위치를 칠한 미리보기를 보여주어
+    파일을 하나씩 열지 않고도 적용 결과를 확인할 수 있습니다.
+    """
+    
+    # 시그널: 파일을 열어 확인 요청 (파일 경로)
+    fileActivated = pyqtSignal(str)
+    
+    # 시그널: 준비된 파일 모두 저장 요청
+    saveAllRequested = pyqtSignal()
+    
+    def __init__(self, template_name: str, total: int, parent: Optional[QWidget] = None) -> None:
+        """
+        초기화
+        
+        Args:
+            template_name: 적용 중인 템플릿 이름
+            total: 적용할 파일 수
+            parent: 부모 위젯
+        """
+        super().__init__(parent)
+        self.template_name = template_name
+        self.total = total
+        self.done = 0
+        self._items: Dict[str, QListWidgetItem] = {}
+        self.init_ui()
+    
+    def init_ui(self) -> None:
+        """UI 초기화"""
+        self.setWindowTitle(f"템플릿 적용 미리보기 - {self.template_name}")
+        self.resize(900, 650)
+        
+        layout = QVBoxLayout()
+        
+        # 진행 상황
+        self.status_label = QLabel("")
+        layout.addWidget(self.status_label)
+        
+        # 파일별 미리보기 목록
+        self.preview_list = QListWidget()
+        self.preview_list.setViewMode(QListView.ViewMode.IconMode)
+        self.preview_list.setMovement(QListView.Movement.Static)
+        self.preview_list.setResizeMode(QListView.ResizeMode.Adjust)
+        self.preview_list.setIconSize(QSize(180, 240))
+        self.preview_list.setSpacing(8)
+        self.preview_list.setWordWrap(True)
+        self.preview_list.itemDoubleClicked.connect(self.open_selected)
+        layout.addWidget(self.preview_list)
+        
+        # 버튼 레이아웃
+        button_layout = QHBoxLayout()
+        
+        # 선택한 파일 열기 버튼
+        open_button = QPushButton("선택한 파일 열기")
+        open_button.clicked.connect(self.open_selected)
+        button_layout.addWidget(open_button)
+        
+        # 모두 저장 버튼 (적용이 끝나면 활성화)
+        self.save_all_button = QPushButton("모두 저장")
+        self.save_all_button.setEnabled(False)
+        self.save_all_button.clicked.connect(self.saveAllRequested)
+        button_layout.addWidget(self.save_all_button)
+        
+        # 닫기 버튼
+        close_button = QPushButton("닫기")
+        close_button.clicked.connect(self.close)
+        button_layout.addWidget(close_button)
+        
+        layout.addLayout(button_layout)
+        self.setLayout(layout)
+        self.update_status()
+    
+    def add_file(self, file_path: str, mask_count: int, skipped: int, preview: Optional[QImage]) -> None:
+        """
+        템플릿을 적용한 파일 추가
+        
+        Args:
+            file_path: PDF 파일 경로
+            mask_count: 적용된 마스킹 수
+            skipped: 페이지 크기가 맞지 않아 건너뛴 마스킹 수
+            preview: 미리보기 이미지 (없으면 None)
+        """
+        text = f"{os.path.basename(file_path)}\n{mask_count}개 마스킹"
+        if skipped:
+            text = f"⚠ {text} ({skipped}개 제외)"
+        item = QListWidgetItem(text)
+        if preview is not None:
+            item.setIcon(QIcon(QPixmap.fromImage(preview)))
+        item.setData(Qt.ItemDataRole.UserRole, file_path)
+        self.preview_list.addItem(item)
+        self._items[file_path] = item
+        self.done += 1
+        self.update_status()
+    
+    def add_failure(self, file_path: str) -> None:
+        """
+        템플릿을 적용하지 못한 파일 추가
+        
+        Args:
+            file_path: PDF 파일 경로
+        """
+        item = QListWidgetItem(f"⚠ {os.path.basename(file_path)}\n적용 실패 (암호 또는 손상된 파일)")
+        item.setData(Qt.ItemDataRole.UserRole, file_path)
+        self.preview_list.addItem(item)
+        self.done += 1
+        self.update_status()
+    
+    def add_skipped(self, file_path: str) -> None:
+        """
+        저장된 마스킹 데이터가 있어 템플릿을 적용하지 않은 파일 추가
+
+        Args:
+            file_path: PDF 파일 경로
+        """
+        item = QListWidgetItem(f"{os.path.basename(file_path)}\n건너뜀 (저장된 마스킹 데이터 있음)")
+        item.setData(Qt.ItemDataRole.UserRole, file_path)
+        self.preview_list.addItem(item)
+        self.done += 1
+        self.update_status()
+    
+    def set_finished(self, ready: int) -> None:
+        """
+        적용 완료 표시
+        
+        Args:
+            ready: 템플릿을 적용한 파일 수
+        """
+        self.status_label.setText(
+            f"적용 완료: {ready} / {self.total}개 파일 "
+            f"(미리보기를 더블클릭하면 파일을 열어 확인할 수 있습니다)"
+        )
+        self.save_all_button.setEnabled(ready > 0)
+    
+    def update_status(self) -> None:
+        """진행 상황 표시"""
+        self.status_label.setText(f"템플릿 적용 중... ({self.done} / {self.total}개 파일)")
+    
+    def open_selected(self, *args) -> None:
+        """선택한 파일 열기 요청"""
+        item = self.preview_list.currentItem()
+        if item is not None:
+            self.fileActivated.emit(item.data(Qt.ItemDataRole.UserRole))
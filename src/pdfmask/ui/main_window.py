@@ -19,22 +19,45 @@ from PyQt6.QtWidgets import (
     QTableWidgetItem,
     QFileDialog,
     QMessageBox,
+    QStackedWidget,
+    QInputDialog,
+    QMenu,
 )
-from PyQt6.QtCore import Qt, QSize
-from PyQt6.QtGui import QKeySequence, QAction, QIcon
+from PyQt6.QtCore import Qt, QSize, QTimer
+from PyQt6.QtGui import QKeySequence, QAction, QActionGroup, QIcon
 from PyQt6.QtWidgets import QStyle
 from PyQt6.QtGui import QShortcut
 
-from ..core.models import MaskEntry
+from ..core.models import MaskEntry, MaskTemplate
+from ..core.mask_store import MaskStore
 from ..managers import (
     PdfDocumentManager,
     PasswordRequiredException,
     MaskDataManager,
+    AutosaveJournal,
     ProgressManager,
     LogManager,
+    ExcelExportManager,
+    SaveQueue,
+    TemplateManager,
+    TemplateReplay,
+)
+from ..managers.pdf_manager import SAVE_PROFILE_DESCRIPTIONS, DEFAULT_SAVE_PROFILE
+from ..managers.save_queue import (
+    SaveJob,
+    SAVE_TRANSFERRING,
+    SAVE_DONE,
+    SAVE_FAILED,
+    SAVE_NEEDS_PASSWORD,
 )
 from .pdf_view import ScrollablePdfView
-from .dialogs import PasswordInputDialog
+from .continuous_view import ContinuousPdfView
+from .thumbnail_panel import ThumbnailPanel
+from .dialogs import PasswordInputDialog, TemplatePreviewDialog
+
+
+# 확대/축소나 페이지 이동이 멈춘 뒤 전체 해상도로 렌더링하기까지 기다리는 시간 (ms)
+RENDER_DEBOUNCE_MS = 150
 
 
 class MainWindow(QMainWindow):
@@ -52,9 +75,21 @@ class MainWindow(QMainWindow):
         self.pdf_manager = PdfDocumentManager()
         self.current_page_index: int = 0
         
+        # 연속 스크롤 보기 여부
+        self.continuous_mode: bool = False
+        
+        # 연속된 확대/축소, 페이지 이동 요청을 모아 마지막 요청만 렌더링
+        self.page_view_timer = QTimer(self)
+        self.page_view_timer.setSingleShot(True)
+        self.page_view_timer.setInterval(RENDER_DEBOUNCE_MS)
+        self.page_view_timer.timeout.connect(self.update_page_view)
+        
         # 마스킹 데이터 관리자
         self.mask_data_manager = MaskDataManager()
         
+        # 저장하지 않은 마스킹 작업 자동 저장 (비정상 종료 시 복구)
+        self.autosave_journal = AutosaveJournal(parent=self)
+        
         # 진행상황 관리자
         self.progress_manager = ProgressManager()
         
@@ -62,13 +97,34 @@ class MainWindow(QMainWindow):
         self.log_manager = LogManager()
         self.log_manager.log_app_start()
         
+        # 엑셀 작업 내역 관리자
+        self.excel_manager = ExcelExportManager()
+        
+        # 백그라운드 저장 큐 (저장 중에도 다음 파일 작업 가능)
+        self.save_queue = SaveQueue(self.log_manager, parent=self)
+        self.save_queue.jobStatusChanged.connect(self.on_save_job_status_changed)
+        
+        # 결과 파일 저장 프로필
+        self.save_profile: str = DEFAULT_SAVE_PROFILE
+        
+        # 마스킹 템플릿 (같은 양식의 나머지 파일에 한 번에 적용)
+        self.template_manager = TemplateManager()
+        self.template_replay = TemplateReplay(self.pdf_manager.render_pool, self.mask_data_manager, self)
+        self.template_replay.fileReady.connect(self.on_template_file_ready)
+        self.template_replay.fileSkipped.connect(self.on_template_file_skipped)
+        self.template_replay.fileFailed.connect(self.on_template_file_failed)
+        self.template_replay.finished.connect(self.on_template_finished)
+        self.template_results: dict[str, list[MaskEntry]] = {}
+        self.template_dialog: Optional[TemplatePreviewDialog] = None
+        
         # 마스킹 데이터 저장
-        self.masks: list[MaskEntry] = []
+        self.masks = MaskStore()
         
         # 폴더 내 PDF 파일 목록
         self.pdf_files: list[str] = []
+        self.pdf_file_rows: dict[str, int] = {}  # 파일 경로 -> 목록 위치
         self.current_pdf_index: int = -1
-        self.completed_files: list[str] = []  # 완료된 파일 리스트
+        self.completed_files: set[str] = set()  # 완료된 파일명
         self.current_folder_path: str = ""  # 현재 작업 중인 폴더 경로
         
         self.init_ui()
@@ -76,6 +132,17 @@ class MainWindow(QMainWindow):
         self.setup_toolbar()
         self.setup_shortcuts()
         self.setup_statusbar()
+        
+        # 이전 실행에서 끝나지 않은 저장 작업 이어서 진행
+        resumed = self.save_queue.resume()
+        stalled = self.save_queue.jobs_needing_attention()
+        if stalled:
+            self.statusBar().showMessage(
+                f"저장하지 못한 작업 {len(stalled)}개가 있습니다. "
+                f"해당 폴더를 열고 파일 목록에서 마우스 오른쪽 버튼으로 다시 시도하거나 취소하세요."
+            )
+        elif resumed:
+            self.statusBar().showMessage(f"이전에 끝나지 않은 저장 작업 {resumed}개를 이어서 진행합니다.")
 
     def init_ui(self) -> None:
         """UI 초기화"""
@@ -106,10 +173,24 @@ class MainWindow(QMainWindow):
         self.scrollable_pdf_view = ScrollablePdfView(self)
         self.pdf_view = self.scrollable_pdf_view.pdf_view
         
+        # 가운데 (연속 스크롤 보기): 모든 페이지를 이어서 표시
+        self.continuous_view = ContinuousPdfView(self)
+        
         # 시그널 연결
         self.pdf_view.maskCreated.connect(self.on_mask_created)
-        
-        main_layout.addWidget(self.scrollable_pdf_view)
+        self.continuous_view.maskCreated.connect(self.on_mask_created)
+        self.continuous_view.currentPageChanged.connect(self.on_continuous_page_changed)
+        self.pdf_manager.render_pool.pageRendered.connect(self.on_page_rendered)
+        self.pdf_manager.render_pool.renderFailed.connect(self.on_page_render_failed)
+        self.pdf_manager.suggestions.suggestionsFound.connect(self.on_suggestions_found)
+        self.pdf_manager.suggestions.progressChanged.connect(self.on_suggestion_progress)
+        self.pdf_manager.suggestions.finished.connect(self.on_suggestions_finished)
+        
+        # 보기 모드에 따라 둘 중 하나만 표시
+        self.page_view_stack = QStackedWidget()
+        self.page_view_stack.addWidget(self.scrollable_pdf_view)
+        self.page_view_stack.addWidget(self.continuous_view)
+        main_layout.addWidget(self.page_view_stack)
         
         # 왼쪽: 마스킹 리스트 (Dock Widget)
         self.mask_list = QTableWidget()
@@ -135,9 +216,36 @@ class MainWindow(QMainWindow):
         
         self.addDockWidget(Qt.DockWidgetArea.LeftDockWidgetArea, self.mask_dock_widget)
 
+        # 왼쪽 (뷰어 옆): 페이지 썸네일 (Dock Widget)
+        self.thumbnail_panel = ThumbnailPanel()
+        self.thumbnail_panel.pageSelected.connect(self.go_to_page)
+        self.pdf_manager.thumbnails.thumbnailsReady.connect(self.on_thumbnails_ready)
+        self.thumbnail_dock_widget = QDockWidget("페이지 미리보기", self)
+        self.thumbnail_dock_widget.setWidget(self.thumbnail_panel)
+        self.thumbnail_dock_widget.setMinimumWidth(160)
+        
+        # Dock 기능 설정
+        self.thumbnail_dock_widget.setFeatures(
+            QDockWidget.DockWidgetFeature.DockWidgetMovable |
+            QDockWidget.DockWidgetFeature.DockWidgetFloatable |
+            QDockWidget.DockWidgetFeature.DockWidgetClosable
+        )
+        
+        # 도킹 영역 설정
+        self.thumbnail_dock_widget.setAllowedAreas(
+            Qt.DockWidgetArea.LeftDockWidgetArea |
+            Qt.DockWidgetArea.RightDockWidgetArea
+        )
+        
+        self.splitDockWidget(
+            self.mask_dock_widget, self.thumbnail_dock_widget, Qt.Orientation.Horizontal
+        )
+
         # 오른쪽: PDF 파일 목록 (Dock Widget)
         self.pdf_file_list = QListWidget()
         self.pdf_file_list.itemDoubleClicked.connect(self.on_pdf_list_double_clicked)
+        self.pdf_file_list.setContextMenuPolicy(Qt.ContextMenuPolicy.CustomContextMenu)
+        self.pdf_file_list.customContextMenuRequested.connect(self.show_pdf_list_context_menu)
         self.pdf_dock_widget = QDockWidget("PDF 파일 목록", self)
         self.pdf_dock_widget.setWidget(self.pdf_file_list)
         self.pdf_dock_widget.setMinimumWidth(200)
@@ -212,6 +320,20 @@ class MainWindow(QMainWindow):
         export_excel_action.triggered.connect(self.export_masks_to_excel)
         file_menu.addAction(export_excel_action)
 
+        # 결과 파일 저장 방식 (저장 프로필) 선택
+        save_profile_menu = file_menu.addMenu("결과 파일 저장 방식")
+        save_profile_group = QActionGroup(self)
+        save_profile_group.setExclusive(True)
+        for profile, description in SAVE_PROFILE_DESCRIPTIONS.items():
+            profile_action = QAction(description, self)
+            profile_action.setCheckable(True)
+            profile_action.setChecked(profile == self.save_profile)
+            profile_action.triggered.connect(
+                lambda checked, p=profile: self.set_save_profile(p)
+            )
+            save_profile_group.addAction(profile_action)
+            save_profile_menu.addAction(profile_action)
+
         file_menu.addSeparator()
 
         # 종료 액션
@@ -232,6 +354,39 @@ class MainWindow(QMainWindow):
         self.toggle_pdf_list_action = self.pdf_dock_widget.toggleViewAction()
         self.toggle_pdf_list_action.setText("PDF 파일 목록")
         view_menu.addAction(self.toggle_pdf_list_action)
+        
+        # 페이지 미리보기 토글 액션
+        self.toggle_thumbnail_action = self.thumbnail_dock_widget.toggleViewAction()
+        self.toggle_thumbnail_action.setText("페이지 미리보기")
+        view_menu.addAction(self.toggle_thumbnail_action)
+        
+        view_menu.addSeparator()
+        
+        # 연속 스크롤 보기 토글 액션
+        self.continuous_mode_action = QAction("연속 스크롤 보기", self)
+        self.continuous_mode_action.setCheckable(True)
+        self.continuous_mode_action.toggled.connect(self.toggle_continuous_mode)
+        view_menu.addAction(self.continuous_mode_action)
+
+        # 도구 메뉴
+        tools_menu = menubar.addMenu("도구(&T)")
+
+        # 자동 마스킹 제안 (주민등록번호, 전화번호, 계좌번호, 이메일)
+        suggest_action = QAction("자동 마스킹 제안", self)
+        suggest_action.setShortcut(QKeySequence("Ctrl+Shift+F"))
+        suggest_action.triggered.connect(self.suggest_masks)
+        tools_menu.addAction(suggest_action)
+
+        tools_menu.addSeparator()
+
+        # 마스킹 템플릿
+        save_template_action = QAction("현재 마스킹을 템플릿으로 저장...", self)
+        save_template_action.triggered.connect(self.save_masks_as_template)
+        tools_menu.addAction(save_template_action)
+
+        apply_template_action = QAction("템플릿을 남은 파일에 적용...", self)
+        apply_template_action.triggered.connect(self.apply_template_to_remaining)
+        tools_menu.addAction(apply_template_action)
 
         # 도움말 메뉴
         help_menu = menubar.addMenu("도움말(&H)")
@@ -307,11 +462,62 @@ class MainWindow(QMainWindow):
         """상태바 설정"""
         self.statusBar().showMessage("준비 (Ctrl + 드래그로 마스킹 영역 선택)")
 
+    def request_page_view(self) -> None:
+        """
+        현재 페이지 표시 요청 (확대/축소, 페이지 이동)
+        
+        요청이 이어지는 동안에는 이미 가진 이미지를 늘리거나 줄인 임시 화면만
+        보여주고, 요청이 RENDER_DEBOUNCE_MS 동안 멈추면 마지막 요청만
+        update_page_view()로 전체 해상도로 렌더링합니다.
+        """
+        if self.pdf_manager.doc is None:
+            return
+        
+        # 이전 요청의 대기 중인 렌더링은 버림
+        self.pdf_manager.render_pool.cancel_pending()
+        
+        if not self.continuous_mode:
+            self.show_stand_in_page()
+        self.page_view_timer.start()
+
+    def show_stand_in_page(self) -> None:
+        """렌더링하지 않고 보여줄 수 있는 이미지로 현재 페이지를 임시 표시"""
+        try:
+            zoom = self.scrollable_pdf_view.zoom_level * 1.5
+            width, height = self.pdf_manager.get_render_size(self.current_page_index, zoom)
+            display_size = QSize(width, height)
+            
+            # 같은 페이지면 표시 중인 이미지를 새 배율로 늘리거나 줄임
+            image = self.pdf_manager.get_cached_page_image(self.current_page_index, zoom)
+            if image is None and self.pdf_view.page_index() == self.current_page_index:
+                if self.pdf_view.rescale(display_size, self.masks):
+                    self.show_page_status()
+                    return
+            
+            # 다른 페이지면 캐시된 이미지 또는 미리보기 (썸네일)
+            if image is None:
+                image = self.pdf_manager.get_preview_image(self.current_page_index)
+            if image is None:
+                return
+            
+            page_width, page_height = self.pdf_manager.get_page_sizes()[self.current_page_index]
+            self.pdf_view.set_page(
+                self.current_page_index, image, page_width, page_height, self.masks, display_size
+            )
+            self.show_page_status()
+        except Exception as e:
+            print(f"페이지 표시 오류: {str(e)}")
+
     def update_page_view(self) -> None:
         """현재 페이지를 화면에 표시"""
+        self.page_view_timer.stop()
         if self.pdf_manager.doc is None:
             return
 
+        if self.continuous_mode:
+            self.update_continuous_view()
+            return
+
         try:
             # 현재 페이지 객체 가져오기
             page = self.pdf_manager.doc[self.current_page_index]
@@ -323,27 +529,46 @@ class MainWindow(QMainWindow):
             # 줌 레벨 적용
             zoom = self.scrollable_pdf_view.zoom_level * 1.5
             
-            # 페이지 렌더링
-            pixmap = self.pdf_manager.get_page_pixmap(self.current_page_index, zoom)
+            # 고배율에서 페이지가 크면 보이는 영역의 타일만 렌더링
+            if self.pdf_manager.should_tile(self.current_page_index, zoom):
+                page_index = self.current_page_index
+                width, height = self.pdf_manager.get_render_size(page_index, zoom)
+                self.pdf_view.set_tiled_page(
+                    page_index,
+                    QSize(width, height),
+                    page_width,
+                    page_height,
+                    lambda col, row: self.pdf_manager.get_tile_image(page_index, zoom, col, row),
+                    self.masks
+                )
+                self.scrollable_pdf_view.update_visible_tiles()
+                self.show_page_status()
+                return
+            
+            # 캐시에 없으면 저해상도 미리보기를 먼저 표시하고
+            # 전체 해상도는 백그라운드에서 렌더링 후 교체 (on_page_rendered)
+            image = self.pdf_manager.get_cached_page_image(self.current_page_index, zoom)
+            if image is None:
+                image = self.pdf_manager.get_preview_image(self.current_page_index)
             
-            if pixmap is not None:
+            if image is not None:
+                width, height = self.pdf_manager.get_render_size(self.current_page_index, zoom)
+                
                 # PdfPageView에 페이지 설정
                 self.pdf_view.set_page(
                     self.current_page_index,
-                    pixmap,
+                    image,
                     page_width,
                     page_height,
-                    self.masks
+                    self.masks,
+                    QSize(width, height)
                 )
                 
+                # 현재 페이지(미리보기인 경우) 및 이웃 페이지 백그라운드 렌더링
+                self.pdf_manager.prefetch_pages(self.current_page_index, zoom)
+                
                 # 상태바 업데이트
-                total_pages = self.pdf_manager.get_page_count()
-                zoom_percent = int(self.scrollable_pdf_view.zoom_level * 100)
-                self.statusBar().showMessage(
-                    f"페이지: {self.current_page_index + 1} / {total_pages} | "
-                    f"확대: {zoom_percent}% | "
-                    f"(Ctrl + 드래그: 마스킹, Ctrl + 휠: 확대/축소)"
-                )
+                self.show_page_status()
             else:
                 self.statusBar().showMessage("오류: 페이지 렌더링 실패")
                 
@@ -351,6 +576,121 @@ class MainWindow(QMainWindow):
             print(f"페이지 표시 오류: {str(e)}")
             self.statusBar().showMessage(f"오류: {str(e)}")
 
+    def update_continuous_view(self) -> None:
+        """연속 스크롤 보기에 문서 전체 표시"""
+        try:
+            zoom = self.scrollable_pdf_view.zoom_level * 1.5
+            self.continuous_view.show_document(
+                self.pdf_manager.get_page_sizes(),
+                zoom,
+                self.masks,
+                self.provide_continuous_images
+            )
+            self.show_page_status()
+        except Exception as e:
+            print(f"페이지 표시 오류: {str(e)}")
+            self.statusBar().showMessage(f"오류: {str(e)}")
+
+    def provide_continuous_images(self, page_indices: list[int], visible: range) -> dict:
+        """
+        연속 스크롤 보기에 표시할 페이지 이미지 제공
+        
+        캐시에 없는 페이지는 백그라운드 렌더링을 요청하고 (완료 시 on_page_rendered),
+        화면에 보이는 페이지는 그동안 저해상도 미리보기를 표시합니다.
+        
+        Args:
+            page_indices: 불러올 페이지 목록 (우선순위 순)
+            visible: 화면에 보이는 페이지 범위
+            
+        Returns:
+            dict: 페이지 인덱스 → 지금 표시할 이미지
+        """
+        zoom = self.scrollable_pdf_view.zoom_level * 1.5
+        
+        # 스크롤로 지나간 페이지의 대기 작업은 버림
+        self.pdf_manager.render_pool.cancel_pending()
+        
+        images = {}
+        for page_index in page_indices:
+            image = self.pdf_manager.get_cached_page_image(page_index, zoom)
+            if image is None:
+                self.pdf_manager.request_page_render(page_index, zoom)
+                if page_index in visible:
+                    image = self.pdf_manager.get_preview_image(page_index)
+            if image is not None:
+                images[page_index] = image
+        return images
+
+    def on_continuous_page_changed(self, page_index: int) -> None:
+        """연속 스크롤 보기에서 화면 중앙 페이지가 바뀌었을 때 호출되는 슬롯"""
+        self.current_page_index = page_index
+        self.show_page_status()
+
+    def toggle_continuous_mode(self, checked: bool) -> None:
+        """연속 스크롤 보기 켜기/끄기"""
+        self.continuous_mode = checked
+        if checked:
+            self.page_view_stack.setCurrentWidget(self.continuous_view)
+            self.pdf_view.clear()
+        else:
+            self.page_view_stack.setCurrentWidget(self.scrollable_pdf_view)
+            self.continuous_view.clear()
+        
+        if self.pdf_manager.doc is None:
+            return
+        
+        page_index = self.current_page_index
+        self.update_page_view()
+        if checked:
+            self.continuous_view.scroll_to_page(page_index)
+
+    def on_page_rendered(self, key: tuple) -> None:
+        """백그라운드 렌더링 완료 시 현재 페이지면 전체 해상도 이미지로 교체"""
+        zoom = self.scrollable_pdf_view.zoom_level * 1.5
+        if self.continuous_mode:
+            page_index = key[1]
+            if key == self.pdf_manager.render_key(page_index, zoom):
+                image = self.pdf_manager.get_cached_page_image(page_index, zoom)
+                if image is not None:
+                    self.continuous_view.replace_image(page_index, image)
+            return
+        
+        if key != self.pdf_manager.render_key(self.current_page_index, zoom):
+            return
+        
+        image = self.pdf_manager.get_cached_page_image(self.current_page_index, zoom)
+        if image is not None:
+            self.pdf_view.replace_image(self.current_page_index, image)
+
+    def on_page_render_failed(self, key: tuple) -> None:
+        """백그라운드 렌더링 실패 시 현재 페이지면 직접 렌더링"""
+        zoom = self.scrollable_pdf_view.zoom_level * 1.5
+        if self.continuous_mode:
+            page_index = key[1]
+            if key == self.pdf_manager.render_key(page_index, zoom):
+                image = self.pdf_manager.get_page_image(page_index, zoom)
+                if image is not None:
+                    self.continuous_view.replace_image(page_index, image)
+            return
+        
+        if key != self.pdf_manager.render_key(self.current_page_index, zoom):
+            return
+        
+        image = self.pdf_manager.get_page_image(self.current_page_index, zoom)
+        if image is not None:
+            self.pdf_view.replace_image(self.current_page_index, image)
+
+    def show_page_status(self) -> None:
+        """상태바에 현재 페이지 및 확대 비율 표시"""
+        self.thumbnail_panel.set_current_page(self.current_page_index)
+        total_pages = self.pdf_manager.get_page_count()
+        zoom_percent = int(self.scrollable_pdf_view.zoom_level * 100)
+        self.statusBar().showMessage(
+            f"페이지: {self.current_page_index + 1} / {total_pages} | "
+            f"확대: {zoom_percent}% | "
+            f"(Ctrl + 드래그: 마스킹, Ctrl + 휠: 확대/축소)"
+        )
+
     def zoom_in(self) -> None:
         """PDF 확대"""
         self.scrollable_pdf_view.zoom_in()
@@ -371,7 +711,8 @@ class MainWindow(QMainWindow):
             "<b>← / PageUp</b> : 이전 페이지<br><br>"
             "<b>[마스킹]</b><br>"
             "<b>Ctrl+드래그</b> : 마스킹 영역 선택<br>"
-            "<b>Del</b> : 선택된 마스킹 삭제<br><br>"
+            "<b>Del</b> : 선택된 마스킹 삭제<br>"
+            "<b>Ctrl+Shift+F</b> : 자동 마스킹 제안<br><br>"
             "<b>[기타]</b><br>"
             "<b>Ctrl+Q</b> : 프로그램 종료"
         )
@@ -384,7 +725,9 @@ class MainWindow(QMainWindow):
             "2. 좌측 '마스킹 리스트' 패널은 생성된 마스킹 정보를 보여줍니다.\n"
             "3. 중앙 PDF 화면에서 Ctrl 키를 누른 상태로 마우스를 드래그하여 마스킹 영역을 선택합니다.\n"
             "4. 우측 'PDF 파일 목록'에서 다른 PDF를 더블클릭하여 전환할 수 있습니다.\n"
-            "5. 마스킹이 완료되면 Ctrl+S로 마스킹을 적용하고 저장합니다.\n"
+            "5. 도구 메뉴의 '자동 마스킹 제안'(Ctrl+Shift+F)으로 주민등록번호, 전화번호, 계좌번호, 이메일을 찾아 "
+            "마스킹 리스트에 추가할 수 있습니다. 필요 없는 제안은 Del로 삭제합니다.\n"
+            "6. 마스킹이 완료되면 Ctrl+S로 마스킹을 적용하고 저장합니다.\n"
         )
         QMessageBox.information(self, "사용 방법", usage_text)
 
@@ -458,25 +801,22 @@ class MainWindow(QMainWindow):
             # 저장된 마스킹 데이터 로드 시도
             success, loaded_masks, msg = self.mask_data_manager.load_masks(file_path)
             if success and loaded_masks:
-                self.masks = loaded_masks
+                self.masks = MaskStore(loaded_masks)
                 # 테이블에 마스킹 데이터 표시
                 for mask in self.masks:
-                    row = self.mask_list.rowCount()
-                    self.mask_list.insertRow(row)
-                    
-                    # 페이지 컬럼
-                    page_item = QTableWidgetItem(str(mask.page_index + 1))
-                    page_item.setFlags(page_item.flags() & ~Qt.ItemFlag.ItemIsEditable)
-                    self.mask_list.setItem(row, 0, page_item)
-                    
-                    # 메모 컬럼
-                    note_item = QTableWidgetItem(mask.note)
-                    self.mask_list.setItem(row, 1, note_item)
-                    
-                    page_item.setData(Qt.ItemDataRole.UserRole, row)
+                    self.add_mask_table_row(mask)
                 
                 print(f"마스킹 데이터 로드: {msg}")
             
+            # 저장하지 않은 작업이 남아 있으면 복구
+            recovered = self.autosave_journal.open(file_path, list(self.masks))
+            if recovered is not None:
+                self.clear_masks()
+                self.masks = MaskStore(recovered)
+                for mask in self.masks:
+                    self.add_mask_table_row(mask)
+                print(f"자동 저장 복구: {len(recovered)}개 마스킹")
+            
             # 첫 페이지로 이동
             self.current_page_index = 0
             
@@ -486,10 +826,20 @@ class MainWindow(QMainWindow):
             # 페이지 표시
             self.update_page_view()
             
+            # 페이지 썸네일 목록 (디스크에 캐시된 썸네일은 바로 표시)
+            self.thumbnail_panel.set_page_count(
+                self.pdf_manager.get_page_count(),
+                self.pdf_manager.thumbnails.get_thumbnail
+            )
+            self.thumbnail_panel.set_current_page(self.current_page_index)
+            
             # 창 제목에 파일명 표시
             filename = os.path.basename(file_path)
             self.setWindowTitle(f"PDF Mask - {filename}")
             
+            if recovered is not None:
+                self.statusBar().showMessage(f"저장하지 않은 마스킹 작업을 복구했습니다. ({len(recovered)}개 마스킹)")
+            
             # 로그 기록
             self.log_manager.log_pdf_open(file_path)
             print(f"PDF 로드 성공: {file_path}")
@@ -545,6 +895,7 @@ class MainWindow(QMainWindow):
             if 0 <= row < len(self.masks):
                 # 데이터에서 삭제
                 del self.masks[row]
+                self.autosave_journal.record_delete(row)
                 # 테이블에서 삭제
                 self.mask_list.removeRow(row)
         
@@ -559,13 +910,20 @@ class MainWindow(QMainWindow):
         status = "활성화" if self.backup_enabled else "비활성화"
         print(f"PDF 백업 {status}")
 
-    def get_result_path(self) -> tuple[bool, str]:
-        """마스킹 결과물 저장 경로 생성"""
-        if self.pdf_manager.file_path is None:
+    def set_save_profile(self, profile: str) -> None:
+        """결과 파일 저장 프로필 변경"""
+        self.save_profile = profile
+        self.statusBar().showMessage(f"결과 파일 저장 방식: {SAVE_PROFILE_DESCRIPTIONS[profile]}")
+        print(f"저장 프로필 변경: {profile}")
+
+    def get_result_path(self, pdf_path: Optional[str] = None) -> tuple[bool, str]:
+        """마스킹 결과물 저장 경로 생성 (pdf_path가 없으면 현재 파일)"""
+        if pdf_path is None:
+            pdf_path = self.pdf_manager.file_path
+        if pdf_path is None:
             return False, "저장할 PDF 파일이 없습니다."
         
         try:
-            pdf_path = self.pdf_manager.file_path
             pdf_filename = os.path.basename(pdf_path)
             
             # 실행 환경에 따른 기본 경로 결정
@@ -592,11 +950,12 @@ class MainWindow(QMainWindow):
             # 결과 파일 경로
             result_path = os.path.join(result_dir, pdf_filename)
             
-            # 이미 같은 이름의 파일이 있으면 번호 추가
-            if os.path.exists(result_path):
+            # 이미 같은 이름의 파일이 있거나 저장 대기 중이면 번호 추가
+            reserved = self.save_queue.reserved_paths()
+            if os.path.exists(result_path) or result_path in reserved:
                 name, ext = os.path.splitext(pdf_filename)
                 counter = 1
-                while os.path.exists(result_path):
+                while os.path.exists(result_path) or result_path in reserved:
                     result_path = os.path.join(result_dir, f"{name}_{counter}{ext}")
                     counter += 1
             
@@ -606,85 +965,26 @@ class MainWindow(QMainWindow):
             return False, f"결과 경로 생성 실패: {str(e)}"
 
     def export_masks_to_excel(self) -> None:
-        """마스킹 작업 내역을 엑셀 파일로 저장"""
-        if not self.masks:
-            QMessageBox.information(self, "알림", "저장할 마스킹 내역이 없습니다.")
-            return
-
-        if self.pdf_manager.file_path is None:
-            QMessageBox.warning(self, "경고", "열려 있는 PDF 파일 정보가 없습니다.")
-            return
-
-        # openpyxl 지연 로딩
-        try:
-            from openpyxl import Workbook, load_workbook
-        except ImportError:
-            QMessageBox.critical(
-                self,
-                "오류",
-                "openpyxl 패키지가 설치되어 있지 않습니다.\n\n"
-                "다음 명령으로 설치 후 다시 시도해주세요.\n"
-                "pip install openpyxl"
-            )
-            return
-
-        try:
-            # 저장 경로 및 파일명 구성
-            pdf_path = self.pdf_manager.file_path
-            
-            # 실행 환경에 따른 기본 경로 결정
-            if getattr(sys, 'frozen', False):
-                # PyInstaller로 패키징된 exe 실행 시
-                app_dir = os.path.dirname(sys.executable)
-                xls_dir = os.path.join(app_dir, "xlsx_result")
-            else:
-                # 개발 환경 (소스 코드 실행 시)
-                current_file = os.path.abspath(__file__)
-                ui_dir = os.path.dirname(current_file)
-                pdfmask_dir = os.path.dirname(ui_dir)
-                src_dir = os.path.dirname(pdfmask_dir)
-                project_root = os.path.dirname(src_dir)
-                xls_dir = os.path.join(project_root, "xlsx_result")
-            
-            # xlsx_result 폴더가 없으면 생성
-            os.makedirs(xls_dir, exist_ok=True)
-            
-            today_str = datetime.now().strftime("%Y%m%d")
-            filename = f"마스킹_작업내역_{today_str}.xlsx"
-            save_path = os.path.join(xls_dir, filename)
-
-            # 워크북 생성 또는 로드
-            if os.path.exists(save_path):
-                wb = load_workbook(save_path)
-                ws = wb.active
-            else:
-                wb = Workbook()
-                ws = wb.active
-                ws.title = "마스킹 내역"
-                # 헤더 행
-                ws.append(["작업일시", "PDF 파일명", "페이지", "마스킹 영역 좌표", "메모"])
-
-            pdf_name = os.path.basename(pdf_path)
-
-            # 마스크 데이터 추가
-            for mask in self.masks:
-                timestamp = datetime.now().strftime("%Y-%m-%d %H:%M:%S")
-                page_number = mask.page_index + 1
-                rect = mask.rect
-                coords = f"({rect.x0:.2f}, {rect.y0:.2f}, {rect.x1:.2f}, {rect.y1:.2f})"
-                note = mask.note or ""
-
-                ws.append([timestamp, pdf_name, page_number, coords, note])
-
-            # 파일 저장
-            wb.save(save_path)
-            print(f"엑셀 파일 저장 완료: {save_path}")
+        """마스킹 작업 내역을 엑셀 파일로 저장 (현재 파일의 마스킹을 추가한 뒤 오늘 작업 내역 전체를 변환)"""
+        if self.masks and self.pdf_manager.file_path is not None:
+            success, msg = self.excel_manager.append_masks(self.pdf_manager.file_path, self.masks)
+            if not success:
+                QMessageBox.critical(
+                    self,
+                    "저장 오류",
+                    f"작업 내역 저장 중 오류가 발생했습니다.\n\n{msg}"
+                )
+                return
 
-        except Exception as e:
+        success, msg = self.excel_manager.export_workbook()
+        if success:
+            print(f"엑셀 파일 저장 완료: {msg}")
+            self.statusBar().showMessage(f"엑셀 파일 저장 완료: {msg}")
+        else:
             QMessageBox.critical(
                 self,
                 "저장 오류",
-                f"엑셀 파일 저장 중 오류가 발생했습니다.\n\n{str(e)}"
+                f"엑셀 파일 저장 중 오류가 발생했습니다.\n\n{msg}"
             )
 
     def open_pdf(self) -> None:
@@ -701,6 +1001,7 @@ class MainWindow(QMainWindow):
             
             # 단일 파일 열기
             self.pdf_files = [file_path]
+            self.pdf_file_rows = {file_path: 0}
             self.current_pdf_index = 0
             
             # PDF 파일 리스트 업데이트
@@ -744,14 +1045,18 @@ class MainWindow(QMainWindow):
         # 파일명으로 정렬
         pdf_files.sort()
         
+        # 이전 폴더의 템플릿 적용 중단
+        self.cancel_template_replay()
+        
         # PDF 파일 목록 저장
         self.pdf_files = pdf_files
+        self.pdf_file_rows = {path: row for row, path in enumerate(pdf_files)}
         self.current_folder_path = folder_path
-        self.completed_files = []
+        self.completed_files = set()
         
         # 이전 진행상황 확인
-        success, progress_data, msg = self.progress_manager.load_progress()
-        if success and progress_data and progress_data.get('folder_path') == folder_path:
+        success, progress_data, msg = self.progress_manager.load_progress(folder_path)
+        if success and progress_data:
             # 이전에 작업하던 폴더와 동일한 경우
             reply = QMessageBox.question(
                 self,
@@ -766,20 +1071,15 @@ class MainWindow(QMainWindow):
             
             if reply == QMessageBox.StandardButton.Yes:
                 # 진행상황 복구
-                self.completed_files = progress_data.get('completed_files', [])
+                self.completed_files = progress_data.get('completed_files', set())
                 start_index = progress_data.get('current_index', 0)
                 
                 print(f"진행상황 복구: {len(self.completed_files)}개 파일 완료")
         
-        # 리스트 위젯 업데이트
+        # 리스트 위젯 업데이트 (저장 작업 상태는 한 번만 모아서 조회)
         self.pdf_file_list.clear()
-        for file_path in pdf_files:
-            filename = os.path.basename(file_path)
-            item_text = filename
-            # 완료된 파일 표시
-            if filename in self.completed_files:
-                item_text = f"✓ {filename}"
-            self.pdf_file_list.addItem(item_text)
+        latest_jobs = {job.pdf_path: job for job in self.save_queue.jobs()}
+        self.pdf_file_list.addItems([self.get_file_list_text(file_path, latest_jobs) for file_path in pdf_files])
         
         # 로그 기록
         self.log_manager.log_folder_open(folder_path, len(pdf_files))
@@ -787,7 +1087,7 @@ class MainWindow(QMainWindow):
         
         # 첫 번째 PDF 또는 복구된 위치에서 시작
         if pdf_files:
-            if success and progress_data and progress_data.get('folder_path') == folder_path:
+            if success and progress_data:
                 start_index = progress_data.get('current_index', 0)
                 if 0 <= start_index < len(pdf_files):
                     self.load_pdf_from_list(start_index)
@@ -796,11 +1096,349 @@ class MainWindow(QMainWindow):
             else:
                 self.load_pdf_from_list(0)
 
+    def get_file_list_text(self, file_path: str, latest_jobs: Optional[dict[str, SaveJob]] = None) -> str:
+        """PDF 파일 목록에 표시할 텍스트 (완료/저장 상태 포함)
+        
+        Args:
+            file_path: PDF 파일 경로
+            latest_jobs: 파일 경로별 가장 최근에 등록한 저장 작업 (없으면 저장 큐에서 조회)
+        """
+        filename = os.path.basename(file_path)
+        
+        # 가장 최근에 등록한 저장 작업의 상태 표시
+        if latest_jobs is None:
+            latest_jobs = {job.pdf_path: job for job in self.save_queue.jobs() if job.pdf_path == file_path}
+        job = latest_jobs.get(file_path)
+        if job is not None:
+            if job.status == SAVE_FAILED:
+                return f"⚠ {filename} (저장 실패)"
+            if job.status == SAVE_NEEDS_PASSWORD:
+                return f"⚠ {filename} (암호 입력 필요)"
+            if job.status == SAVE_TRANSFERRING:
+                return f"… {filename} (전송 중)"
+            return f"… {filename} (저장 중)"
+        
+        # 완료된 파일 표시
+        if filename in self.completed_files:
+            return f"✓ {filename}"
+        return filename
+
+    def update_file_list_item(self, file_path: str) -> None:
+        """PDF 파일 목록에서 해당 파일의 표시 갱신"""
+        row = self.pdf_file_rows.get(file_path)
+        if row is None:
+            return
+        item = self.pdf_file_list.item(row)
+        if item is not None:
+            item.setText(self.get_file_list_text(file_path))
+
+    def on_save_job_status_changed(self, job: SaveJob) -> None:
+        """백그라운드 저장 작업의 상태가 바뀌었을 때 호출되는 슬롯"""
+        if job.status == SAVE_DONE:
+            # 최종 위치에 복사, 검증된 뒤에만 저장 위치 안내
+            print(f"마스킹 저장 완료: {job.output_path}")
+            self.statusBar().showMessage(f"저장 완료: {job.output_path} ({len(job.masks)}개 마스킹)")
+            
+            # 완료 파일 목록에 추가
+            filename = os.path.basename(job.pdf_path)
+            if job.pdf_path in self.pdf_file_rows and filename not in self.completed_files:
+                self.completed_files.add(filename)
+            
+                # 진행상황 저장 (완료한 파일 한 줄만 추가)
+                if self.current_folder_path:
+                    self.progress_manager.mark_completed(
+                        self.current_folder_path,
+                        filename,
+                        self.current_pdf_index,
+                        len(self.pdf_files)
+                    )
+        
+        elif job.status == SAVE_FAILED:
+            print(f"저장 실패: {job.message}")
+            self.statusBar().showMessage(f"저장 실패: {os.path.basename(job.output_path)}")
+            QMessageBox.critical(
+                self,
+                "저장 오류",
+                f"{os.path.basename(job.pdf_path)} 저장 중 오류가 발생했습니다.\n\n{job.message}\n\n"
+                f"마스킹 데이터는 보관되어 있으며, 파일 목록에서 마우스 오른쪽 버튼을 눌러 "
+                f"다시 시도하거나 취소할 수 있습니다."
+            )
+        
+        self.update_file_list_item(job.pdf_path)
+
+    def save_masks_as_template(self) -> None:
+        """현재 파일의 마스킹을 이름을 붙여 템플릿으로 저장"""
+        if self.pdf_manager.doc is None or not self.masks:
+            QMessageBox.information(self, "알림", "템플릿으로 저장할 마스킹이 없습니다.")
+            return
+        
+        name, ok = QInputDialog.getText(self, "템플릿 저장", "템플릿 이름:")
+        name = name.strip()
+        if not ok or not name:
+            return
+        
+        template = MaskTemplate(
+            name=name,
+            page_sizes=list(self.pdf_manager.get_page_sizes()),
+            masks=[MaskEntry(mask.page_index, fitz.Rect(mask.rect), mask.note) for mask in self.masks]
+        )
+        success, msg = self.template_manager.save_template(template)
+        if success:
+            self.statusBar().showMessage(f"템플릿 저장 완료: {name} ({len(template.masks)}개 마스킹)")
+        else:
+            QMessageBox.critical(self, "템플릿 저장 오류", msg)
+
+    def apply_template_to_remaining(self) -> None:
+        """선택한 템플릿을 폴더의 남은 파일에 백그라운드로 적용"""
+        success, templates, msg = self.template_manager.load_templates()
+        if not success:
+            QMessageBox.critical(self, "템플릿 오류", msg)
+            return
+        if not templates:
+            QMessageBox.information(self, "알림", "저장된 템플릿이 없습니다.\n도구 메뉴에서 먼저 템플릿을 저장해주세요.")
+            return
+        
+        # 남은 파일: 현재 파일 이후, 완료/저장 중이 아닌 파일
+        # (저장된 마스킹 데이터가 있는 파일은 작업자가 계산한 문서 지문으로 TemplateReplay에서 건너뜀)
+        busy = {job.pdf_path for job in self.save_queue.jobs()}
+        remaining = [
+            path for path in self.pdf_files[self.current_pdf_index + 1:]
+            if os.path.basename(path) not in self.completed_files and path not in busy
+        ]
+        if not remaining:
+            QMessageBox.information(self, "알림", "템플릿을 적용할 남은 파일이 없습니다.")
+            return
+        
+        name, ok = QInputDialog.getItem(
+            self, "템플릿 적용", f"남은 파일 {len(remaining)}개에 적용할 템플릿:", list(templates), 0, False
+        )
+        if not ok:
+            return
+        
+        self.cancel_template_replay()
+        self.template_results = {}
+        self.template_dialog = TemplatePreviewDialog(name, len(remaining), self)
+        self.template_dialog.fileActivated.connect(self.open_template_file)
+        self.template_dialog.saveAllRequested.connect(self.save_template_results)
+        self.template_dialog.show()
+        self.template_replay.start(templates[name], remaining)
+
+    def cancel_template_replay(self) -> None:
+        """진행 중인 템플릿 적용 중단 및 미리보기 닫기"""
+        self.template_replay.cancel()
+        self.template_results = {}
+        if self.template_dialog is not None:
+            self.template_dialog.close()
+            self.template_dialog = None
+
+    def on_template_file_ready(self, file_path: str, masks: list, skipped: int, preview) -> None:
+        """
+        템플릿을 적용한 파일이 준비되었을 때 호출되는 슬롯
+        
+        마스킹 데이터는 TemplateReplay가 저장 스레드에서 저장했으므로 파일을 열면
+        템플릿 마스킹이 바로 표시됩니다.
+        """
+        if masks:
+            self.template_results[file_path] = masks
+        if self.template_dialog is not None:
+            self.template_dialog.add_file(file_path, len(masks), skipped, preview)
+
+    def on_template_file_skipped(self, file_path: str) -> None:
+        """저장된 마스킹 데이터가 있어 템플릿을 적용하지 않은 파일 표시"""
+        if self.template_dialog is not None:
+            self.template_dialog.add_skipped(file_path)
+
+    def on_template_file_failed(self, file_path: str) -> None:
+        """템플릿을 적용하지 못한 파일 표시"""
+        if self.template_dialog is not None:
+            self.template_dialog.add_failure(file_path)
+
+    def on_template_finished(self, ready: int) -> None:
+        """템플릿 적용 완료 표시"""
+        self.statusBar().showMessage(
+            f"템플릿 적용 완료: {len(self.template_results)}개 파일 (미리보기에서 확인 후 저장)"
+        )
+        if self.template_dialog is not None:
+            self.template_dialog.set_finished(len(self.template_results))
+
+    def open_template_file(self, file_path: str) -> None:
+        """미리보기에서 선택한 파일을 열어 확인"""
+        if file_path in self.pdf_file_rows:
+            self.load_pdf_from_list(self.pdf_file_rows[file_path])
+
+    def save_template_results(self) -> None:
+        """
+        템플릿을 적용한 파일을 모두 백그라운드 저장 큐에 등록
+        
+        미리보기에서 파일을 열어 마스킹을 고친 뒤 저장(Ctrl+S)하지 않았을 수 있으므로,
+        템플릿 적용 결과 대신 파일마다 저장된 마스킹 데이터와 자동 저장 저널을 다시 읽어 저장합니다.
+        """
+        # 확인 중 이미 저장했거나 저장 대기 중인 파일, 지금 열려 있는 파일은 제외
+        busy = {job.pdf_path for job in self.save_queue.jobs()}
+        candidates = [
+            path for path in self.template_results
+            if path not in busy and os.path.basename(path) not in self.completed_files
+        ]
+        open_file = self.pdf_manager.file_path if self.pdf_manager.file_path in candidates else None
+        
+        targets = []
+        edited = []
+        emptied = []
+        for path in candidates:
+            if path == open_file:
+                continue
+            success, masks, msg = self.mask_data_manager.load_masks(path)
+            if not success:
+                print(f"템플릿 적용 파일 마스킹 로드 오류: {msg}")
+                continue
+            recovered = self.autosave_journal.recover(path)
+            if recovered is not None:
+                masks = recovered
+                edited.append(path)
+            if masks:
+                targets.append((path, masks))
+            else:
+                emptied.append(path)
+        
+        notes = ""
+        if edited:
+            notes += f"\n\n저장하지 않은 수정 내용이 있는 {len(edited)}개 파일은 수정한 마스킹으로 저장합니다."
+        if emptied:
+            notes += f"\n마스킹을 모두 삭제한 {len(emptied)}개 파일은 저장하지 않습니다."
+        if open_file is not None:
+            notes += f"\n지금 열려 있는 {os.path.basename(open_file)}은(는) 제외됩니다. (Ctrl+S로 저장)"
+        
+        if not targets:
+            QMessageBox.information(self, "알림", "저장할 파일이 없습니다." + notes)
+            return
+        
+        reply = QMessageBox.question(
+            self,
+            "모두 저장",
+            f"템플릿을 적용한 {len(targets)}개 파일을 저장하시겠습니까?\n(원본 파일은 유지되고 마스킹본이 별도 저장됩니다)"
+            + notes,
+            QMessageBox.StandardButton.Yes | QMessageBox.StandardButton.No,
+            QMessageBox.StandardButton.Yes
+        )
+        if reply != QMessageBox.StandardButton.Yes:
+            return
+        
+        for path, masks in targets:
+            path_success, result_path = self.get_result_path(path)
+            if not path_success:
+                print(f"결과 경로 생성 실패: {result_path}")
+                continue
+            if path in edited:
+                # 저널의 수정 내용을 마스킹 데이터로 저장하고 저널 삭제 (Ctrl+S와 같음)
+                json_success, json_msg = self.mask_data_manager.save_masks(path, masks)
+                if not json_success:
+                    print(f"마스킹 데이터 저장 오류: {json_msg}")
+                self.autosave_journal.discard_file(path)
+            self.save_queue.enqueue(path, result_path, masks, "", self.save_profile)
+            self.update_file_list_item(path)
+        
+        self.statusBar().showMessage(f"템플릿 적용 파일 {len(targets)}개 저장 중")
+        if self.template_dialog is not None:
+            self.template_dialog.close()
+            self.template_dialog = None
+
     def on_pdf_list_double_clicked(self, item) -> None:
         """PDF 파일 리스트에서 더블클릭 이벤트"""
         row = self.pdf_file_list.row(item)
         self.load_pdf_from_list(row)
 
+    def show_pdf_list_context_menu(self, pos) -> None:
+        """PDF 파일 리스트의 오른쪽 클릭 메뉴 (저장하지 못한 작업 다시 시도/취소)"""
+        item = self.pdf_file_list.itemAt(pos)
+        if item is None:
+            return
+        row = self.pdf_file_list.row(item)
+        if not 0 <= row < len(self.pdf_files):
+            return
+        file_path = self.pdf_files[row]
+        
+        # 목록에 표시된 (가장 최근에 등록한) 작업
+        job = None
+        for queued_job in self.save_queue.jobs():
+            if queued_job.pdf_path == file_path:
+                job = queued_job
+        if job is None or job.status not in (SAVE_FAILED, SAVE_NEEDS_PASSWORD):
+            return
+        
+        menu = QMenu(self)
+        retry_action = menu.addAction("저장 다시 시도")
+        dismiss_action = menu.addAction("저장 작업 취소")
+        chosen = menu.exec(self.pdf_file_list.viewport().mapToGlobal(pos))
+        
+        if chosen is retry_action:
+            self.retry_save_job(job)
+        elif chosen is dismiss_action:
+            self.dismiss_save_job(job)
+
+    def retry_save_job(self, job: SaveJob) -> None:
+        """저장하지 못한 작업 다시 시도 (암호가 필요하면 암호 입력)"""
+        password = None
+        if job.status == SAVE_NEEDS_PASSWORD:
+            error_msg = ""
+            while True:
+                dialog = PasswordInputDialog(job.pdf_path, error_msg, self)
+                if not dialog.exec():
+                    return
+                password = dialog.get_password()
+                if self.check_pdf_password(job.pdf_path, password):
+                    break
+                error_msg = "입력한 암호가 올바르지 않습니다."
+        
+        if self.save_queue.retry_job(job.job_id, password):
+            self.statusBar().showMessage(f"저장 다시 시도: {os.path.basename(job.pdf_path)}")
+        self.update_file_list_item(job.pdf_path)
+
+    def dismiss_save_job(self, job: SaveJob) -> None:
+        """저장하지 못한 작업 취소 (결과 파일은 만들지 않음)"""
+        reply = QMessageBox.question(
+            self,
+            "저장 작업 취소",
+            f"{os.path.basename(job.pdf_path)}의 저장 작업을 취소하시겠습니까?\n\n"
+            f"결과 파일은 만들어지지 않으며, 마스킹 데이터는 그대로 남아 있습니다.",
+            QMessageBox.StandardButton.Yes | QMessageBox.StandardButton.No,
+            QMessageBox.StandardButton.No
+        )
+        if reply != QMessageBox.StandardButton.Yes:
+            return
+        
+        if self.save_queue.dismiss_job(job.job_id):
+            self.statusBar().showMessage(f"저장 작업 취소: {os.path.basename(job.pdf_path)}")
+        self.update_file_list_item(job.pdf_path)
+
+    def check_pdf_password(self, file_path: str, password: str) -> bool:
+        """PDF 암호가 맞는지 확인"""
+        try:
+            with fitz.open(file_path) as doc:
+                return not doc.needs_pass or bool(doc.authenticate(password))
+        except Exception as e:
+            print(f"PDF 암호 확인 오류: {str(e)}")
+            return False
+
+    def show_current_page(self) -> None:
+        """현재 페이지 표시 (연속 스크롤 보기에서는 해당 페이지로 스크롤)"""
+        if self.continuous_mode:
+            self.continuous_view.scroll_to_page(self.current_page_index)
+        else:
+            self.request_page_view()
+
+    def go_to_page(self, page_index: int) -> None:
+        """지정된 페이지로 이동"""
+        if self.pdf_manager.doc is None:
+            return
+        
+        if 0 <= page_index < self.pdf_manager.get_page_count() and page_index != self.current_page_index:
+            self.current_page_index = page_index
+            self.show_current_page()
+
+    def on_thumbnails_ready(self, page_indices: list[int]) -> None:
+        """백그라운드에서 썸네일이 만들어졌을 때 호출되는 슬롯"""
+        self.thumbnail_panel.update_thumbnails(page_indices, self.pdf_manager.thumbnails.get_thumbnail)
+
     def go_next_page(self) -> None:
         """다음 페이지로 이동"""
         if self.pdf_manager.doc is None:
@@ -809,7 +1447,7 @@ class MainWindow(QMainWindow):
         page_count = self.pdf_manager.get_page_count()
         if self.current_page_index < page_count - 1:
             self.current_page_index += 1
-            self.update_page_view()
+            self.show_current_page()
             print(f"다음 페이지: {self.current_page_index + 1}")
 
     def go_prev_page(self) -> None:
@@ -819,7 +1457,7 @@ class MainWindow(QMainWindow):
         
         if self.current_page_index > 0:
             self.current_page_index -= 1
-            self.update_page_view()
+            self.show_current_page()
             print(f"이전 페이지: {self.current_page_index + 1}")
 
     def save_masks(self) -> None:
@@ -850,55 +1488,34 @@ class MainWindow(QMainWindow):
                         )
                         return
                     
-                    # 마스킹 데이터 JSON 저장
+                    # 마스킹 데이터 저장
                     json_success, json_msg = self.mask_data_manager.save_masks(
                         self.pdf_manager.file_path,
                         self.masks
                     )
                     if json_success:
-                        print(f"마스킹 데이터 JSON 저장: {json_msg}")
-                    
-                    # 마스킹 적용 및 결과 파일로 저장 (원본 유지)
-                    self.pdf_manager.apply_masks_and_save(self.masks, result_path)
+                        print(f"마스킹 데이터 저장: {json_msg}")
                     
-                    # 마스킹 내역 엑셀 저장
-                    self.export_masks_to_excel()
-                    
-                    # 로그 기록
-                    self.log_manager.log_mask_save(
+                    # 마스킹 적용, 결과 파일 저장, 엑셀 기록은 백그라운드에서 진행
+                    job = self.save_queue.enqueue(
                         self.pdf_manager.file_path,
-                        self.masks
+                        result_path,
+                        self.masks,
+                        self.pdf_manager.password,
+                        self.save_profile
                     )
-                    
-                    # 성공 메시지
-                    QMessageBox.information(
-                        self,
-                        "저장 완료",
-                        f"총 {len(self.masks)}개의 마스킹이 적용되었습니다.\n\n저장 위치: {result_path}"
+                    self.statusBar().showMessage(
+                        f"저장 중: {os.path.basename(job.output_path)} ({len(job.masks)}개 마스킹)"
                     )
                     
-                    # 마스킹 데이터 초기화
+                    # 저장했으므로 자동 저장 기록 삭제 후 마스킹 데이터 초기화
+                    self.autosave_journal.discard()
                     self.clear_masks()
                     
-                    # 완료 파일 목록에 추가
-                    if self.pdf_manager.file_path:
-                        filename = os.path.basename(self.pdf_manager.file_path)
-                        if filename not in self.completed_files:
-                            self.completed_files.append(filename)
-                    
-                    # 진행상황 저장
-                    if self.current_folder_path and self.pdf_files:
-                        self.progress_manager.save_progress(
-                            self.current_folder_path,
-                            self.pdf_files,
-                            self.completed_files,
-                            self.current_pdf_index
-                        )
-                    
                     # 다음 파일로 이동할지 확인
                     self.move_to_next_pdf_if_available()
                     
-                    print("마스킹 저장 완료")
+                    print("마스킹 저장 요청 완료")
                     
                 except Exception as e:
                     QMessageBox.critical(
@@ -943,26 +1560,31 @@ class MainWindow(QMainWindow):
             # 마지막 파일인 경우
             if self.current_pdf_index == len(self.pdf_files) - 1:
                 # 진행상황 삭제
-                self.progress_manager.clear_progress()
+                self.progress_manager.clear_progress(self.current_folder_path)
                 
-                QMessageBox.information(
-                    self,
-                    "완료",
-                    "폴더의 모든 PDF 파일 작업이 완료되었습니다."
-                )
+                message = "폴더의 모든 PDF 파일 작업이 완료되었습니다."
+                pending = self.save_queue.pending_count()
+                if pending:
+                    message += f"\n\n저장 중인 파일 {pending}개는 백그라운드에서 계속 저장됩니다."
+                QMessageBox.information(self, "완료", message)
             
             # 화면 초기화
             self.clear_pdf_view()
     
     def clear_pdf_view(self) -> None:
         """PDF 화면 초기화"""
-        # PDF 문서 닫기
+        # PDF 문서 닫기 (저장하지 않은 작업은 자동 저장 기록에 남김)
+        self.autosave_journal.close()
         self.pdf_manager.close()
         
         # 화면 초기화
         self.pdf_view.clear()
+        self.continuous_view.clear()
+        self.thumbnail_panel.clear()
         self.pdf_file_list.clear()
+        self.cancel_template_replay()
         self.pdf_files.clear()
+        self.pdf_file_rows = {}
         self.current_pdf_index = -1
         self.current_folder_path = ""
         
@@ -977,25 +1599,64 @@ class MainWindow(QMainWindow):
         # 새로운 MaskEntry 생성
         mask_entry = MaskEntry(page_index=page_index, rect=rect, note="")
         self.masks.append(mask_entry)
+        self.autosave_journal.record_add(mask_entry)
         
         print(f"Mask created on page {page_index + 1}: {rect}")
         
         # 테이블에 행 추가
+        self.add_mask_table_row(mask_entry)
+
+    def add_mask_table_row(self, mask: MaskEntry) -> None:
+        """마스킹 리스트 테이블 끝에 행 추가"""
         row = self.mask_list.rowCount()
         self.mask_list.insertRow(row)
         
         # 페이지 컬럼
-        page_item = QTableWidgetItem(str(page_index + 1))
+        page_item = QTableWidgetItem(str(mask.page_index + 1))
         page_item.setFlags(page_item.flags() & ~Qt.ItemFlag.ItemIsEditable)
         self.mask_list.setItem(row, 0, page_item)
         
         # 메모 컬럼
-        note_item = QTableWidgetItem("")
+        note_item = QTableWidgetItem(mask.note)
         self.mask_list.setItem(row, 1, note_item)
         
         # UserRole에 mask 인덱스 저장
         page_item.setData(Qt.ItemDataRole.UserRole, row)
 
+    def suggest_masks(self) -> None:
+        """현재 문서에서 자동 마스킹 제안 검색 시작"""
+        if not self.pdf_manager.start_suggestions():
+            return
+        self.statusBar().showMessage("자동 마스킹 제안 검색 중...")
+
+    def on_suggestions_found(self, page_index: int, masks: list[MaskEntry]) -> None:
+        """페이지에서 마스킹 후보를 찾았을 때 호출되는 슬롯 (이미 가려진 영역은 제외)"""
+        added = 0
+        for mask in masks:
+            if any(existing.rect.contains(mask.rect) for existing in self.masks.query(page_index, mask.rect)):
+                continue
+            self.masks.append(mask)
+            self.autosave_journal.record_add(mask)
+            self.add_mask_table_row(mask)
+            added += 1
+        
+        if added:
+            # 제안된 페이지가 화면에 있으면 마스킹 표시 갱신
+            if self.continuous_mode:
+                self.continuous_view.refresh_masks(page_index)
+            elif self.pdf_view.page_index() == page_index:
+                self.pdf_view.set_masks(self.masks)
+
+    def on_suggestion_progress(self, searched: int, total: int) -> None:
+        """자동 마스킹 제안 검색 진행 표시"""
+        self.statusBar().showMessage(f"자동 마스킹 제안 검색 중... ({searched} / {total} 페이지)")
+
+    def on_suggestions_finished(self, found: int) -> None:
+        """자동 마스킹 제안 검색 완료 표시"""
+        self.statusBar().showMessage(
+            f"자동 마스킹 제안 완료: {found}개 후보 (마스킹 리스트에서 확인 후 필요 없는 항목은 Del로 삭제)"
+        )
+
     def on_mask_item_changed(self, item: QTableWidgetItem) -> None:
         """마스킹 리스트 아이템이 변경되었을 때 호출되는 슬롯"""
         row = item.row()
@@ -1005,7 +1666,10 @@ class MainWindow(QMainWindow):
         if col == 1:
             if 0 <= row < len(self.masks):
                 new_note = item.text()
+                if self.masks[row].note == new_note:
+                    return
                 self.masks[row].note = new_note
+                self.autosave_journal.record_note(row, new_note)
                 print(f"Mask [{row}] note updated: '{new_note}'")
 
     def _get_icon_path(self) -> Optional[str]:
@@ -1032,10 +1696,36 @@ class MainWindow(QMainWindow):
 
     def closeEvent(self, event) -> None:
         """윈도우 종료 이벤트"""
+        # 저장 중인 파일이 있으면 완료를 기다릴지 확인
+        pending = self.save_queue.pending_count()
+        if pending:
+            reply = QMessageBox.question(
+                self,
+                "저장 중",
+                f"저장 중인 파일이 {pending}개 있습니다.\n완료될 때까지 기다린 후 종료하시겠습니까?\n\n"
+                f"(기다리지 않으면 다음 실행 시 이어서 저장합니다)",
+                QMessageBox.StandardButton.Yes | QMessageBox.StandardButton.No | QMessageBox.StandardButton.Cancel,
+                QMessageBox.StandardButton.Yes
+            )
+            if reply == QMessageBox.StandardButton.Cancel:
+                event.ignore()
+                return
+            if reply == QMessageBox.StandardButton.Yes:
+                self.statusBar().showMessage(f"저장 완료를 기다리는 중... ({pending}개)")
+                self.save_queue.wait_until_idle()
+        
         # 로그 기록
         self.log_manager.log_app_end()
         
-        # PDF 문서 닫기
-        self.pdf_manager.close()
+        # PDF 문서 닫기 및 렌더링/저장 작업자 종료
+        self.save_queue.shutdown()
+        self.autosave_journal.shutdown()
+        self.template_replay.shutdown()
+        
+        # 오늘 작업 내역을 엑셀 파일로 변환 (저장이 모두 끝난 뒤)
+        if os.path.exists(self.excel_manager.get_audit_path()):
+            success, msg = self.excel_manager.export_workbook()
+            print(f"엑셀 파일 저장 {'완료' if success else '오류'}: {msg}")
+        self.pdf_manager.shutdown()
         event.accept()
 
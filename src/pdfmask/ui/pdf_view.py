@@ -2,12 +2,22 @@
 PDF 뷰어 UI 컴포넌트
 """
 
-from typing import Optional
+from typing import Callable, Optional
 from PyQt6.QtWidgets import QWidget, QScrollArea
-from PyQt6.QtCore import Qt, QPoint, QRect, pyqtSignal
-from PyQt6.QtGui import QPixmap, QPainter, QColor, QPen, QBrush
+from PyQt6.QtCore import Qt, QPoint, QRect, QSize, pyqtSignal
+from PyQt6.QtGui import QImage, QPainter, QColor, QPen, QBrush
 import fitz
 
+from ..core.mask_store import MaskStore
+from ..managers.pdf_manager import TILE_SIZE
+
+
+# 화면 밖으로 미리 불러올 타일 여백 (픽셀)
+TILE_MARGIN = 256
+
+# 마스킹 테두리 두께 (픽셀) - 다시 그릴 영역은 이만큼 넓힘
+MASK_PEN_WIDTH = 2
+
 
 class PdfPageView(QWidget):
     """
@@ -29,11 +39,19 @@ class PdfPageView(QWidget):
         super().__init__(parent)
         
         # 페이지 표시 관련
-        self._pixmap: Optional[QPixmap] = None
+        self._image: Optional[QImage] = None
         self._page_index: int = 0
         self._page_width: float = 0.0
         self._page_height: float = 0.0
         
+        # 렌더링된 페이지의 화면 크기 (좌표 변환 기준)
+        self._display_size: QSize = QSize()
+        
+        # 타일 렌더링 관련 (고배율)
+        self._tiled: bool = False
+        self._tiles: dict[tuple[int, int], tuple[QRect, QImage]] = {}
+        self._tile_source: Optional[Callable[[int, int], Optional[QImage]]] = None
+        
         # 마스킹 드래그 관련
         self._start_pos: Optional[QPoint] = None
         self._current_rect: Optional[QRect] = None
@@ -42,6 +60,9 @@ class PdfPageView(QWidget):
         # 저장된 마스킹 영역들 (화면 좌표)
         self._saved_masks: list[QRect] = []
         
+        # 저장된 마스킹을 미리 그려 둔 오버레이 (TILE_SIZE 단위, 마스킹이 없는 칸은 None)
+        self._mask_overlay: dict[tuple[int, int], Optional[QImage]] = {}
+        
         # 줌 레벨
         self._zoom_level: float = 1.0  # 100%
         
@@ -52,42 +73,180 @@ class PdfPageView(QWidget):
     def set_page(
         self, 
         page_index: int, 
-        pixmap: QPixmap, 
+        image: QImage, 
         page_width: float, 
         page_height: float,
-        masks: list = None
+        masks: Optional[MaskStore] = None,
+        display_size: Optional[QSize] = None
     ) -> None:
         """
         페이지 정보 설정
         
         Args:
             page_index: 페이지 인덱스 (0-based)
-            pixmap: 렌더링된 페이지 이미지
+            image: 렌더링된 페이지 이미지
             page_width: PDF 페이지 실제 너비
             page_height: PDF 페이지 실제 높이
-            masks: 저장된 마스킹 정보 리스트
+            masks: 저장된 마스킹 저장소
+            display_size: 화면 표시 크기 (None이면 image 크기,
+                저해상도 미리보기는 이 크기로 확대하여 표시)
         """
         self._page_index = page_index
-        self._pixmap = pixmap
+        self._image = image
         self._page_width = page_width
         self._page_height = page_height
+        if display_size is not None:
+            self._display_size = QSize(display_size)
+        else:
+            self._display_size = image.size() if image is not None else QSize()
+        
+        # 타일 모드 해제
+        self._tiled = False
+        self._tiles = {}
+        self._tile_source = None
         
         # 저장된 마스킹 영역 표시를 위해 변환
-        self._saved_masks = []
-        if masks and pixmap:
-            for mask in masks:
-                if mask.page_index == page_index:
-                    # PDF 좌표를 화면 좌표로 변환
-                    screen_rect = self._convert_to_screen_rect(mask.rect)
-                    if screen_rect:
-                        self._saved_masks.append(screen_rect)
-        
-        # 위젯 크기를 pixmap 크기에 맞춤
-        if pixmap is not None:
-            self.setFixedSize(pixmap.size())
+        self._update_saved_masks(masks)
+        
+        # 위젯 크기를 표시 크기에 맞춤
+        if not self._display_size.isEmpty():
+            self.setFixedSize(self._display_size)
         
         self.update()
     
+    def set_masks(self, masks: Optional[MaskStore]) -> None:
+        """
+        표시할 마스킹 영역만 갱신
+        
+        Args:
+            masks: 저장된 마스킹 저장소
+        """
+        self._update_saved_masks(masks)
+        self.update()
+    
+    def page_index(self) -> int:
+        """표시 중인 페이지 인덱스"""
+        return self._page_index
+    
+    def has_image(self) -> bool:
+        """페이지 이미지(또는 타일)가 표시되고 있는지 여부"""
+        return self._image is not None or self._tiled
+    
+    def replace_image(self, page_index: int, image: QImage) -> None:
+        """
+        표시 중인 페이지 이미지만 교체 (미리보기 → 전체 해상도)
+        
+        표시 크기와 마스킹 영역, 드래그 상태는 그대로 유지되므로
+        교체 중에도 PDF 좌표 기준 마스킹이 정상 동작합니다.
+        
+        Args:
+            page_index: 페이지 인덱스 (0-based)
+            image: 새 페이지 이미지
+        """
+        if self._tiled or page_index != self._page_index or self._image is None:
+            return
+        
+        self._image = image
+        self.update()
+    
+    def rescale(self, display_size: QSize, masks: Optional[MaskStore] = None) -> bool:
+        """
+        현재 이미지를 새 표시 크기로 늘리거나 줄여서 임시로 표시
+        
+        확대/축소가 이어지는 동안 다시 렌더링하지 않고 사용하며,
+        마스킹 영역은 새 크기에 맞게 다시 변환됩니다.
+        
+        Args:
+            display_size: 새 화면 표시 크기
+            masks: 저장된 마스킹 저장소
+            
+        Returns:
+            bool: 적용 여부 (표시 중인 이미지가 없거나 타일 모드면 False)
+        """
+        if self._tiled or self._image is None:
+            return False
+        
+        self.set_page(
+            self._page_index, self._image, self._page_width, self._page_height,
+            masks, display_size
+        )
+        return True
+    
+    def set_tiled_page(
+        self,
+        page_index: int,
+        display_size: QSize,
+        page_width: float,
+        page_height: float,
+        tile_source: Callable[[int, int], Optional[QImage]],
+        masks: Optional[MaskStore] = None
+    ) -> None:
+        """
+        페이지를 타일 단위로 표시하도록 설정
+        
+        전체 페이지를 렌더링하지 않고, load_visible_tiles()로 전달된
+        화면 영역과 겹치는 타일만 tile_source에서 받아 표시합니다.
+        
+        Args:
+            page_index: 페이지 인덱스 (0-based)
+            display_size: 렌더링된 페이지의 전체 픽셀 크기
+            page_width: PDF 페이지 실제 너비
+            page_height: PDF 페이지 실제 높이
+            tile_source: (열, 행)을 받아 타일 이미지를 반환하는 함수
+            masks: 저장된 마스킹 저장소
+        """
+        self._page_index = page_index
+        self._image = None
+        self._page_width = page_width
+        self._page_height = page_height
+        self._display_size = QSize(display_size)
+        
+        self._tiled = True
+        self._tiles = {}
+        self._tile_source = tile_source
+        
+        self._update_saved_masks(masks)
+        
+        self.setFixedSize(display_size)
+        self.update()
+    
+    def load_visible_tiles(self, visible_rect: QRect) -> None:
+        """
+        화면에 보이는 영역(+여백)과 겹치는 타일만 불러오기
+        
+        영역을 벗어난 타일은 위젯에서 해제합니다 (렌더링 캐시에는 남아 있음).
+        
+        Args:
+            visible_rect: 위젯 좌표계 기준으로 보이는 영역
+        """
+        if not self._tiled or self._tile_source is None:
+            return
+        
+        bounds = QRect(QPoint(0, 0), self._display_size)
+        region = visible_rect.adjusted(
+            -TILE_MARGIN, -TILE_MARGIN, TILE_MARGIN, TILE_MARGIN
+        ).intersected(bounds)
+        if region.isEmpty():
+            return
+        
+        wanted: set[tuple[int, int]] = set()
+        for row in range(region.top() // TILE_SIZE, region.bottom() // TILE_SIZE + 1):
+            for col in range(region.left() // TILE_SIZE, region.right() // TILE_SIZE + 1):
+                wanted.add((col, row))
+        
+        # 영역 밖 타일 해제
+        for tile in [t for t in self._tiles if t not in wanted]:
+            del self._tiles[tile]
+        
+        # 새로 보이는 타일 불러오기
+        for col, row in sorted(wanted - self._tiles.keys(), key=lambda t: (t[1], t[0])):
+            image = self._tile_source(col, row)
+            if image is None:
+                continue
+            target = QRect(col * TILE_SIZE, row * TILE_SIZE, TILE_SIZE, TILE_SIZE).intersected(bounds)
+            self._tiles[(col, row)] = (target, image)
+            self.update(target)
+    
     def set_zoom_level(self, zoom: float) -> None:
         """
         줌 레벨 설정
@@ -99,11 +258,16 @@ class PdfPageView(QWidget):
     
     def clear(self) -> None:
         """화면 초기화"""
-        self._pixmap = None
+        self._image = None
         self._page_index = 0
         self._page_width = 0.0
         self._page_height = 0.0
+        self._display_size = QSize()
+        self._tiled = False
+        self._tiles = {}
+        self._tile_source = None
         self._saved_masks = []
+        self._mask_overlay = {}
         self._start_pos = None
         self._current_rect = None
         self._ctrl_pressed_during_drag = False
@@ -114,25 +278,35 @@ class PdfPageView(QWidget):
         """페이지 렌더링"""
         painter = QPainter(self)
         
-        # Pixmap 그리기
-        if self._pixmap is not None:
-            painter.drawPixmap(0, 0, self._pixmap)
+        # 이미지가 없는 자리 표시 페이지 (연속 스크롤 보기)
+        if self._image is None and not self._tiled and not self._display_size.isEmpty():
+            painter.fillRect(event.rect(), QColor(255, 255, 255))
         
-        # 저장된 마스킹 영역 그리기 (반투명 빨간색)
+        # 이미지 그리기 (미리보기는 표시 크기로 확대)
+        if self._image is not None:
+            if self._image.size() == self._display_size:
+                # 다시 그릴 영역만 복사
+                painter.drawImage(event.rect(), self._image, event.rect())
+            else:
+                painter.setRenderHint(QPainter.RenderHint.SmoothPixmapTransform)
+                painter.drawImage(QRect(QPoint(0, 0), self._display_size), self._image)
+        
+        # 타일 그리기 (아직 불러오지 않은 영역은 흰색)
+        if self._tiled:
+            painter.fillRect(event.rect(), QColor(255, 255, 255))
+            for target, image in self._tiles.values():
+                if target.intersects(event.rect()):
+                    painter.drawImage(target, image)
+        
+        # 저장된 마스킹 영역 그리기 (미리 그려 둔 오버레이 사용)
         if self._saved_masks:
-            brush = QBrush(QColor(255, 0, 0, 60))
-            painter.setBrush(brush)
-            pen = QPen(QColor(255, 0, 0), 2)
-            painter.setPen(pen)
-            
-            for rect in self._saved_masks:
-                painter.drawRect(rect)
+            self._draw_mask_overlay(painter, event.rect())
         
         # 드래그 중인 사각형 그리기 (반투명 파란색)
         if self._current_rect is not None:
             brush = QBrush(QColor(0, 120, 255, 80))
             painter.setBrush(brush)
-            pen = QPen(QColor(0, 120, 255), 2)
+            pen = QPen(QColor(0, 120, 255), MASK_PEN_WIDTH)
             painter.setPen(pen)
             
             painter.drawRect(self._current_rect)
@@ -156,10 +330,14 @@ class PdfPageView(QWidget):
             current_pos = event.pos()
             
             # QRect 생성 (좌상단, 우하단을 자동으로 정규화)
+            previous_rect = self._current_rect
             self._current_rect = QRect(self._start_pos, current_pos).normalized()
             
-            # 화면 업데이트
-            self.update()
+            # 이전 사각형과 새 사각형을 합친 영역만 다시 그리기
+            dirty = self._dirty_rect(self._current_rect)
+            if previous_rect is not None:
+                dirty = dirty.united(self._dirty_rect(previous_rect))
+            self.update(dirty)
     
     def mouseReleaseEvent(self, event) -> None:
         """마우스 클릭 종료"""
@@ -176,6 +354,10 @@ class PdfPageView(QWidget):
                 
                 # 저장된 마스킹 목록에 추가 (화면에 즉시 표시)
                 self._saved_masks.append(self._current_rect)
+                self._invalidate_mask_overlay(self._current_rect)
+            
+            # 드래그 사각형이 있던 영역만 다시 그리기
+            dirty = self._dirty_rect(self._current_rect)
             
             # 상태 초기화
             self._start_pos = None
@@ -183,7 +365,7 @@ class PdfPageView(QWidget):
             self._ctrl_pressed_during_drag = False
             
             # 화면 업데이트
-            self.update()
+            self.update(dirty)
 
     def wheelEvent(self, event) -> None:
         """마우스 휠 이벤트 (Ctrl + 휠로 줌)"""
@@ -204,6 +386,92 @@ class PdfPageView(QWidget):
             # Ctrl이 아닐 때는 기본 스크롤 동작 유지
             super().wheelEvent(event)
     
+    def _update_saved_masks(self, masks: Optional[MaskStore]) -> None:
+        """
+        현재 페이지의 마스킹 정보를 화면 좌표로 변환하여 보관
+        
+        Args:
+            masks: 저장된 마스킹 저장소
+        """
+        self._saved_masks = []
+        self._mask_overlay = {}
+        if not masks:
+            return
+        
+        for mask in masks.for_page(self._page_index):
+            # PDF 좌표를 화면 좌표로 변환
+            screen_rect = self._convert_to_screen_rect(mask.rect)
+            if screen_rect:
+                self._saved_masks.append(screen_rect)
+    
+    def _dirty_rect(self, rect: QRect) -> QRect:
+        """사각형을 다시 그릴 때 테두리까지 포함하는 영역"""
+        return rect.adjusted(-MASK_PEN_WIDTH, -MASK_PEN_WIDTH, MASK_PEN_WIDTH, MASK_PEN_WIDTH)
+    
+    def _invalidate_mask_overlay(self, rect: QRect) -> None:
+        """
+        영역과 겹치는 마스킹 오버레이 칸 제거 (다음 그리기 때 다시 생성)
+        
+        Args:
+            rect: 바뀐 마스킹 영역 (화면 좌표)
+        """
+        dirty = self._dirty_rect(rect)
+        for row in range(dirty.top() // TILE_SIZE, dirty.bottom() // TILE_SIZE + 1):
+            for col in range(dirty.left() // TILE_SIZE, dirty.right() // TILE_SIZE + 1):
+                self._mask_overlay.pop((col, row), None)
+    
+    def _draw_mask_overlay(self, painter: QPainter, region: QRect) -> None:
+        """
+        다시 그릴 영역과 겹치는 마스킹 오버레이 칸 그리기
+        
+        각 칸은 처음 그려질 때 한 번만 만들어지고, 마스킹이 바뀌면
+        해당 칸만 다시 만들어집니다.
+        
+        Args:
+            painter: 위젯 페인터
+            region: 다시 그릴 영역
+        """
+        region = region.intersected(QRect(QPoint(0, 0), self.size()))
+        if region.isEmpty():
+            return
+        
+        for row in range(region.top() // TILE_SIZE, region.bottom() // TILE_SIZE + 1):
+            for col in range(region.left() // TILE_SIZE, region.right() // TILE_SIZE + 1):
+                if (col, row) not in self._mask_overlay:
+                    self._mask_overlay[(col, row)] = self._build_mask_overlay(col, row)
+                overlay = self._mask_overlay[(col, row)]
+                if overlay is not None:
+                    painter.drawImage(col * TILE_SIZE, row * TILE_SIZE, overlay)
+    
+    def _build_mask_overlay(self, col: int, row: int) -> Optional[QImage]:
+        """
+        오버레이 한 칸에 겹치는 마스킹을 미리 그린 이미지 생성
+        
+        Args:
+            col: 칸의 열
+            row: 칸의 행
+            
+        Returns:
+            Optional[QImage]: 오버레이 이미지 (겹치는 마스킹이 없으면 None)
+        """
+        bounds = QRect(col * TILE_SIZE, row * TILE_SIZE, TILE_SIZE, TILE_SIZE)
+        rects = [rect for rect in self._saved_masks if self._dirty_rect(rect).intersects(bounds)]
+        if not rects:
+            return None
+        
+        overlay = QImage(TILE_SIZE, TILE_SIZE, QImage.Format.Format_ARGB32_Premultiplied)
+        overlay.fill(Qt.GlobalColor.transparent)
+        
+        # 반투명 빨간색
+        painter = QPainter(overlay)
+        painter.translate(-bounds.left(), -bounds.top())
+        painter.setBrush(QBrush(QColor(255, 0, 0, 60)))
+        painter.setPen(QPen(QColor(255, 0, 0), MASK_PEN_WIDTH))
+        for rect in rects:
+            painter.drawRect(rect)
+        painter.end()
+        return overlay
+    
     def _convert_to_pdf_rect(self, screen_rect: QRect) -> Optional[fitz.Rect]:
         """
         화면 좌표를 PDF 페이지 좌표로 변환
@@ -214,12 +482,12 @@ class PdfPageView(QWidget):
         Returns:
             Optional[fitz.Rect]: PDF 좌표 사각형 또는 None
         """
-        if self._pixmap is None or self._page_width == 0 or self._page_height == 0:
+        if self._display_size.isEmpty() or self._page_width == 0 or self._page_height == 0:
             return None
         
         # 스케일 비율 계산
-        scale_x = self._page_width / self._pixmap.width()
-        scale_y = self._page_height / self._pixmap.height()
+        scale_x = self._page_width / self._display_size.width()
+        scale_y = self._page_height / self._display_size.height()
         
         # 화면 좌표를 PDF 좌표로 변환
         x0 = screen_rect.left() * scale_x
@@ -240,12 +508,12 @@ class PdfPageView(QWidget):
         Returns:
             Optional[QRect]: 화면 좌표 사각형 또는 None
         """
-        if self._pixmap is None or self._page_width == 0 or self._page_height == 0:
+        if self._display_size.isEmpty() or self._page_width == 0 or self._page_height == 0:
             return None
         
         # 스케일 비율 계산
-        scale_x = self._pixmap.width() / self._page_width
-        scale_y = self._pixmap.height() / self._page_height
+        scale_x = self._display_size.width() / self._page_width
+        scale_y = self._display_size.height() / self._page_height
         
         # PDF 좌표를 화면 좌표로 변환
         x0 = int(pdf_rect.x0 * scale_x)
@@ -295,21 +563,46 @@ class ScrollablePdfView(QScrollArea):
         self.min_zoom: float = 0.5  # 최소 50%
         self.max_zoom: float = 2.0  # 최대 200%
         
+        # 스크롤/크기 변경 시 보이는 타일 갱신
+        for scrollbar in (self.horizontalScrollBar(), self.verticalScrollBar()):
+            scrollbar.valueChanged.connect(self.update_visible_tiles)
+            scrollbar.rangeChanged.connect(self.update_visible_tiles)
+    
+    def visible_page_rect(self) -> QRect:
+        """
+        PdfPageView 좌표계 기준으로 현재 화면에 보이는 영역 반환
+        
+        Returns:
+            QRect: 보이는 영역
+        """
+        viewport_rect = self.viewport().rect()
+        top_left = self.pdf_view.mapFrom(self.viewport(), viewport_rect.topLeft())
+        return QRect(top_left, viewport_rect.size()).intersected(self.pdf_view.rect())
+    
+    def update_visible_tiles(self, *args) -> None:
+        """보이는 영역의 타일 불러오기 (타일 모드에서만 동작)"""
+        self.pdf_view.load_visible_tiles(self.visible_page_rect())
+    
+    def resizeEvent(self, event) -> None:
+        """크기 변경 시 보이는 타일 갱신"""
+        super().resizeEvent(event)
+        self.update_visible_tiles()
+        
     def zoom_in(self) -> None:
         """줌 인 (10% 증가)"""
         if self.zoom_level < self.max_zoom:
             self.zoom_level = min(self.zoom_level + 0.1, self.max_zoom)
             main_window = self.window()
-            if main_window is not None and hasattr(main_window, 'update_page_view'):
-                main_window.update_page_view()
+            if main_window is not None and hasattr(main_window, 'request_page_view'):
+                main_window.request_page_view()
     
     def zoom_out(self) -> None:
         """줌 아웃 (10% 감소)"""
         if self.zoom_level > self.min_zoom:
             self.zoom_level = max(self.zoom_level - 0.1, self.min_zoom)
             main_window = self.window()
-            if main_window is not None and hasattr(main_window, 'update_page_view'):
-                main_window.update_page_view()
+            if main_window is not None and hasattr(main_window, 'request_page_view'):
+                main_window.request_page_view()
 
     def wheelEvent(self, event) -> None:
         """마우스 휠 이벤트 (Ctrl + 휠로 줌)"""
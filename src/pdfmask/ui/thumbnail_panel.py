@@ -0,0 +1,184 @@
+"""
+페이지 썸네일 목록 UI 컴포넌트
+"""
+
+from typing import Callable, Iterable, Optional, Set
+
+from PyQt6.QtWidgets import QWidget, QListWidget, QListWidgetItem, QListView
+from PyQt6.QtCore import Qt, QSize, QTimer, pyqtSignal
+from PyQt6.QtGui import QIcon, QImage, QPixmap
+
+
+# 목록에 표시할 썸네일 크기
+THUMBNAIL_ICON_SIZE = QSize(120, 160)
+
+# 화면에 보이는 항목 앞뒤로 미리 아이콘을 채울 항목 수
+THUMBNAIL_PRELOAD_ITEMS = 4
+
+
+class ThumbnailPanel(QListWidget):
+    """
+    페이지 썸네일을 세로로 나열하는 목록
+
+    화면에 보이는 항목(앞뒤 THUMBNAIL_PRELOAD_ITEMS개 포함)에만 아이콘을 채우고,
+    스크롤하여 벗어난 항목의 아이콘은 비워 페이지 수와 관계없이 메모리를 일정하게 씁니다.
+    썸네일이 아직 없는 페이지는 페이지 번호만 표시하고,
+    썸네일이 준비되면 update_thumbnails()로 아이콘을 채웁니다.
+    """
+
+    # 시그널: 사용자가 페이지를 선택함 (page_index)
+    pageSelected = pyqtSignal(int)
+
+    def __init__(self, parent: Optional[QWidget] = None) -> None:
+        """
+        초기화
+
+        Args:
+            parent: 부모 위젯
+        """
+        super().__init__(parent)
+
+        # 아이콘을 위에서 아래로 한 줄로 배치
+        self.setViewMode(QListView.ViewMode.IconMode)
+        self.setFlow(QListView.Flow.TopToBottom)
+        self.setWrapping(False)
+        self.setMovement(QListView.Movement.Static)
+        self.setResizeMode(QListView.ResizeMode.Adjust)
+        self.setIconSize(THUMBNAIL_ICON_SIZE)
+        self.setSpacing(6)
+        self.setUniformItemSizes(True)
+
+        # 썸네일을 가져오는 함수와 아이콘을 채운 항목
+        self._thumbnail_getter: Optional[Callable[[int], Optional[QImage]]] = None
+        self._loaded_rows: Set[int] = set()
+
+        self.currentRowChanged.connect(self._on_current_row_changed)
+        self.verticalScrollBar().valueChanged.connect(self._load_visible_thumbnails)
+
+    def set_page_count(
+        self,
+        page_count: int,
+        thumbnail_getter: Callable[[int], Optional[QImage]]
+    ) -> None:
+        """
+        페이지 목록 초기화
+
+        Args:
+            page_count: 전체 페이지 수
+            thumbnail_getter: 페이지 인덱스로 썸네일을 반환하는 함수 (없으면 None)
+        """
+        self.blockSignals(True)
+        self.clear()
+        self._thumbnail_getter = thumbnail_getter
+        self._loaded_rows = set()
+        # 아이콘 유무와 관계없이 항목 크기를 고정 (아이콘을 비워도 배치가 바뀌지 않도록)
+        item_size = QSize(
+            THUMBNAIL_ICON_SIZE.width() + 8,
+            THUMBNAIL_ICON_SIZE.height() + self.fontMetrics().height() + 8
+        )
+        for page_index in range(page_count):
+            item = QListWidgetItem(str(page_index + 1))
+            item.setTextAlignment(Qt.AlignmentFlag.AlignHCenter)
+            item.setSizeHint(item_size)
+            self.addItem(item)
+        self.blockSignals(False)
+
+        # 항목 배치가 끝난 뒤 보이는 항목을 계산
+        QTimer.singleShot(0, self._load_visible_thumbnails)
+
+    def update_thumbnails(
+        self,
+        page_indices: Iterable[int],
+        thumbnail_getter: Callable[[int], Optional[QImage]]
+    ) -> None:
+        """
+        준비된 썸네일을 아이콘으로 표시 (화면 근처의 항목만)
+
+        Args:
+            page_indices: 갱신할 페이지 인덱스 목록
+            thumbnail_getter: 페이지 인덱스로 썸네일을 반환하는 함수 (없으면 None)
+        """
+        self._thumbnail_getter = thumbnail_getter
+        first, last = self._visible_range()
+        for page_index in page_indices:
+            if first <= page_index <= last:
+                self._set_thumbnail(page_index)
+
+    def set_current_page(self, page_index: int) -> None:
+        """
+        현재 페이지 표시 (pageSelected 시그널은 발생하지 않음)
+
+        Args:
+            page_index: 페이지 인덱스 (0-based)
+        """
+        if self.currentRow() == page_index:
+            return
+        self.blockSignals(True)
+        self.setCurrentRow(page_index)
+        self.blockSignals(False)
+        if self.currentItem() is not None:
+            self.scrollToItem(self.currentItem())
+
+    def clear(self) -> None:
+        """목록과 썸네일 정보 비우기"""
+        super().clear()
+        self._thumbnail_getter = None
+        self._loaded_rows = set()
+
+    def resizeEvent(self, event) -> None:
+        """크기가 바뀌면 새로 보이는 항목의 아이콘 채우기"""
+        super().resizeEvent(event)
+        self._load_visible_thumbnails()
+
+    def _visible_range(self) -> tuple[int, int]:
+        """아이콘을 채울 항목 범위 (화면에 보이는 항목 앞뒤 포함, 항목이 없으면 (0, -1))"""
+        count = self.count()
+        if count == 0:
+            return 0, -1
+
+        # 항목 크기가 모두 같으므로 첫 항목의 위치와 항목 간격으로 계산
+        top = self.visualItemRect(self.item(0)).top()
+        if count > 1:
+            step = self.visualItemRect(self.item(1)).top() - top
+        else:
+            step = self.visualItemRect(self.item(0)).height()
+        if step <= 0:
+            return 0, min(count - 1, THUMBNAIL_PRELOAD_ITEMS)
+        first = max(0, -top // step)
+        last = (self.viewport().height() - top) // step
+
+        return (
+            max(0, first - THUMBNAIL_PRELOAD_ITEMS),
+            min(count - 1, last + THUMBNAIL_PRELOAD_ITEMS),
+        )
+
+    def _load_visible_thumbnails(self) -> None:
+        """화면 근처 항목의 아이콘을 채우고, 벗어난 항목의 아이콘은 비움"""
+        if self._thumbnail_getter is None:
+            return
+
+        first, last = self._visible_range()
+        for row in [row for row in self._loaded_rows if not first <= row <= last]:
+            item = self.item(row)
+            if item is not None:
+                item.setIcon(QIcon())
+            self._loaded_rows.discard(row)
+
+        for row in range(first, last + 1):
+            if row not in self._loaded_rows:
+                self._set_thumbnail(row)
+
+    def _set_thumbnail(self, row: int) -> None:
+        """항목에 썸네일 아이콘 표시 (썸네일이 준비되지 않았으면 그대로 둠)"""
+        item = self.item(row)
+        if item is None or self._thumbnail_getter is None:
+            return
+        image = self._thumbnail_getter(row)
+        if image is not None:
+            item.setIcon(QIcon(QPixmap.fromImage(image)))
+            self._loaded_rows.add(row)
+
+    def _on_current_row_changed(self, row: int) -> None:
+        """목록에서 페이지를 선택했을 때 호출되는 슬롯"""
+        if row >= 0:
+            self.pageSelected.emit(row)